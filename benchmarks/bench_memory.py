@@ -0,0 +1,52 @@
+"""Measure the memory held by a parsed 50k-node schema.
+
+Run with `python benchmarks/bench_memory.py`.
+"""
+
+import gc
+import tracemalloc
+
+from schematools.jsonschema import JSONSchemaParser
+
+
+def catalog_schema(streams: int = 10_000) -> dict:
+    """Object schema of `streams` objects with four leaf properties each."""
+    return {
+        "type": "object",
+        "properties": {
+            f"stream_{i}": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string", "maxLength": 255},
+                    "created_at": {"type": "string", "format": "date-time"},
+                    "active": {"type": "boolean"},
+                },
+            }
+            for i in range(streams)
+        },
+    }
+
+
+def count_nodes(jsontype) -> int:
+    """Count the nodes of a parsed schema."""
+    properties = getattr(jsontype, "properties", None) or {}
+    return 1 + sum(count_nodes(child) for child in properties.values())
+
+
+def main() -> None:
+    jsonschema = catalog_schema()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    parsed = JSONSchemaParser.parse(jsonschema, copy=False)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    nodes = count_nodes(parsed)
+    print(f"{nodes} nodes: {size / 1024 / 1024:.2f} MiB, {size / nodes:.0f} bytes/node")
+
+
+if __name__ == "__main__":
+    main()
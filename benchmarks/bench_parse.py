@@ -0,0 +1,75 @@
+"""Benchmark JSONSchemaParser.parse on wide and deep schemas.
+
+The parser is timed with and without its single up-front copy of the input,
+and against `parse_with_deepcopy`, a reference copy of the parse functions
+from before they stopped deep-copying each node.
+
+Run with `python benchmarks/bench_parse.py`.
+"""
+
+import timeit
+import typing as t
+from copy import deepcopy
+
+from generators import deep_schema, wide_schema
+
+from schematools.jsonschema import (
+    ArrayType,
+    BaseJSONType,
+    JSONSchemaParser,
+    ObjectType,
+    StringType,
+)
+from schematools.jsonschema.parse import (
+    _handle_special_keys,
+    json_schema_root_type_map,
+)
+
+
+def parse_with_deepcopy(jsonschema: dict) -> BaseJSONType:
+    """Parse a schema the way the parser did before it stopped copying nodes.
+
+    Each object and array node deep-copies its whole subtree before parsing
+    its children, so a node n levels deep is copied n times.
+    """
+    jsontype = json_schema_root_type_map[jsonschema.get("type")]
+    if jsontype is ObjectType:
+        kwargs = dict(_handle_special_keys(deepcopy(jsonschema)))
+        properties = kwargs.get("properties")
+        if properties:
+            kwargs["properties"] = {
+                k: parse_with_deepcopy(v) for k, v in properties.items()
+            }
+        return ObjectType(**kwargs)
+    if jsontype is ArrayType:
+        kwargs = dict(_handle_special_keys(deepcopy(jsonschema)))
+        item_type = kwargs.pop("items", {})
+        if item_type:
+            kwargs["items"] = parse_with_deepcopy(item_type)
+        return ArrayType(**kwargs)
+    if jsontype is StringType:
+        return StringType.from_jsonschema(jsonschema)
+    return jsontype(**jsonschema)
+
+
+def bench(parse: t.Callable[[], t.Any], number: int = 10) -> float:
+    """Return the best time in seconds of a single parse."""
+    timer = timeit.Timer(parse)
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main() -> None:
+    for name, jsonschema in [("wide", wide_schema(5000)), ("deep", deep_schema())]:
+        assert parse_with_deepcopy(jsonschema) == JSONSchemaParser.parse(jsonschema)
+        per_node = bench(lambda: parse_with_deepcopy(jsonschema))
+        copied = bench(lambda: JSONSchemaParser.parse(jsonschema, copy=True))
+        copy_free = bench(lambda: JSONSchemaParser.parse(jsonschema, copy=False))
+        print(
+            f"{name:>5}: per-node-deepcopy={per_node * 1000:8.2f}ms "
+            f"copy={copied * 1000:8.2f}ms ({per_node / copied:5.2f}x) "
+            f"copy-free={copy_free * 1000:8.2f}ms ({per_node / copy_free:5.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark parse, flatten and Arrow conversion on wide and deep schemas.
+
+Run with `python benchmarks/bench_traverse.py`. The deepest schema is nested
+further than the recursion limit allows.
+"""
+
+import gc
+import sys
+import timeit
+
+from generators import deep_schema, wide_schema
+
+from schematools.apache_arrow import ArrowSchema
+from schematools.jsonschema import JSONSchemaParser, flatten
+
+
+def deep_object_schema(depth: int = 100, width: int = 5) -> dict:
+    """Objects nested `depth` levels deep, each with `width` leaf properties."""
+    schema = {"type": "string"}
+    for _ in range(depth):
+        properties = {f"field_{i}": {"type": "integer"} for i in range(width)}
+        schema = {"type": "object", "properties": {**properties, "child": schema}}
+    return schema
+
+
+def bench(func, number: int = 3) -> float:
+    """Return the best time in seconds of a single call, without GC pauses."""
+    timer = timeit.Timer(func)
+    gc.disable()
+    try:
+        return min(timer.repeat(repeat=15, number=number)) / number
+    finally:
+        gc.enable()
+
+
+def main() -> None:
+    schemas = [
+        ("wide", wide_schema(10000)),
+        ("deep", deep_schema(100)),
+        ("deep-objects", deep_object_schema(100)),
+        ("very-deep", deep_schema(sys.getrecursionlimit() * 2)),
+    ]
+    for name, jsonschema in schemas:
+        parsed = JSONSchemaParser.parse(jsonschema, copy=False)
+        timings = {
+            "parse": bench(lambda: JSONSchemaParser.parse(jsonschema, copy=False)),
+            "flatten": bench(lambda: flatten(parsed, max_depth=sys.maxsize)),
+            "arrow": bench(lambda: ArrowSchema.from_json_type(parsed)),
+        }
+        print(
+            f"{name:>12}: "
+            + " ".join(f"{op}={t * 1000:8.2f}ms" for op, t in timings.items())
+        )
+
+
+if __name__ == "__main__":
+    main()
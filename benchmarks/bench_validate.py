@@ -0,0 +1,93 @@
+"""Benchmark compiled record validators against the jsonschema package.
+
+Run with `python benchmarks/bench_validate.py`.
+"""
+
+import random
+import timeit
+
+import jsonschema
+
+from schematools.jsonschema import JSONSchemaParser, compile_validator
+
+SCHEMA = {
+    "type": "object",
+    "required": ["id", "email", "status"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "email": {"type": "string", "pattern": "^[^@]+@[^@]+$", "maxLength": 254},
+        "name": {"type": "string", "minLength": 1, "maxLength": 100},
+        "status": {"type": "string", "enum": ["active", "inactive", "banned"]},
+        "score": {"type": "number", "minimum": 0, "maximum": 100},
+        "verified": {"type": "boolean"},
+        "address": {
+            "type": "object",
+            "required": ["city"],
+            "properties": {
+                "street": {"type": "string"},
+                "city": {"type": "string"},
+                "zip": {"type": "string", "pattern": "^[0-9]{5}$"},
+            },
+        },
+        "tags": {
+            "type": "array",
+            "items": {"type": "string", "maxLength": 20},
+            "maxItems": 10,
+            "uniqueItems": True,
+        },
+    },
+}
+
+
+def records(count: int = 1000, seed: int = 0) -> list[dict]:
+    """Generate valid records for `SCHEMA`."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": i + 1,
+            "email": f"user{i}@example.com",
+            "name": f"User {i}",
+            "status": rng.choice(["active", "inactive", "banned"]),
+            "score": rng.uniform(0, 100),
+            "verified": rng.random() < 0.5,
+            "address": {
+                "street": f"{i} Main St",
+                "city": "Springfield",
+                "zip": "12345",
+            },
+            "tags": [f"tag{j}" for j in range(rng.randrange(5))],
+        }
+        for i in range(count)
+    ]
+
+
+def bench(validate, data: list[dict], number: int = 5) -> float:
+    """Return the best time in seconds to validate all records once."""
+
+    def run():
+        for record in data:
+            validate(record)
+
+    return min(timeit.Timer(run).repeat(repeat=5, number=number)) / number
+
+
+def main() -> None:
+    data = records()
+    compiled = bench(compile_validator(JSONSchemaParser.parse(SCHEMA)), data)
+    validator = jsonschema.validators.validator_for(SCHEMA)(SCHEMA)
+    results = {
+        "jsonschema.validate": bench(
+            lambda record: jsonschema.validate(record, SCHEMA), data, number=1
+        ),
+        "jsonschema validator": bench(validator.validate, data),
+        "compiled": compiled,
+    }
+    for name, seconds in results.items():
+        print(
+            f"{name:>21}: {seconds * 1e6 / len(data):8.2f}us/record "
+            f"speedup={seconds / compiled:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Deterministic synthetic schemas and records for the benchmarks.
+
+Every generator is a pure function of its arguments, so the same call gives
+the same schema or records on every run and every machine.
+"""
+
+import random
+import typing as t
+
+from schematools.jsonschema.types import string_format_map
+
+
+def wide_schema(width: int = 10_000) -> dict:
+    """Object schema with `width` properties, a third of them nested objects."""
+    return {
+        "type": "object",
+        "properties": {
+            f"property_{i}": (
+                {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "name": {"type": "string"},
+                    },
+                }
+                if i % 3 == 0
+                else {"type": "string", "description": f"Property {i}"}
+            )
+            for i in range(width)
+        },
+    }
+
+
+def deep_schema(depth: int = 100) -> dict:
+    """Schema nesting objects and arrays `depth` levels deep."""
+    schema = {"type": "string"}
+    for i in range(depth):
+        child = schema if i % 2 else {"type": "array", "items": schema}
+        schema = {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}, "child": child},
+        }
+    return schema
+
+
+def array_schema(width: int = 1_000, nesting: int = 3) -> dict:
+    """Object schema of `width` arrays, nested up to `nesting` levels deep.
+
+    The innermost items alternate between objects and scalars.
+    """
+    scalars = ["integer", "number", "string", "boolean"]
+    properties = {}
+    for i in range(width):
+        if i % 2:
+            items = {"type": scalars[i // 2 % len(scalars)]}
+        else:
+            items = {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "value": {"type": "number"},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                },
+            }
+        for _ in range(i % nesting + 1):
+            items = {"type": "array", "items": items}
+        properties[f"array_{i}"] = items
+    return {"type": "object", "properties": properties}
+
+
+def format_schema(copies: int = 100) -> dict:
+    """Object schema with `copies` string properties of every known format."""
+    return {
+        "type": "object",
+        "properties": {
+            f"{string_format.replace('-', '_')}_{i}": {
+                "type": "string",
+                "format": string_format,
+            }
+            for i in range(copies)
+            for string_format in string_format_map
+        },
+    }
+
+
+# Sample value of each string format, from a random generator and an index.
+format_values: t.Dict[str, t.Callable[[random.Random, int], str]] = {
+    "date-time": lambda rng, i: f"2024-01-{i % 28 + 1:02d}T12:{i % 60:02d}:00+00:00",
+    "time": lambda rng, i: f"{i % 24:02d}:{rng.randrange(60):02d}:00+00:00",
+    "date": lambda rng, i: f"2024-{i % 12 + 1:02d}-{rng.randrange(1, 29):02d}",
+    "duration": lambda rng, i: f"P{rng.randrange(1, 30)}DT{i % 24}H",
+    "email": lambda rng, i: f"user{i}@example.com",
+    "hostname": lambda rng, i: f"host-{i}.example.com",
+    "ipv4": lambda rng, i: ".".join(str(rng.randrange(256)) for _ in range(4)),
+    "ipv6": lambda rng, i: ":".join(f"{rng.randrange(65536):x}" for _ in range(8)),
+    "uuid": lambda rng, i: "{:08x}-{:04x}-4{:03x}-8{:03x}-{:012x}".format(
+        rng.getrandbits(32),
+        rng.getrandbits(16),
+        rng.getrandbits(12),
+        rng.getrandbits(12),
+        rng.getrandbits(48),
+    ),
+    "uri": lambda rng, i: f"https://example.com/items/{i}",
+    "uri-reference": lambda rng, i: f"/items/{i}#part",
+    "uri-template": lambda rng, i: "https://example.com/items/{id}",
+    "json-pointer": lambda rng, i: f"/items/{i}/name",
+    "relative-json-pointer": lambda rng, i: f"{i % 3}/name",
+    "regex": lambda rng, i: f"^item-[0-9]{{{i % 5 + 1}}}$",
+}
+
+
+def generate_value(
+    jsonschema: dict, rng: random.Random, index: int, arrays: int = 0
+) -> t.Any:
+    """Generate a value that matches one of the schemas above.
+
+    Only the outermost array of a value gets a random number of items; arrays
+    nested in it get one, so deep schemas give records of a bounded size.
+    """
+    json_type = jsonschema.get("type")
+    if json_type == "object":
+        return {
+            key: generate_value(value, rng, index, arrays)
+            for key, value in jsonschema.get("properties", {}).items()
+        }
+    if json_type == "array":
+        items = jsonschema.get("items", {"type": "string"})
+        count = rng.randrange(4) if arrays == 0 else 1
+        return [generate_value(items, rng, index, arrays + 1) for _ in range(count)]
+    if json_type == "string":
+        string_format = format_values.get(jsonschema.get("format"))
+        if string_format is not None:
+            return string_format(rng, index)
+        return f"value-{rng.randrange(1_000_000)}"
+    if json_type == "integer":
+        return rng.randrange(-1_000_000, 1_000_000)
+    if json_type == "number":
+        return rng.uniform(-1_000, 1_000)
+    if json_type == "boolean":
+        return rng.random() < 0.5
+    return None
+
+
+def generate_records(jsonschema: dict, count: int, seed: int = 0) -> t.List[dict]:
+    """Generate `count` records that match a schema generated above."""
+    rng = random.Random(seed)
+    return [generate_value(jsonschema, rng, i) for i in range(count)]
@@ -0,0 +1,166 @@
+"""Benchmark the parse, flatten and Arrow conversion hot paths.
+
+Run with `python benchmarks/run.py`. Each operation is timed on each synthetic
+schema from `generators.py`, then run once more under `tracemalloc` to measure
+its peak memory. Results are printed and can be saved as JSON with `--output`.
+Pass `--compare` with an earlier results file to see each time relative to
+that run, e.g. from another commit on the same machine.
+"""
+
+import argparse
+import datetime
+import fnmatch
+import json
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+import typing as t
+from pathlib import Path
+
+import pyarrow as pa
+from generators import (
+    array_schema,
+    deep_schema,
+    format_schema,
+    generate_records,
+    wide_schema,
+)
+
+from schematools.apache_arrow import ArrowSchema, iter_record_batches
+from schematools.jsonschema import JSONSchemaParser, RecordFlattener, flatten
+
+# schema factory and number of records to generate, per schema
+SCHEMAS: t.Dict[str, t.Tuple[t.Callable[[], dict], int]] = {
+    "wide": (lambda: wide_schema(10_000), 20),
+    "deep": (lambda: deep_schema(100), 1_000),
+    "array": (lambda: array_schema(1_000), 100),
+    "format": (lambda: format_schema(100), 1_000),
+}
+
+
+def schema_operations(jsonschema: dict) -> t.Dict[str, t.Callable[[], t.Any]]:
+    """Return the schema operations to benchmark, ready to call."""
+    parsed = JSONSchemaParser.parse(jsonschema)
+    return {
+        "parse": lambda: JSONSchemaParser.parse(jsonschema),
+        "parse_copy_free": lambda: JSONSchemaParser.parse(jsonschema, copy=False),
+        "flatten": lambda: flatten(parsed),
+        "arrow_schema": lambda: ArrowSchema.from_jsonschema(jsonschema),
+    }
+
+
+def record_operations(
+    jsonschema: dict, records: t.List[dict]
+) -> t.Dict[str, t.Callable[[], t.Any]]:
+    """Return the record operations to benchmark, ready to call."""
+    parsed = JSONSchemaParser.parse(jsonschema)
+    flattener = RecordFlattener(parsed)
+    return {
+        "flatten_records": lambda: list(flattener.flatten_records(records)),
+        "record_batches": lambda: list(iter_record_batches(parsed, records)),
+    }
+
+
+def measure(func: t.Callable[[], t.Any], repeat: int) -> dict:
+    """Time a function and measure the memory of one call.
+
+    `peak_bytes` is the peak of Python allocations during the call, which
+    does not include Arrow buffers; those held by the result are reported as
+    `arrow_bytes`.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    arrow_before = pa.total_allocated_bytes()
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    arrow_bytes = pa.total_allocated_bytes() - arrow_before
+    del result
+    return {
+        "best_s": min(times),
+        "mean_s": sum(times) / len(times),
+        "number": number,
+        "repeat": repeat,
+        "peak_bytes": peak,
+        "arrow_bytes": arrow_bytes,
+    }
+
+
+def metadata() -> dict:
+    """Describe the code and machine the benchmarks ran on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pyarrow": pa.__version__,
+        "platform": platform.platform(),
+        "record_counts": {name: count for name, (_, count) in SCHEMAS.items()},
+    }
+
+
+def main(argv: t.List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="save results as JSON")
+    parser.add_argument("--compare", type=Path, help="earlier results to compare")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats")
+    parser.add_argument(
+        "--only", default="*", help="glob of 'schema.operation' names to run"
+    )
+    args = parser.parse_args(argv)
+
+    previous = {}
+    if args.compare is not None:
+        previous = json.loads(args.compare.read_text())["results"]
+
+    results = {}
+
+    def run(key: str, func: t.Callable[[], t.Any]) -> None:
+        result = results[key] = measure(func, args.repeat)
+        line = (
+            f"{key:>26}: {result['best_s'] * 1000:10.3f}ms "
+            f"peak={result['peak_bytes'] / 1024 / 1024:8.2f}MiB "
+            f"arrow={result['arrow_bytes'] / 1024 / 1024:8.2f}MiB"
+        )
+        if key in previous:
+            line += f" vs previous={result['best_s'] / previous[key]['best_s']:5.2f}x"
+        print(line, flush=True)
+
+    for schema_name, (make_schema, record_count) in SCHEMAS.items():
+        jsonschema = make_schema()
+        for name, func in schema_operations(jsonschema).items():
+            if fnmatch.fnmatch(f"{schema_name}.{name}", args.only):
+                run(f"{schema_name}.{name}", func)
+        records = None
+        for name in ("flatten_records", "record_batches"):
+            if not fnmatch.fnmatch(f"{schema_name}.{name}", args.only):
+                continue
+            if records is None:
+                # generated only when needed, as they can take a lot of memory
+                records = generate_records(jsonschema, record_count)
+                funcs = record_operations(jsonschema, records)
+            run(f"{schema_name}.{name}", funcs[name])
+
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps({"metadata": metadata(), "results": results}, indent=2) + "\n"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
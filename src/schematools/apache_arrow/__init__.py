@@ -0,0 +1,86 @@
+"""Apache Arrow tools for Python.
+
+pyarrow is an optional dependency (`pip install py-schematools[arrow]`), so
+the tools are imported from their modules on first use rather than with this
+package, and importing it stays cheap.
+"""
+
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .aio import AsyncRecordBatchStage, StageMetrics, aiter_record_batches
+    from .builder import RecordBatchBuilder, iter_record_batches
+    from .catalog import convert_catalog
+    from .evolve import (
+        CastPlan,
+        SchemaEvolution,
+        SchemaEvolutionError,
+        evolve_schema,
+        unify_schemas,
+    )
+    from .flatten import flatten_table
+    from .reader import json_parse_options, json_read_options, open_jsonl, read_jsonl
+    from .schema import ArrowSchema, JSONToArrowTypeMap
+    from .shard import (
+        infer_jsonl,
+        iter_jsonl_shards,
+        read_jsonl_sharded,
+        split_jsonl,
+    )
+    from .sink import RecordBatchFileWriter, iter_jsonl, write_jsonl
+    from .validate import BatchValidationResult, validate_batch
+
+# Name of each tool, and the module it is imported from.
+_exports = {
+    "aiter_record_batches": ".aio",
+    "ArrowSchema": ".schema",
+    "AsyncRecordBatchStage": ".aio",
+    "BatchValidationResult": ".validate",
+    "CastPlan": ".evolve",
+    "convert_catalog": ".catalog",
+    "evolve_schema": ".evolve",
+    "flatten_table": ".flatten",
+    "infer_jsonl": ".shard",
+    "iter_jsonl": ".sink",
+    "iter_jsonl_shards": ".shard",
+    "iter_record_batches": ".builder",
+    "json_parse_options": ".reader",
+    "json_read_options": ".reader",
+    "JSONToArrowTypeMap": ".schema",
+    "open_jsonl": ".reader",
+    "read_jsonl": ".reader",
+    "read_jsonl_sharded": ".shard",
+    "RecordBatchBuilder": ".builder",
+    "RecordBatchFileWriter": ".sink",
+    "SchemaEvolution": ".evolve",
+    "SchemaEvolutionError": ".evolve",
+    "split_jsonl": ".shard",
+    "StageMetrics": ".aio",
+    "unify_schemas": ".evolve",
+    "validate_batch": ".validate",
+    "write_jsonl": ".sink",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str) -> t.Any:
+    module_name = _exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ModuleNotFoundError as e:
+        if e.name is None or e.name.split(".")[0] != "pyarrow":
+            raise
+        raise ImportError(
+            f"{__name__}.{name} requires pyarrow, "
+            "install it with `pip install py-schematools[arrow]`"
+        ) from e
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__() -> t.List[str]:
+    return sorted({*globals(), *_exports})
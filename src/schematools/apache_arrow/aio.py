@@ -0,0 +1,174 @@
+"""Convert asynchronous streams of JSON records to Apache Arrow record batches."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import typing as t
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+import pyarrow as pa
+
+from schematools.jsonschema import BaseJSONType
+
+from .builder import RecordBatchBuilder
+
+DEFAULT_CHUNK_SIZE = 1024
+DEFAULT_QUEUE_SIZE = 4
+
+# Put in the queue once all batches are.
+_DONE = object()
+
+
+@dataclass
+class StageMetrics:
+    """Throughput and queue depth of an `AsyncRecordBatchStage`."""
+
+    records: int = 0
+    batches: int = 0
+    rows: int = 0
+    bytes: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    started: float | None = None
+    finished: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the stage started, until it finished."""
+        if self.started is None:
+            return 0.0
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    @property
+    def records_per_second(self) -> float:
+        """Records read from the source per second."""
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Bytes of Arrow data emitted per second."""
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+
+class AsyncRecordBatchStage:
+    """Convert an async stream of JSON records to Arrow record batches.
+
+    Records are read on the event loop and handed in chunks of `chunk_size`
+    to `executor` (the loop's default executor if not given), where they are
+    converted by a `RecordBatchBuilder` while the next chunk is read. With
+    `lines`, the records are raw JSON lines (`str` or `bytes`), decoded in
+    the executor as well. The executor must run conversions in this process,
+    as the builder keeps the records of unfinished batches.
+
+    Batches are passed on through a queue of `queue_size` batches. Once it is
+    full, the source is not read until the consumer catches up, so a slow
+    consumer slows down the source rather than buffering without bound.
+    """
+
+    def __init__(
+        self,
+        jsonschema: BaseJSONType,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
+        lines: bool = False,
+        chunk_size: int | None = None,
+        queue_size: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        self.builder = RecordBatchBuilder(
+            jsonschema, max_rows=max_rows, max_bytes=max_bytes
+        )
+        self.lines = lines
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        self.queue_size = queue_size or DEFAULT_QUEUE_SIZE
+        self.executor = executor
+        self.metrics = StageMetrics()
+
+    async def stream(
+        self, source: t.AsyncIterable[t.Any]
+    ) -> t.AsyncIterator[pa.RecordBatch]:
+        """Read records from `source` and yield record batches as they fill."""
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self.metrics.started = time.perf_counter()
+        producer = asyncio.create_task(self._produce(source, queue))
+        try:
+            while True:
+                item = await queue.get()
+                self.metrics.queue_depth = queue.qsize()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+            self.metrics.finished = time.perf_counter()
+
+    async def _produce(
+        self, source: t.AsyncIterable[t.Any], queue: asyncio.Queue
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        converting: asyncio.Future | None = None
+        chunk: t.List[t.Any] = []
+        try:
+            async for record in source:
+                chunk.append(record)
+                if len(chunk) >= self.chunk_size:
+                    self.metrics.records += len(chunk)
+                    # read the next chunk while this one is converted
+                    if converting is not None:
+                        await self._put(await converting, queue)
+                    converting = loop.run_in_executor(
+                        self.executor, self._convert, chunk, False
+                    )
+                    chunk = []
+            self.metrics.records += len(chunk)
+            if converting is not None:
+                await self._put(await converting, queue)
+            await self._put(
+                await loop.run_in_executor(self.executor, self._convert, chunk, True),
+                queue,
+            )
+        except Exception as error:
+            await queue.put(error)
+        else:
+            await queue.put(_DONE)
+
+    def _convert(self, chunk: t.List[t.Any], last: bool) -> t.List[pa.RecordBatch]:
+        builder = self.builder
+        batches = []
+        for record in chunk:
+            builder.append(json.loads(record) if self.lines else record)
+            if builder.is_full():
+                batches.append(builder.flush())
+        if last and builder.num_rows:
+            batches.append(builder.flush())
+        return batches
+
+    async def _put(self, batches: t.List[pa.RecordBatch], queue: asyncio.Queue) -> None:
+        metrics = self.metrics
+        for batch in batches:
+            await queue.put(batch)
+            metrics.batches += 1
+            metrics.rows += batch.num_rows
+            metrics.bytes += batch.nbytes
+            metrics.queue_depth = queue.qsize()
+            metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+
+
+def aiter_record_batches(
+    jsonschema: BaseJSONType,
+    source: t.AsyncIterable[t.Any],
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
+    lines: bool = False,
+) -> t.AsyncIterator[pa.RecordBatch]:
+    """Convert an async iterable of JSON records to a stream of record batches."""
+    stage = AsyncRecordBatchStage(
+        jsonschema, max_rows=max_rows, max_bytes=max_bytes, lines=lines
+    )
+    return stage.stream(source)
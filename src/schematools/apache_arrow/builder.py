@@ -0,0 +1,133 @@
+"""Build Apache Arrow record batches from streams of JSON records."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pyarrow as pa
+
+from schematools.jsonschema import BaseJSONType, ObjectType
+
+from .schema import ArrowSchema
+
+DEFAULT_MAX_ROWS = 64 * 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Estimated Arrow bytes of values without data of their own, and of the
+# offset of each string and list.
+_VALUE_BYTES = 8
+_OFFSET_BYTES = 4
+
+
+def _estimate_bytes(record: t.Any) -> int:
+    """Estimate the Arrow size of a JSON record, without converting it.
+
+    Strings count their length and an offset, lists an offset, and other
+    values 8 bytes. The estimate is computed with an explicit stack, in
+    time linear in the number of values of the record.
+    """
+    size = 0
+    stack = [record]
+    while stack:
+        value = stack.pop()
+        cls = value.__class__
+        if cls is str or cls is bytes:
+            size += len(value) + _OFFSET_BYTES
+        elif cls is dict:
+            stack.extend(value.values())
+        elif cls is list:
+            size += _OFFSET_BYTES
+            stack.extend(value)
+        else:
+            size += _VALUE_BYTES
+    return size
+
+
+class RecordBatchBuilder:
+    """Buffer JSON records and emit Arrow record batches of a bounded size.
+
+    Buffered records are converted in a single pass by Arrow's native struct
+    converter, which appends every value straight into the column builders of
+    the target schema. Batches are emitted once `max_rows` records or about
+    `max_bytes` of Arrow data are buffered, so memory use does not depend on
+    the length of the input stream. The Arrow size of each record is
+    estimated from its strings and values as it is appended, so batches stay
+    bounded however the size of records changes along the stream.
+    """
+
+    def __init__(
+        self,
+        jsonschema: BaseJSONType,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.max_rows = max_rows if max_rows is not None else DEFAULT_MAX_ROWS
+        self.max_bytes = max_bytes if max_bytes is not None else DEFAULT_MAX_BYTES
+        self.schema = ArrowSchema.from_json_type(jsonschema)
+        # non-object schemas are written to a single "root" column
+        self._is_root = not (
+            isinstance(jsonschema, ObjectType) and jsonschema.has_properties()
+        )
+        self._type = (
+            self.schema.field("root").type
+            if self._is_root
+            else pa.struct(list(self.schema))
+        )
+        self._rows: list = []
+        self._bytes = 0
+
+    @property
+    def num_rows(self) -> int:
+        """Number of buffered records."""
+        return len(self._rows)
+
+    @property
+    def num_bytes(self) -> int:
+        """Estimated Arrow size of the buffered records."""
+        return self._bytes
+
+    def is_full(self) -> bool:
+        """Check if the buffered records have reached a batch size limit."""
+        return len(self._rows) >= self.max_rows or self._bytes >= self.max_bytes
+
+    def append(self, record: t.Any) -> None:
+        """Append a single record to the buffer."""
+        self._rows.append(record)
+        self._bytes += _estimate_bytes(record)
+
+    def flush(self) -> pa.RecordBatch:
+        """Build a record batch from the buffered records and reset the buffer."""
+        array = pa.array(self._rows, type=self._type)
+        self._rows = []
+        self._bytes = 0
+        if self._is_root:
+            return pa.RecordBatch.from_arrays([array], schema=self.schema)
+        return pa.RecordBatch.from_struct_array(array)
+
+    def iter_batches(self, records: t.Iterable[t.Any]) -> t.Iterator[pa.RecordBatch]:
+        """Consume records and yield record batches as size limits are reached."""
+        rows = self._rows
+        max_rows, max_bytes = self.max_rows, self.max_bytes
+        nbytes = self._bytes
+        for record in records:
+            rows.append(record)
+            nbytes += _estimate_bytes(record)
+            if len(rows) >= max_rows or nbytes >= max_bytes:
+                self._bytes = nbytes
+                yield self.flush()
+                rows = self._rows
+                nbytes = 0
+        self._bytes = nbytes
+        if rows:
+            yield self.flush()
+
+
+def iter_record_batches(
+    jsonschema: BaseJSONType,
+    records: t.Iterable[t.Any],
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
+) -> t.Iterator[pa.RecordBatch]:
+    """Convert an iterable of JSON records to a stream of Arrow record batches."""
+    builder = RecordBatchBuilder(jsonschema, max_rows=max_rows, max_bytes=max_bytes)
+    yield from builder.iter_batches(records)
@@ -0,0 +1,76 @@
+"""Convert whole catalogs of JSON schemas to Apache Arrow schemas."""
+
+from __future__ import annotations
+
+import os
+import typing as t
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import pyarrow as pa
+
+from schematools.jsonschema import jsonschema_fingerprint
+
+from .schema import ArrowSchema
+
+
+def _convert(jsonschema: dict | str) -> pa.Schema:
+    return ArrowSchema.from_jsonschema(jsonschema)
+
+
+def _convert_serialized(jsonschema: dict | str) -> bytes:
+    # Arrow schemas cross process boundaries in their compact IPC form
+    return ArrowSchema.from_jsonschema(jsonschema).serialize().to_pybytes()
+
+
+def _deserialize(payload: bytes) -> pa.Schema:
+    return pa.ipc.read_schema(pa.py_buffer(payload))
+
+
+def convert_catalog(
+    streams: t.Mapping[str, dict | str],
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    use_processes: bool = True,
+) -> t.Dict[str, pa.Schema]:
+    """Convert a mapping of stream name to JSON schema to Arrow schemas.
+
+    Identical schemas are converted once. Conversions run on `executor` if one
+    is given, otherwise on a new process pool (or thread pool, if
+    `use_processes` is false) of `max_workers` workers. Schemas converted in
+    other processes are returned in Arrow IPC form rather than pickled.
+    """
+    unique: t.Dict[str, dict | str] = {}
+    fingerprints = {}
+    for name, jsonschema in streams.items():
+        fingerprint = jsonschema_fingerprint(jsonschema)
+        fingerprints[name] = fingerprint
+        unique.setdefault(fingerprint, jsonschema)
+    if not unique:
+        return {}
+
+    if executor is None:
+        max_workers = max_workers or min(len(unique), os.cpu_count() or 1)
+        pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with pool_class(max_workers=max_workers) as pool:
+            converted = _map(pool, list(unique.values()), max_workers)
+    else:
+        converted = _map(executor, list(unique.values()), max_workers)
+
+    schemas = dict(zip(unique, converted))
+    return {name: schemas[fingerprints[name]] for name in streams}
+
+
+def _map(
+    executor: Executor, jsonschemas: t.List[dict | str], max_workers: int | None
+) -> t.List[pa.Schema]:
+    if isinstance(executor, ThreadPoolExecutor):
+        return list(executor.map(_convert, jsonschemas))
+    # batch small schemas to amortize the per-task overhead of worker processes
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(len(jsonschemas) // (workers * 4), 1)
+    return [
+        _deserialize(payload)
+        for payload in executor.map(
+            _convert_serialized, jsonschemas, chunksize=chunksize
+        )
+    ]
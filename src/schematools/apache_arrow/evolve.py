@@ -0,0 +1,116 @@
+"""Evolve Apache Arrow schemas when the JSON schema of a stream changes."""
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+
+import pyarrow as pa
+
+from schematools.jsonschema import BaseJSONType
+
+from .schema import FINGERPRINT_KEY, ArrowSchema
+
+
+class SchemaEvolutionError(ValueError):
+    """Schemas cannot be unified, as a field type changed incompatibly."""
+
+
+@dataclass(frozen=True)
+class CastPlan:
+    """How to convert record batches of one schema to another.
+
+    `columns` holds, for each field of the target schema, the index of the
+    source column and whether it must be cast, or None for columns of nulls.
+    Columns of the same type are passed through without being touched, so
+    applying a plan for an additive change costs little.
+    """
+
+    source: pa.Schema
+    target: pa.Schema
+    columns: t.Tuple[t.Tuple[int, bool] | None, ...]
+
+    @classmethod
+    def between(cls, source: pa.Schema, target: pa.Schema) -> CastPlan:
+        """Plan the conversion from `source` to `target`, matching fields by name."""
+        columns: t.List[t.Tuple[int, bool] | None] = []
+        for target_field in target:
+            index = source.get_field_index(target_field.name)
+            if index == -1:
+                columns.append(None)
+            else:
+                columns.append(
+                    (index, not source.field(index).type.equals(target_field.type))
+                )
+        return cls(source, target, tuple(columns))
+
+    def is_identity(self) -> bool:
+        """Check if batches need no conversion at all."""
+        return len(self.source) == len(self.target) and all(
+            column == (i, False) for i, column in enumerate(self.columns)
+        )
+
+    def apply(self, batch: pa.RecordBatch) -> pa.RecordBatch:
+        """Convert a record batch of the source schema to the target schema."""
+        if self.is_identity():
+            return batch
+        arrays = []
+        for target_field, column in zip(self.target, self.columns):
+            if column is None:
+                arrays.append(pa.nulls(batch.num_rows, target_field.type))
+            else:
+                index, cast = column
+                array = batch.column(index)
+                arrays.append(array.cast(target_field.type) if cast else array)
+        return pa.RecordBatch.from_arrays(arrays, schema=self.target)
+
+
+@dataclass(frozen=True)
+class SchemaEvolution:
+    """A unified schema for the data of an old and a new schema.
+
+    `existing` converts batches of the old schema, such as those buffered by
+    a writer, and `incoming` converts batches of the new one.
+    """
+
+    schema: pa.Schema
+    existing: CastPlan
+    incoming: CastPlan
+
+    def is_unchanged(self) -> bool:
+        """Check if the old schema holds the data of the new one as it is."""
+        return self.existing.is_identity()
+
+
+def unify_schemas(old: pa.Schema, new: pa.Schema) -> pa.Schema:
+    """Return a schema that holds the data of both schemas.
+
+    Fields of both keep the order of `old`, followed by fields only in
+    `new`. Fields only in one schema are kept, struct fields are merged the
+    same way, and numbers are widened, such as integers to floats.
+    """
+    try:
+        unified = pa.unify_schemas(
+            [old.remove_metadata(), new.remove_metadata()],
+            promote_options="permissive",
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        raise SchemaEvolutionError(str(e)) from e
+    metadata = {**(old.metadata or {}), **(new.metadata or {})}
+    # the unified schema is no longer that of a single JSON schema
+    metadata.pop(FINGERPRINT_KEY, None)
+    return unified.with_metadata(metadata) if metadata else unified
+
+
+def evolve_schema(schema: pa.Schema, jsonschema: BaseJSONType) -> SchemaEvolution:
+    """Evolve an Arrow schema to hold the data of a new JSON schema.
+
+    A writer can keep its buffered batches by converting them with
+    `existing`, rather than flushing them, whenever the schemas unify.
+    Raises `SchemaEvolutionError` otherwise.
+    """
+    new = ArrowSchema.from_json_type(jsonschema)
+    unified = unify_schemas(schema, new)
+    return SchemaEvolution(
+        unified, CastPlan.between(schema, unified), CastPlan.between(new, unified)
+    )
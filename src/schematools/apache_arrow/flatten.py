@@ -0,0 +1,62 @@
+"""Flatten nested struct columns of Apache Arrow data."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from schematools.jsonschema import BaseJSONType, ObjectType
+from schematools.jsonschema.flatten import (
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_SEPARATOR,
+    flatten,
+    flattened_paths,
+)
+
+from .schema import ArrowSchema
+
+ArrowData = t.TypeVar("ArrowData", pa.Table, pa.RecordBatch)
+
+
+def flatten_table(
+    data: ArrowData,
+    jsonschema: BaseJSONType,
+    max_depth: int | None = None,
+    separator: str | None = None,
+) -> ArrowData:
+    """Flatten the struct columns of a table built from an object schema.
+
+    Columns are named and nested with the same rules as `flatten`, and the
+    result has exactly the schema `ArrowSchema.from_json_type(flatten(...))`.
+    Child arrays are reused as they are: only the validity of fields under
+    null parents is recomputed, no value buffers are copied.
+    """
+    max_depth = max_depth if max_depth is not None else DEFAULT_MAX_DEPTH
+    separator = separator if separator is not None else DEFAULT_SEPARATOR
+    if (
+        max_depth <= 0
+        or not isinstance(jsonschema, ObjectType)
+        or not jsonschema.has_properties()
+    ):
+        return data
+
+    columns: t.Dict[t.Tuple[str, ...], pa.Array | pa.ChunkedArray] = {}
+
+    def column(path: t.Tuple[str, ...]) -> pa.Array | pa.ChunkedArray:
+        # shared parents are extracted once for all of their fields
+        if path not in columns:
+            if len(path) == 1:
+                columns[path] = data.column(path[0])
+            else:
+                columns[path] = pc.struct_field(column(path[:-1]), [path[-1]])
+        return columns[path]
+
+    # paths joined into the same name keep the last one, as `flatten` does
+    paths = {
+        separator.join(path): path for path, _ in flattened_paths(jsonschema, max_depth)
+    }
+    arrays = [column(path) for path in paths.values()]
+    schema = ArrowSchema.from_json_type(flatten(jsonschema, max_depth, separator))
+    return type(data).from_arrays(arrays, schema=schema)
@@ -0,0 +1,96 @@
+"""Read newline-delimited JSON with Arrow's native reader and a known schema."""
+
+from __future__ import annotations
+
+import os
+import typing as t
+
+import pyarrow as pa
+import pyarrow.json as pa_json
+
+from schematools.jsonschema import BaseJSONType, JSONSchemaParser, ObjectType
+
+from .schema import ArrowSchema
+
+# What to do with fields that are not in the schema, by whether it is closed.
+OPEN_FIELD_BEHAVIORS = ("ignore", "infer")
+
+Source = t.Union[str, os.PathLike, pa.NativeFile, t.BinaryIO]
+
+
+def json_parse_options(
+    jsonschema: BaseJSONType | dict | str,
+    open_fields: str = "ignore",
+    newlines_in_values: bool = False,
+) -> pa_json.ParseOptions:
+    """Return options for Arrow's JSON reader to parse records of a schema.
+
+    The Arrow schema of `jsonschema` is given as the explicit schema, so no
+    types are inferred. Fields that are not in the schema are an error if the
+    schema has `additionalProperties: false`; otherwise they are dropped, or
+    read with inferred types if `open_fields` is `"infer"`. Only the
+    top-level object decides this, as the reader has a single setting.
+    """
+    if open_fields not in OPEN_FIELD_BEHAVIORS:
+        raise ValueError(
+            f"Unknown open fields behavior {open_fields!r}, "
+            f"expected one of {OPEN_FIELD_BEHAVIORS}."
+        )
+    if not isinstance(jsonschema, BaseJSONType):
+        jsonschema = JSONSchemaParser.parse(jsonschema)
+    if not (isinstance(jsonschema, ObjectType) and jsonschema.has_properties()):
+        raise ValueError("Arrow's JSON reader needs an object schema with properties.")
+    closed = jsonschema.additionalProperties is False
+    return pa_json.ParseOptions(
+        explicit_schema=ArrowSchema.from_json_type(jsonschema),
+        unexpected_field_behavior="error" if closed else open_fields,
+        newlines_in_values=newlines_in_values,
+    )
+
+
+def json_read_options(
+    block_size: int | None = None, use_threads: bool = True
+) -> pa_json.ReadOptions:
+    """Return options for Arrow's JSON reader.
+
+    Input is read in blocks of `block_size` bytes (Arrow's default if not
+    given), which are parsed on Arrow's thread pool if `use_threads` is true.
+    A block must hold at least one whole record.
+    """
+    if block_size is None:
+        return pa_json.ReadOptions(use_threads=use_threads)
+    return pa_json.ReadOptions(use_threads=use_threads, block_size=block_size)
+
+
+def read_jsonl(
+    source: Source,
+    jsonschema: BaseJSONType | dict | str,
+    open_fields: str = "ignore",
+    block_size: int | None = None,
+    use_threads: bool = True,
+) -> pa.Table:
+    """Read a newline-delimited JSON file into a table of the schema's type."""
+    return pa_json.read_json(
+        source,
+        read_options=json_read_options(block_size, use_threads),
+        parse_options=json_parse_options(jsonschema, open_fields),
+    )
+
+
+def open_jsonl(
+    source: Source,
+    jsonschema: BaseJSONType | dict | str,
+    open_fields: str = "ignore",
+    block_size: int | None = None,
+    use_threads: bool = True,
+) -> pa.RecordBatchReader:
+    """Open a newline-delimited JSON file to read as a stream of record batches.
+
+    Each batch holds the records of one block of `block_size` bytes, so memory
+    use depends on the block size rather than the size of the file.
+    """
+    return pa_json.open_json(
+        source,
+        read_options=json_read_options(block_size, use_threads),
+        parse_options=json_parse_options(jsonschema, open_fields),
+    )
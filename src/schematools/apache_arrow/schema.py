@@ -0,0 +1,355 @@
+import functools
+import inspect
+import json
+import time
+import typing as t
+from functools import singledispatchmethod
+
+import pyarrow as pa
+
+from schematools import instrumentation
+from schematools.jsonschema import (
+    ArrayType,
+    BaseJSONType,
+    BooleanType,
+    IntegerType,
+    JSONSchemaParser,
+    NullType,
+    NumberType,
+    ObjectType,
+    ParseCache,
+    StringType,
+    jsonschema_fingerprint,
+)
+from schematools.jsonschema.dispatch import DispatchTable
+from schematools.jsonschema.traverse import ITEMS, transform
+from schematools.jsonschema.types import hash_tree
+
+# Key of the JSON schema fingerprint in the metadata of Arrow schemas.
+FINGERPRINT_KEY = b"schematools.fingerprint"
+
+
+class JSONToArrowTypeMap:
+    """Convert JSON types to Apache Arrow types.
+
+    With a `cache_size`, converted types are cached by the structure of the
+    JSON type in an LRU of that many entries, so a sub-schema that appears many
+    times is converted once and every occurrence shares the same Arrow type.
+    The cache is safe to share between threads along with the converter.
+    Looking a type up hashes and compares it, which costs more than
+    converting it unless its sub-schemas repeat, such as in interned types
+    (see `InternTable`) or many schemas converted with one converter, so the
+    cache is off by default.
+    """
+
+    def __init__(self, cache_size: int = 0) -> None:
+        self.cache = (
+            ParseCache(cache_size, name="convert.cache") if cache_size else None
+        )
+
+    @singledispatchmethod
+    def convert(self, jsontype: BaseJSONType) -> pa.DataType:
+        """Convert JSON type to Apache Arrow type."""
+        raise NotImplementedError(f"Conversion of {jsontype} is not supported")
+
+    @convert.register
+    def convert_integer(self, jsontype: IntegerType) -> pa.DataType:
+        """Convert IntegerType to Apache Arrow type."""
+        return pa.int64()
+
+    @convert.register
+    def convert_number(self, jsontype: NumberType) -> pa.DataType:
+        """Convert NumberType to Apache Arrow type."""
+        return pa.float64()
+
+    @convert.register
+    def convert_string(self, jsontype: StringType) -> pa.DataType:
+        """Convert StringType to Apache Arrow type."""
+        return pa.string()
+
+    @convert.register
+    def convert_boolean(self, jsontype: BooleanType) -> pa.DataType:
+        """Convert BooleanType to Apache Arrow type."""
+        return pa.bool_()
+
+    @convert.register
+    def convert_object(
+        self, jsontype: ObjectType, children: t.Mapping | None = None
+    ) -> pa.DataType:
+        """Convert ObjectType to Apache Arrow type."""
+        if jsontype.properties is not None:
+            fields = [
+                pa.field(
+                    name=k,
+                    type=children[k] if children else self.convert_tree(v),
+                    # nullable=v.get("nullable", True),
+                )
+                for k, v in jsontype.properties.items()
+            ]
+            return pa.struct(fields)
+        return pa.struct([])
+
+    @convert.register
+    def convert_array(
+        self, jsontype: ArrayType, children: t.Mapping | None = None
+    ) -> pa.DataType:
+        """Convert ArrayType to Apache Arrow type."""
+        if children:
+            return pa.list_(children[ITEMS])
+        return pa.list_(self.convert_tree(jsontype.items))
+
+    @convert.register
+    def convert_null(self, jsontype: NullType) -> pa.DataType:
+        """Convert NullType to Apache Arrow type."""
+        return pa.null()
+
+    def convert_tree(self, jsontype: BaseJSONType) -> pa.DataType:
+        """Convert JSON type to Apache Arrow type without recursion.
+
+        Gives the same result as `convert`, but properties and items are
+        converted first with an explicit stack and handed to the built-in
+        object and array handlers as `children`, so the depth of a type is not
+        limited by the recursion limit. Handlers registered with `convert` are
+        called with the type alone, and convert its nested types themselves.
+        """
+        return transform(jsontype, *self._tree_functions())
+
+    def convert_properties(self, jsontype: ObjectType) -> t.Dict[str, pa.DataType]:
+        """Convert the type of each property of an object without recursion."""
+        stats = instrumentation.active()
+        if stats is not None:
+            return self._timed_properties(jsontype, stats)
+        children, build = self._tree_functions()
+        properties = list(jsontype.properties.items())
+        return transform(
+            _ROOT,
+            lambda node: properties if node is _ROOT else children(node),
+            lambda node, converted: (
+                dict(converted) if node is _ROOT else build(node, converted)
+            ),
+        )
+
+    def _timed_properties(
+        self, jsontype: ObjectType, stats: instrumentation.Instrumentation
+    ) -> t.Dict[str, pa.DataType]:
+        functions = self._tree_functions()
+        converted = {}
+        for name, value in jsontype.properties.items():
+            start = time.perf_counter()
+            converted[name] = transform(value, *functions)
+            stats.add_field_time(name, time.perf_counter() - start)
+        return converted
+
+    def _tree_functions(
+        self,
+    ) -> t.Tuple[
+        t.Callable[[BaseJSONType], t.List[t.Tuple[t.Hashable, BaseJSONType]] | None],
+        t.Callable[[BaseJSONType, t.Mapping], pa.DataType],
+    ]:
+        """Return the `children` and `build` functions that convert a tree."""
+        stats = instrumentation.active()
+        table = _dispatch_table(type(self))
+        # type class -> convert handler; instrumented handlers are kept per tree
+        handlers = table.handlers() if stats is None else {}
+        # type class -> whether its handler takes converted `children`
+        takes_children: t.Dict[type, bool] = {}
+        cache = self.cache
+        # types found in the cache by `children`, handed over to `build`
+        cached: t.Dict[int, pa.DataType] = {}
+
+        def resolve(cls: type) -> t.Callable:
+            handler = handlers.get(cls)
+            if handler is None:
+                handler = table.resolve(cls)
+                if stats is not None:
+                    stats.count("convert.dispatch")
+                    handler = handlers[cls] = _counted_handler(handler, stats)
+            return handler
+
+        def children(
+            node: BaseJSONType,
+        ) -> t.List[t.Tuple[t.Hashable, BaseJSONType]] | None:
+            pairs = _type_children(node)
+            if not pairs:
+                return None
+            cls = node.__class__
+            tree_handler = takes_children.get(cls)
+            if tree_handler is None:
+                handler = resolve(cls)
+                tree_handler = takes_children[cls] = (
+                    getattr(handler, "__wrapped__", handler) in _tree_handlers
+                )
+            if not tree_handler:
+                return None  # the handler converts the nested types itself
+            # only objects and arrays are cached, leaves are cheaper to convert
+            if cache is not None:
+                hash_tree(node)  # hash nested types first, without recursion
+                converted = cache.get(node)
+                if converted is not None:
+                    cached[id(node)] = converted
+                    return None  # skip converting the children
+            return pairs
+
+        def build(node: BaseJSONType, children: t.Mapping) -> pa.DataType:
+            if cached:
+                converted = cached.pop(id(node), None)
+                if converted is not None:
+                    return converted
+            handler = resolve(node.__class__)
+            if not children:
+                return handler(self, node)
+            converted = handler(self, node, children=children)
+            if cache is not None:
+                cache.put(node, converted)
+            return converted
+
+        return children, build
+
+
+@functools.cache
+def _dispatch_table(converter_class: t.Type[JSONToArrowTypeMap]) -> DispatchTable:
+    """Return the table of `convert` handlers of a converter class."""
+    return DispatchTable(inspect.getattr_static(converter_class, "convert").dispatcher)
+
+
+def _counted_handler(
+    handler: t.Callable, stats: instrumentation.Instrumentation
+) -> t.Callable:
+    @functools.wraps(handler)
+    def counted_handler(
+        converter: JSONToArrowTypeMap, jsontype: BaseJSONType, **kwargs: t.Any
+    ) -> pa.DataType:
+        stats.count(f"convert.nodes.{type(jsontype).__name__}")
+        return handler(converter, jsontype, **kwargs)
+
+    return counted_handler
+
+
+# Built-in handlers that are given the converted properties or items of a type
+# as `children`; other handlers convert them themselves.
+_tree_handlers = frozenset(
+    {JSONToArrowTypeMap.convert_object, JSONToArrowTypeMap.convert_array}
+)
+
+# Stand-in for the object whose properties `convert_properties` converts.
+_ROOT = object()
+
+
+def _type_children(
+    jsontype: BaseJSONType,
+) -> t.List[t.Tuple[t.Hashable, BaseJSONType]] | None:
+    """Return the nested types that are converted before a type itself."""
+    if isinstance(jsontype, ObjectType):
+        return list(jsontype.properties.items()) if jsontype.properties else None
+    if isinstance(jsontype, ArrayType) and jsontype.items is not None:
+        return [(ITEMS, jsontype.items)]
+    return None
+
+
+class ArrowSchema:
+    """Apache Arrow schema representation."""
+
+    @classmethod
+    def from_jsonschema(
+        cls,
+        jsonschema: dict | str,
+        cache: ParseCache | None = None,
+        converter: JSONToArrowTypeMap | None = None,
+        fingerprint: bool = False,
+    ) -> pa.Schema:
+        """Convert JSON schema to Apache Arrow schema.
+
+        If a cache is given, both the parsed schema and the resulting Arrow
+        schema are cached, so repeated conversions only fingerprint the input.
+        With `fingerprint`, the fingerprint of the parsed schema is embedded
+        in the metadata of the Arrow schema (see `with_fingerprint`).
+        """
+        if cache is not None:
+            copy = True
+            if isinstance(jsonschema, str):
+                # decoded and fingerprinted once for both cache entries
+                jsonschema = json.loads(jsonschema)
+                copy = False
+            schema_fingerprint = jsonschema_fingerprint(jsonschema)
+            key = ("arrow", schema_fingerprint, fingerprint)
+            if converter is not None:
+                key = (*key, type(converter))
+            arrow_schema = cache.get(key)
+            if arrow_schema is None:
+                json_schema = JSONSchemaParser._parse_cached(
+                    jsonschema, schema_fingerprint, cache, copy=copy
+                )
+                arrow_schema = cache.put(
+                    key, cls.from_json_type(json_schema, converter, fingerprint)
+                )
+            return arrow_schema
+        return cls.from_json_type(
+            JSONSchemaParser.parse(jsonschema), converter, fingerprint
+        )
+
+    @classmethod
+    def from_json_type(
+        cls,
+        json_schema: BaseJSONType,
+        converter: JSONToArrowTypeMap | None = None,
+        fingerprint: bool = False,
+    ) -> pa.Schema:
+        """Convert a parsed JSON schema type to Apache Arrow schema.
+
+        Pass a `converter` with a cache to share converted types between
+        schemas; otherwise a converter without a cache is used.
+        """
+        converter = converter if converter is not None else JSONToArrowTypeMap()
+        stats = instrumentation.active()
+        if stats is None:
+            schema = cls._from_json_type(json_schema, converter)
+        else:
+            stats.count("convert.calls")
+            with stats.timer("convert"):
+                schema = cls._from_json_type(json_schema, converter)
+        if fingerprint:
+            return cls.with_fingerprint(schema, json_schema)
+        return schema
+
+    @staticmethod
+    def with_fingerprint(schema: pa.Schema, json_schema: BaseJSONType) -> pa.Schema:
+        """Return an Arrow schema with the fingerprint of its JSON schema.
+
+        The fingerprint is added to the schema metadata under
+        `FINGERPRINT_KEY`, so writers can tell two schemas are the same by
+        comparing `get_fingerprint` of each rather than the whole schemas.
+        """
+        metadata = dict(schema.metadata or {})
+        metadata[FINGERPRINT_KEY] = json_schema.fingerprint().encode("ascii")
+        return schema.with_metadata(metadata)
+
+    @staticmethod
+    def get_fingerprint(schema: pa.Schema) -> str | None:
+        """Return the JSON schema fingerprint of an Arrow schema, if it has one."""
+        fingerprint = (schema.metadata or {}).get(FINGERPRINT_KEY)
+        return fingerprint.decode("ascii") if fingerprint is not None else None
+
+    @classmethod
+    def _from_json_type(
+        cls, json_schema: BaseJSONType, converter: JSONToArrowTypeMap
+    ) -> pa.Schema:
+        if isinstance(json_schema, ObjectType) and json_schema.has_properties():
+            return pa.schema(
+                [
+                    pa.field(
+                        name=k,
+                        type=v,
+                        # nullable=jsonschema.get("nullable", True),
+                    )
+                    for k, v in converter.convert_properties(json_schema).items()
+                ]
+            )
+        return pa.schema(
+            [
+                pa.field(
+                    name="root",
+                    type=converter.convert_tree(json_schema),
+                    # nullable=jsonschema.get("nullable", True),
+                )
+            ]
+        )
@@ -0,0 +1,256 @@
+"""Convert large newline-delimited JSON files in parallel, one shard per task."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import typing as t
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+
+import pyarrow as pa
+import pyarrow.json as pa_json
+
+from schematools.jsonschema import (
+    BaseJSONType,
+    JSONSchemaParser,
+    ParseCache,
+    SchemaInference,
+)
+
+from .builder import RecordBatchBuilder
+from .reader import json_parse_options, json_read_options
+from .schema import ArrowSchema
+
+DEFAULT_SHARD_BYTES = 64 * 1024 * 1024
+
+ENGINES = ("arrow", "python")
+
+# Schemas parsed in this process, so each worker parses a schema once.
+_cache = ParseCache()
+
+
+def split_jsonl(path: str | os.PathLike, shards: int) -> t.List[t.Tuple[int, int]]:
+    """Split a newline-delimited JSON file into newline-aligned byte ranges.
+
+    The file is memory-mapped and cut at the first newline after each of
+    `shards` evenly spaced offsets, so every range holds whole lines. Ranges
+    are in file order, and fewer than `shards` if lines are long.
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            step = max(size // max(shards, 1), 1)
+            ranges = []
+            start = 0
+            while start < size:
+                newline = data.find(b"\n", min(start + step, size) - 1)
+                end = size if newline == -1 else newline + 1
+                ranges.append((start, end))
+                start = end
+    return ranges
+
+
+def _convert_shard(
+    path: str,
+    start: int,
+    end: int,
+    jsonschema: dict | str,
+    engine: str,
+    block_size: int | None,
+) -> pa.Buffer:
+    """Convert a byte range of a file to record batches in Arrow IPC form."""
+    parsed = JSONSchemaParser.parse(jsonschema, cache=_cache)
+    with pa.memory_map(path) as source:
+        # a view of the mapped file, not a copy
+        source.seek(start)
+        data = source.read_buffer(end - start)
+        if engine == "arrow":
+            table = pa_json.read_json(
+                pa.BufferReader(data),
+                # workers already use every core
+                read_options=json_read_options(block_size, use_threads=False),
+                parse_options=json_parse_options(parsed),
+            )
+            schema, batches = table.schema, table.to_batches()
+        else:
+            builder = RecordBatchBuilder(parsed)
+            lines = data.to_pybytes().splitlines()
+            records = (json.loads(line) for line in lines if line.strip())
+            schema, batches = builder.schema, builder.iter_batches(records)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+    return sink.getvalue()
+
+
+def iter_jsonl_shards(
+    path: str | os.PathLike,
+    jsonschema: dict | str,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    shard_bytes: int | None = None,
+    engine: str = "arrow",
+    block_size: int | None = None,
+) -> t.Iterator[pa.Table]:
+    """Convert a newline-delimited JSON file in shards, yielding them in order.
+
+    The file is split into newline-aligned shards of about `shard_bytes`
+    bytes (at least one per worker), which are converted on `executor` if one
+    is given, otherwise on a new process pool of `max_workers` workers. Each
+    worker memory-maps the file and converts its shard with Arrow's JSON
+    reader (`engine="arrow"`), or with `json` and a `RecordBatchBuilder`
+    (`engine="python"`), which also reads records of non-object schemas.
+    Shards are sent back in Arrow IPC form and read without copying.
+
+    Tables are yielded in file order whatever order the shards finish in, and
+    at most two shards per worker are converted ahead of the one yielded, so
+    memory use does not depend on the size of the file.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}.")
+    path = os.fspath(path)
+    workers = max_workers or os.cpu_count() or 1
+    ranges = _shard_ranges(path, workers, shard_bytes)
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from _iter_shards(
+                pool, path, ranges, jsonschema, engine, block_size, workers
+            )
+    else:
+        yield from _iter_shards(
+            executor, path, ranges, jsonschema, engine, block_size, workers
+        )
+
+
+def _shard_ranges(
+    path: str, workers: int, shard_bytes: int | None
+) -> t.List[t.Tuple[int, int]]:
+    size = os.path.getsize(path)
+    shard_bytes = min(shard_bytes or DEFAULT_SHARD_BYTES, -(-size // workers))
+    return split_jsonl(path, -(-size // max(shard_bytes, 1)))
+
+
+def _iter_shards(
+    executor: Executor,
+    path: str,
+    ranges: t.List[t.Tuple[int, int]],
+    jsonschema: dict | str,
+    engine: str,
+    block_size: int | None,
+    workers: int,
+) -> t.Iterator[pa.Table]:
+    pending: t.Deque[Future] = deque()
+    try:
+        for start, end in ranges:
+            pending.append(
+                executor.submit(
+                    _convert_shard, path, start, end, jsonschema, engine, block_size
+                )
+            )
+            if len(pending) > workers * 2:
+                yield _read_shard(pending.popleft())
+        while pending:
+            yield _read_shard(pending.popleft())
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _read_shard(future: Future) -> pa.Table:
+    return pa.ipc.open_stream(future.result()).read_all()
+
+
+def read_jsonl_sharded(
+    path: str | os.PathLike,
+    jsonschema: dict | str,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    shard_bytes: int | None = None,
+    engine: str = "arrow",
+    block_size: int | None = None,
+) -> pa.Table:
+    """Read a newline-delimited JSON file into a table, converting it in parallel.
+
+    See `iter_jsonl_shards`. The table has a chunk per shard batch, in file
+    order, and shares the memory the shards were received in.
+    """
+    tables = list(
+        iter_jsonl_shards(
+            path,
+            jsonschema,
+            executor=executor,
+            max_workers=max_workers,
+            shard_bytes=shard_bytes,
+            engine=engine,
+            block_size=block_size,
+        )
+    )
+    if not tables:
+        return ArrowSchema.from_jsonschema(jsonschema).empty_table()
+    return pa.concat_tables(tables)
+
+
+def _infer_shard(
+    path: str, start: int, end: int, sample_size: int | None, seed: int | None
+) -> SchemaInference:
+    """Infer the JSON type of the records in a byte range of a file."""
+    inference = SchemaInference(sample_size=sample_size, seed=seed)
+    with open(path, "rb") as file:
+        file.seek(start)
+        lines = file.read(end - start).splitlines()
+    inference.update(json.loads(line) for line in lines if line.strip())
+    return inference
+
+
+def infer_jsonl(
+    path: str | os.PathLike,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    shard_bytes: int | None = None,
+    sample_size: int | None = None,
+    seed: int | None = None,
+) -> BaseJSONType:
+    """Infer the JSON type of the records of a newline-delimited JSON file.
+
+    The file is split into shards as by `iter_jsonl_shards`, each shard is
+    inferred by a worker, and the partial inferences are merged in file
+    order. With `sample_size`, each worker keeps a sample of its shard, and
+    the samples are merged into a uniform sample of the whole file.
+    """
+    path = os.fspath(path)
+    workers = max_workers or os.cpu_count() or 1
+    ranges = _shard_ranges(path, workers, shard_bytes)
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return _infer_shards(pool, path, ranges, sample_size, seed)
+    return _infer_shards(executor, path, ranges, sample_size, seed)
+
+
+def _infer_shards(
+    executor: Executor,
+    path: str,
+    ranges: t.List[t.Tuple[int, int]],
+    sample_size: int | None,
+    seed: int | None,
+) -> BaseJSONType:
+    futures = [
+        executor.submit(
+            _infer_shard,
+            path,
+            start,
+            end,
+            sample_size,
+            # shards sampled with the same seed would pick the same lines
+            None if seed is None else seed + i,
+        )
+        for i, (start, end) in enumerate(ranges)
+    ]
+    inference = SchemaInference(sample_size=sample_size, seed=seed)
+    for future in futures:
+        inference.merge(future.result())
+    return inference.to_type()
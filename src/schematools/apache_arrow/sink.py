@@ -0,0 +1,189 @@
+"""Write streams of JSON records to Parquet or Arrow IPC files."""
+
+from __future__ import annotations
+
+import json
+import os
+import typing as t
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from schematools.jsonschema import BaseJSONType, JSONSchemaParser
+
+from .builder import RecordBatchBuilder
+
+DEFAULT_ROW_GROUP_ROWS = 1024 * 1024
+DEFAULT_ROW_GROUP_BYTES = 128 * 1024 * 1024
+
+FORMATS = ("parquet", "ipc")
+
+# Compression used unless another is given, per format.
+_default_compression = {"parquet": "snappy", "ipc": None}
+
+
+class RecordBatchFileWriter:
+    """Write record batches to Parquet or Arrow IPC files.
+
+    Batches are buffered and written in row groups of up to `row_group_rows`
+    rows or roughly `row_group_bytes` of Arrow data, whichever comes first, so
+    small batches do not make small row groups. In IPC files, row groups are
+    written as record batches.
+
+    With `max_file_bytes`, a new file is started once the current one has
+    reached that size, checked after each row group; `path` must then be a
+    template with a `{part}` field, such as `"data-{part:05d}.parquet"`.
+    Pass `compression="none"` to write uncompressed files.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        schema: pa.Schema,
+        format: str = "parquet",
+        compression: str | None = None,
+        row_group_rows: int | None = None,
+        row_group_bytes: int | None = None,
+        max_file_bytes: int | None = None,
+    ) -> None:
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}, expected one of {FORMATS}.")
+        if max_file_bytes is not None and "{part" not in str(path):
+            raise ValueError("Rolling over files needs a `{part}` field in the path.")
+        self.path = str(path)
+        self.schema = schema
+        self.format = format
+        compression = compression or _default_compression[format]
+        self.compression = None if compression == "none" else compression
+        self.row_group_rows = row_group_rows or DEFAULT_ROW_GROUP_ROWS
+        self.row_group_bytes = row_group_bytes or DEFAULT_ROW_GROUP_BYTES
+        self.max_file_bytes = max_file_bytes
+        self.paths: t.List[Path] = []
+        self._batches: t.List[pa.RecordBatch] = []
+        self._rows = 0
+        self._bytes = 0
+        self._file: pa.NativeFile | None = None
+        self._writer: pq.ParquetWriter | pa.ipc.RecordBatchFileWriter | None = None
+
+    def __enter__(self) -> RecordBatchFileWriter:
+        return self
+
+    def __exit__(self, exc_type: t.Any, *args: t.Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # keep the files written so far readable, without the failed rows
+            self._batches.clear()
+            self._close_file()
+
+    def write_batch(self, batch: pa.RecordBatch) -> None:
+        """Buffer a record batch, writing row groups once enough are buffered."""
+        if not batch.num_rows:
+            return
+        self._batches.append(batch)
+        self._rows += batch.num_rows
+        self._bytes += batch.nbytes
+        if self._bytes >= self.row_group_bytes:
+            self._write_buffered()
+        elif self._rows >= self.row_group_rows:
+            # write the full row groups and keep the rest buffered
+            self._write_buffered(self._rows - self._rows % self.row_group_rows)
+
+    def close(self) -> None:
+        """Write the buffered batches and close the current file.
+
+        A file holding only the schema is written if there were no records.
+        """
+        if not self.paths:
+            self._open_file()
+        self._write_buffered()
+        self._close_file()
+
+    def _write_buffered(self, rows: int | None = None) -> None:
+        table = pa.Table.from_batches(self._batches, schema=self.schema)
+        rows = table.num_rows if rows is None else rows
+        self._batches = table.slice(rows).to_batches()
+        self._rows = table.num_rows - rows
+        self._bytes = sum(batch.nbytes for batch in self._batches)
+        for offset in range(0, rows, self.row_group_rows):
+            if self._writer is None:
+                self._open_file()
+            row_group = table.slice(offset, min(self.row_group_rows, rows - offset))
+            if self.format == "parquet":
+                self._writer.write_table(row_group, row_group_size=row_group.num_rows)
+            else:
+                self._writer.write_table(row_group, max_chunksize=row_group.num_rows)
+            if (
+                self.max_file_bytes is not None
+                and self._file.tell() >= self.max_file_bytes
+            ):
+                self._close_file()
+
+    def _open_file(self) -> None:
+        path = Path(self.path.format(part=len(self.paths)))
+        self._file = pa.OSFile(str(path), "wb")
+        if self.format == "parquet":
+            self._writer = pq.ParquetWriter(
+                self._file, self.schema, compression=self.compression or "none"
+            )
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            self._writer = pa.ipc.new_file(self._file, self.schema, options=options)
+        self.paths.append(path)
+
+    def _close_file(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._file.close()
+            self._writer = self._file = None
+
+
+def iter_jsonl(
+    source: str | os.PathLike | t.Iterable[str | bytes],
+) -> t.Iterator[t.Any]:
+    """Read records from a newline-delimited JSON file or iterable of lines."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as lines:
+            yield from iter_jsonl(lines)
+        return
+    for line in source:
+        if line.strip():
+            yield json.loads(line)
+
+
+def write_jsonl(
+    source: str | os.PathLike | t.Iterable[str | bytes],
+    path: str | os.PathLike,
+    jsonschema: dict | str | BaseJSONType,
+    format: str = "parquet",
+    compression: str | None = None,
+    batch_rows: int | None = None,
+    batch_bytes: int | None = None,
+    row_group_rows: int | None = None,
+    row_group_bytes: int | None = None,
+    max_file_bytes: int | None = None,
+) -> t.List[Path]:
+    """Convert newline-delimited JSON records to Parquet or Arrow IPC files.
+
+    Records are read line by line and converted to record batches of up to
+    `batch_rows` rows or roughly `batch_bytes` bytes, which are then written
+    by a `RecordBatchFileWriter`. At most one row group and one batch are held
+    in memory at a time, whatever the size of the input. Returns the paths of
+    the written files.
+    """
+    if not isinstance(jsonschema, BaseJSONType):
+        jsonschema = JSONSchemaParser.parse(jsonschema)
+    builder = RecordBatchBuilder(jsonschema, max_rows=batch_rows, max_bytes=batch_bytes)
+    with RecordBatchFileWriter(
+        path,
+        builder.schema,
+        format=format,
+        compression=compression,
+        row_group_rows=row_group_rows,
+        row_group_bytes=row_group_bytes,
+        max_file_bytes=max_file_bytes,
+    ) as writer:
+        for batch in builder.iter_batches(iter_jsonl(source)):
+            writer.write_batch(batch)
+    return writer.paths
@@ -0,0 +1,238 @@
+"""Validate Apache Arrow data against JSON schema constraints."""
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from schematools.jsonschema import (
+    ArrayType,
+    BaseJSONType,
+    IntegerType,
+    NumberType,
+    ObjectType,
+    StringType,
+)
+
+
+@dataclass(frozen=True)
+class BatchValidationResult:
+    """Result of validating a batch or table.
+
+    `mask` is true for valid rows, so `batch.filter(result.mask)` keeps them
+    and `batch.filter(pc.invert(result.mask))` quarantines the others.
+    `violations` maps column paths (nested fields joined with ".") to the
+    number of rows violating a constraint of that column; for array items
+    (paths ending in "[]") it is the number of invalid items.
+    """
+
+    mask: pa.BooleanArray | pa.ChunkedArray
+    violations: t.Dict[str, int]
+
+    @property
+    def num_invalid(self) -> int:
+        """Number of invalid rows."""
+        return len(self.mask) - _count(self.mask)
+
+    def is_valid(self) -> bool:
+        """Check if every row is valid."""
+        return self.num_invalid == 0
+
+
+def _count(mask: pa.Array | pa.ChunkedArray) -> int:
+    return pc.sum(mask).as_py() or 0
+
+
+def _add(violations: t.Dict[str, int], path: str, mask: pa.Array) -> None:
+    violations[path] = violations.get(path, 0) + _count(mask)
+
+
+def _row_ids(length: int) -> pa.Array:
+    ones = pa.repeat(pa.scalar(1, pa.int64()), length)
+    return pc.subtract(pc.cumulative_sum(ones), 1)
+
+
+def _any(masks: list[pa.Array]) -> pa.Array | None:
+    if not masks:
+        return None
+    result = masks[0]
+    for mask in masks[1:]:
+        result = pc.or_(result, mask)
+    return result
+
+
+def _bounds(array: pa.Array, jsontype: IntegerType | NumberType) -> list[pa.Array]:
+    masks = []
+    minimum, exclusive_minimum, maximum, exclusive_maximum = jsontype.bounds()
+    if minimum is not None:
+        masks.append(pc.less(array, minimum))
+    if exclusive_minimum is not None:
+        masks.append(pc.less_equal(array, exclusive_minimum))
+    if maximum is not None:
+        masks.append(pc.greater(array, maximum))
+    if exclusive_maximum is not None:
+        masks.append(pc.greater_equal(array, exclusive_maximum))
+    multiple_of = jsontype.multipleOf
+    if multiple_of is not None:
+        if pa.types.is_integer(array.type) and isinstance(multiple_of, int):
+            remainder = pc.subtract(
+                array, pc.multiply(pc.divide(array, multiple_of), multiple_of)
+            )
+            masks.append(pc.not_equal(remainder, 0))
+        else:
+            quotient = pc.divide(pc.cast(array, pa.float64()), float(multiple_of))
+            masks.append(pc.not_equal(quotient, pc.trunc(quotient)))
+    return masks
+
+
+def _value_set(values: list, arrow_type: pa.DataType) -> pa.Array:
+    """Build an array of the enum values that can be stored in a column."""
+    try:
+        return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+        castable = []
+        for value in values:
+            try:
+                pa.scalar(value, type=arrow_type)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+                continue
+            castable.append(value)
+        return pa.array(castable, type=arrow_type)
+
+
+def _not_in(array: pa.Array, values: list) -> pa.Array:
+    # is_in never returns null, so nulls have to be excluded explicitly
+    value_set = _value_set(values, array.type)
+    return pc.and_(pc.is_valid(array), pc.invert(pc.is_in(array, value_set=value_set)))
+
+
+def _column_violations(
+    array: pa.Array,
+    jsontype: BaseJSONType,
+    path: str,
+    violations: t.Dict[str, int],
+) -> pa.Array | None:
+    """Return a mask of rows violating a constraint of the column or its children.
+
+    Null values only violate `required`, which is checked by the parent.
+    """
+    masks = []
+    if jsontype.enum is not None:
+        masks.append(_not_in(array, jsontype.enum))
+    if jsontype.const is not None:
+        masks.append(_not_in(array, [jsontype.const]))
+    if isinstance(jsontype, (IntegerType, NumberType)):
+        masks.extend(_bounds(array, jsontype))
+    elif isinstance(jsontype, StringType):
+        if jsontype.minLength is not None or jsontype.maxLength is not None:
+            length = pc.utf8_length(array)
+            if jsontype.minLength is not None:
+                masks.append(pc.less(length, jsontype.minLength))
+            if jsontype.maxLength is not None:
+                masks.append(pc.greater(length, jsontype.maxLength))
+        if jsontype.pattern is not None:
+            masks.append(
+                pc.invert(pc.match_substring_regex(array, pattern=jsontype.pattern))
+            )
+    elif isinstance(jsontype, ArrayType):
+        if jsontype.minItems is not None or jsontype.maxItems is not None:
+            length = pc.list_value_length(array)
+            if jsontype.minItems is not None:
+                masks.append(pc.less(length, jsontype.minItems))
+            if jsontype.maxItems is not None:
+                masks.append(pc.greater(length, jsontype.maxItems))
+
+    own = _any(masks)
+    if own is not None:
+        own = pc.fill_null(own, False)
+        _add(violations, path, own)
+
+    children = []
+    if isinstance(jsontype, ObjectType) and pa.types.is_struct(array.type):
+        children.append(_struct_violations(array, jsontype, path, violations))
+    elif isinstance(jsontype, ArrayType) and isinstance(jsontype.items, BaseJSONType):
+        children.append(_items_violations(array, jsontype.items, path, violations))
+    return _any([mask for mask in [own, *children] if mask is not None])
+
+
+def _struct_violations(
+    array: pa.StructArray | pa.RecordBatch,
+    jsontype: ObjectType,
+    path: str,
+    violations: t.Dict[str, int],
+) -> pa.Array | None:
+    is_batch = isinstance(array, pa.RecordBatch)
+    names = array.schema.names if is_batch else [f.name for f in array.type]
+    present = None if is_batch else pc.is_valid(array)
+    prefix = f"{path}." if path else ""
+    masks = []
+    for name in jsontype.required or ():
+        if name in names:
+            child = array.column(name) if is_batch else pc.struct_field(array, [name])
+            missing = pc.is_null(child)
+        else:
+            missing = pa.repeat(True, len(array))
+        if present is not None:
+            missing = pc.and_(present, missing)
+        _add(violations, prefix + name, missing)
+        masks.append(missing)
+    for name, child_type in (jsontype.properties or {}).items():
+        if name not in names:
+            continue
+        child = array.column(name) if is_batch else pc.struct_field(array, [name])
+        mask = _column_violations(child, child_type, prefix + name, violations)
+        if mask is not None:
+            masks.append(mask)
+    return _any(masks)
+
+
+def _items_violations(
+    array: pa.ListArray,
+    jsontype: BaseJSONType,
+    path: str,
+    violations: t.Dict[str, int],
+) -> pa.Array | None:
+    mask = _column_violations(pc.list_flatten(array), jsontype, f"{path}[]", violations)
+    if mask is None:
+        return None
+    invalid_rows = pc.filter(pc.list_parent_indices(array), mask)
+    return pc.is_in(_row_ids(len(array)), value_set=invalid_rows)
+
+
+def _validate_batch(
+    batch: pa.RecordBatch, jsontype: BaseJSONType, violations: t.Dict[str, int]
+) -> pa.BooleanArray:
+    if isinstance(jsontype, ObjectType) and jsontype.has_properties():
+        invalid = _struct_violations(batch, jsontype, "", violations)
+    else:
+        invalid = _column_violations(batch.column(0), jsontype, "root", violations)
+    if invalid is None:
+        return pa.repeat(True, batch.num_rows)
+    return pc.invert(invalid)
+
+
+def validate_batch(
+    data: pa.RecordBatch | pa.Table, jsontype: BaseJSONType
+) -> BatchValidationResult:
+    """Check the rows of a record batch or table against a parsed JSON schema.
+
+    Constraints are evaluated column by column with Arrow compute kernels, and
+    violations are reported rather than raised. Arrow does not distinguish a
+    missing value from an explicit null, so nulls only count as violations of
+    `required`.
+    """
+    violations: t.Dict[str, int] = {}
+    if isinstance(data, pa.Table):
+        mask = pa.chunked_array(
+            [
+                _validate_batch(batch, jsontype, violations)
+                for batch in data.to_batches()
+            ],
+            type=pa.bool_(),
+        )
+    else:
+        mask = _validate_batch(data, jsontype, violations)
+    return BatchValidationResult(mask=mask, violations=violations)
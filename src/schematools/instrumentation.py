@@ -0,0 +1,135 @@
+"""Opt-in counters and timings of the parse and convert pipeline.
+
+Instrumentation is off by default, and the pipeline then only checks once
+per parse or conversion whether it is on. Turn it on for a block of code with
+`instrument()`, or globally with `enable()`:
+
+    with instrument() as stats:
+        ArrowSchema.from_jsonschema(jsonschema)
+    stats.snapshot()
+
+Counters and timings are collected from every thread of the process, but not
+from worker processes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Called with the kind of each event ("count" or "time"), its name and value.
+Callback = t.Callable[[str, str, float], None]
+
+
+class Instrumentation:
+    """Counters and timings (in seconds) recorded by the pipeline.
+
+    Counters:
+    - `parse.calls`, `parse.refs`: parses and resolved `$ref`s
+    - `parse.nodes.<type>`: parsed nodes per type class
+    - `parse.dispatch`: handler lookups in the `parse_type` dispatch table
+    - `cache.hits`, `cache.misses`: lookups in a `ParseCache`
+    - `convert.cache.hits`, `convert.cache.misses`: lookups in the
+      conversion cache of a `JSONToArrowTypeMap`
+    - `convert.calls`, `convert.nodes.<type>`: Arrow schema conversions and
+      converted nodes per type class
+    - `convert.dispatch`: handler lookups in the `convert` dispatch table
+
+    Timings:
+    - `parse`: whole parses, including the copy of the input
+    - `parse.copy`: copying the input schema
+    - `parse.handlers`: the `parse_type` handlers, which build the types
+    - `convert`: whole Arrow schema conversions
+    - `convert.fields`: time of each top-level field of a conversion, kept
+      by field name in `field_timings`
+    """
+
+    def __init__(self, callback: Callback | None = None) -> None:
+        self.callback = callback
+        self.counters: t.DefaultDict[str, int] = defaultdict(int)
+        self.timings: t.DefaultDict[str, float] = defaultdict(float)
+        self.field_timings: t.DefaultDict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to a counter."""
+        with self._lock:
+            self.counters[name] += value
+        if self.callback is not None:
+            self.callback("count", name, value)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add to a timing."""
+        with self._lock:
+            self.timings[name] += seconds
+        if self.callback is not None:
+            self.callback("time", name, seconds)
+
+    def add_field_time(self, field: str, seconds: float) -> None:
+        """Add to the conversion time of a top-level field."""
+        with self._lock:
+            self.field_timings[field] += seconds
+            self.timings["convert.fields"] += seconds
+        if self.callback is not None:
+            self.callback("time", f"convert.fields.{field}", seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> t.Iterator[None]:
+        """Time a block of code."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def snapshot(self) -> dict:
+        """Return a copy of the counters and timings."""
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "timings": dict(self.timings),
+                "field_timings": dict(self.field_timings),
+            }
+
+    def reset(self) -> None:
+        """Reset the counters and timings."""
+        with self._lock:
+            self.counters.clear()
+            self.timings.clear()
+            self.field_timings.clear()
+
+
+_active: Instrumentation | None = None
+
+
+def active() -> Instrumentation | None:
+    """Return the instrumentation that is on, if any."""
+    return _active
+
+
+def enable(callback: Callback | None = None) -> Instrumentation:
+    """Turn instrumentation on until `disable` is called."""
+    global _active
+    _active = Instrumentation(callback)
+    return _active
+
+
+def disable() -> None:
+    """Turn instrumentation off."""
+    global _active
+    _active = None
+
+
+@contextmanager
+def instrument(callback: Callback | None = None) -> t.Iterator[Instrumentation]:
+    """Turn instrumentation on for a block of code."""
+    global _active
+    previous = _active
+    _active = stats = Instrumentation(callback)
+    try:
+        yield stats
+    finally:
+        _active = previous
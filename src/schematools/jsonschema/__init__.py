@@ -1,7 +1,17 @@
 """JSON Schema tools for Python."""
 
-from .flatten import flatten
-from .parse import JSONSchemaParser
+from .cache import ParseCache, jsonschema_fingerprint
+from .diff import FieldChange, SchemaDiff, diff_schemas, is_widening
+from .flatten import RecordFlattener, flatten
+from .infer import SchemaInference, infer_schema
+from .intern import InternTable
+from .parse import (
+    JSONSchemaParser,
+    LazyProperties,
+    RecursiveRefError,
+    RefResolutionError,
+    RefResolver,
+)
 from .types import (
     ArrayType,
     BaseJSONType,
@@ -27,27 +37,42 @@ from .types import (
     URIType,
     UUIDType,
 )
+from .validate import ValidationError, compile_validator
 
 __all__ = [
     "ArrayType",
     "BaseJSONType",
     "BooleanType",
+    "compile_validator",
     "DateTimeType",
     "DateType",
+    "diff_schemas",
     "DurationType",
     "EmailType",
+    "FieldChange",
     "flatten",
     "HostnameType",
+    "infer_schema",
     "IntegerType",
+    "InternTable",
     "IPv4Type",
     "IPv6Type",
+    "is_widening",
     "JSONPointerType",
     "JSONSchema",
+    "jsonschema_fingerprint",
     "NullType",
     "NumberType",
     "ObjectType",
+    "ParseCache",
+    "RecordFlattener",
+    "RecursiveRefError",
+    "RefResolutionError",
+    "RefResolver",
     "RegexType",
     "RelativeJSONPointerType",
+    "SchemaDiff",
+    "SchemaInference",
     "StringType",
     "TimeType",
     "URIReferenceType",
@@ -55,4 +80,6 @@ __all__ = [
     "URIType",
     "UUIDType",
     "JSONSchemaParser",
+    "LazyProperties",
+    "ValidationError",
 ]
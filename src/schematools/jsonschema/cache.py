@@ -0,0 +1,88 @@
+"""Cache parsed JSON schemas."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import typing as t
+from collections import OrderedDict
+
+from schematools import instrumentation
+
+DEFAULT_MAXSIZE = 128
+
+
+def jsonschema_fingerprint(jsonschema: dict | str) -> str:
+    """Return a canonical fingerprint of a raw JSON schema.
+
+    Schemas that differ only in key order or whitespace share a fingerprint,
+    whether they are given as a dict or as a JSON string.
+    """
+    if isinstance(jsonschema, str):
+        jsonschema = json.loads(jsonschema)
+    canonical = json.dumps(
+        jsonschema, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ParseCache:
+    """Thread-safe LRU cache of parsed schemas, keyed by schema fingerprint.
+
+    The `name` prefixes the cache's counters in `schematools.instrumentation`.
+    """
+
+    def __init__(self, maxsize: int | None = None, name: str = "cache") -> None:
+        self.maxsize = maxsize if maxsize is not None else DEFAULT_MAXSIZE
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[t.Hashable, t.Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: t.Hashable) -> t.Any | None:
+        """Get a cached value, marking it as recently used."""
+        stats = instrumentation.active()
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                value = None
+            else:
+                self.hits += 1
+                value = self._entries[key]
+        if stats is not None:
+            stats.count(f"{self.name}.{'misses' if value is None else 'hits'}")
+        return value
+
+    def put(self, key: t.Hashable, value: t.Any) -> t.Any:
+        """Cache a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> dict:
+        """Return the cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
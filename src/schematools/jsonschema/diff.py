@@ -0,0 +1,110 @@
+"""Compare parsed JSON schemas field by field."""
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass, field
+
+from .types import (
+    ArrayType,
+    BaseJSONType,
+    IntegerType,
+    NullType,
+    NumberType,
+    ObjectType,
+    StringType,
+)
+
+
+@dataclass(frozen=True)
+class FieldChange:
+    """A field that differs between two schemas.
+
+    `path` joins nested property names with "." and ends in "[]" for array
+    items. `old` is None for added fields, `new` is None for removed ones.
+    """
+
+    path: str
+    old: BaseJSONType | None
+    new: BaseJSONType | None
+
+
+@dataclass
+class SchemaDiff:
+    """Fields added, removed, widened or otherwise changed by a new schema.
+
+    Widened fields accept every value they did before, such as integers that
+    became numbers; `changed` holds the fields whose type changed otherwise.
+    """
+
+    added: t.List[FieldChange] = field(default_factory=list)
+    removed: t.List[FieldChange] = field(default_factory=list)
+    widened: t.List[FieldChange] = field(default_factory=list)
+    changed: t.List[FieldChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.widened or self.changed)
+
+    def is_compatible(self) -> bool:
+        """Check if data of the old schema is valid for the new one.
+
+        Removed fields do not make a diff incompatible, as they can be kept
+        as columns of nulls.
+        """
+        return not self.changed
+
+
+def is_widening(old: BaseJSONType, new: BaseJSONType) -> bool:
+    """Check if a type change keeps every value of the old type valid."""
+    if isinstance(old, NullType):
+        return True
+    if isinstance(old, IntegerType):
+        return isinstance(new, NumberType)
+    # a string of any format is a string
+    return isinstance(old, StringType) and new.__class__ is StringType
+
+
+def diff_schemas(old: BaseJSONType, new: BaseJSONType) -> SchemaDiff:
+    """Compare two parsed schemas field by field.
+
+    Fields are compared by fingerprint first, so subtrees that did not change
+    are skipped however large they are, and the common case of a few added
+    fields costs little more than fingerprinting the new schema once.
+    Properties and items are compared without recursion. Changes of
+    annotations, such as descriptions, are not reported.
+    """
+    result = SchemaDiff()
+    stack: t.List[t.Tuple[str, BaseJSONType, BaseJSONType]] = [("", old, new)]
+    while stack:
+        path, old_type, new_type = stack.pop()
+        if old_type is new_type or old_type.fingerprint() == new_type.fingerprint():
+            continue
+        if isinstance(old_type, ObjectType) and isinstance(new_type, ObjectType):
+            old_properties = old_type.properties or {}
+            new_properties = new_type.properties or {}
+            prefix = f"{path}." if path else ""
+            for name, value in new_properties.items():
+                if name not in old_properties:
+                    result.added.append(FieldChange(prefix + name, None, value))
+            common = []
+            for name, value in old_properties.items():
+                if name in new_properties:
+                    common.append((prefix + name, value, new_properties[name]))
+                else:
+                    result.removed.append(FieldChange(prefix + name, value, None))
+            # pushed in reverse, so fields are reported in schema order
+            stack.extend(reversed(common))
+        elif isinstance(old_type, ArrayType) and isinstance(new_type, ArrayType):
+            if old_type.items is not None and new_type.items is not None:
+                stack.append((f"{path}[]", old_type.items, new_type.items))
+            elif old_type.items is not None or new_type.items is not None:
+                result.changed.append(
+                    FieldChange(f"{path}[]", old_type.items, new_type.items)
+                )
+        elif old_type.__class__ is new_type.__class__:
+            continue
+        elif is_widening(old_type, new_type):
+            result.widened.append(FieldChange(path, old_type, new_type))
+        else:
+            result.changed.append(FieldChange(path, old_type, new_type))
+    return result
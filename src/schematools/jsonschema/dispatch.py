@@ -0,0 +1,76 @@
+"""Flat dispatch tables resolved from singledispatch registries."""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+
+from .types import BaseJSONType
+
+Handler = t.Callable[..., t.Any]
+
+
+class Dispatcher(t.Protocol):
+    """The part of a singledispatch function a `DispatchTable` relies on."""
+
+    registry: t.Mapping[type, Handler]
+
+    def dispatch(self, cls: type) -> Handler: ...
+
+
+def _subclasses(cls: type) -> t.List[type]:
+    classes = [cls]
+    for subclass in cls.__subclasses__():
+        classes.extend(_subclasses(subclass))
+    return classes
+
+
+class DispatchTable:
+    """Map from each JSON type class to its handler in a singledispatch registry.
+
+    The registry is resolved once into a flat dict for `BaseJSONType` and all
+    of its subclasses, such as the `StringType` format subclasses, so each
+    node costs a single dict lookup instead of a dispatch. Handlers registered
+    later are still picked up: the table is rebuilt whenever `handlers()`
+    finds the registry changed.
+    """
+
+    def __init__(self, dispatcher: Dispatcher) -> None:
+        self._dispatcher = dispatcher
+        self._registered: t.Dict[type, Handler] | None = None
+        self._handlers: t.Dict[type, Handler] = {}
+        self._lock = threading.Lock()
+
+    def handlers(self) -> t.Dict[type, Handler]:
+        """Return the table, rebuilding it first if the registry changed.
+
+        The table is shared and must only be read. Classes missing from it,
+        such as classes defined after it was built, are added by `resolve`.
+        """
+        if self._registered != self._dispatcher.registry:
+            with self._lock:
+                # another thread may have rebuilt it while this one waited
+                if self._registered != self._dispatcher.registry:
+                    registered = dict(self._dispatcher.registry)
+                    self._handlers = {
+                        cls: self._dispatcher.dispatch(cls)
+                        for cls in _subclasses(BaseJSONType)
+                    }
+                    self._registered = registered
+        return self._handlers
+
+    def resolve(self, cls: type) -> Handler:
+        """Return the handler of a class, adding it to the table if missing.
+
+        The class is added to a copy of the table, as tables already returned
+        by `handlers()` may be being read, and only if the table was not
+        rebuilt in the meantime.
+        """
+        handlers = self.handlers()
+        handler = handlers.get(cls)
+        if handler is None:
+            with self._lock:
+                handler = self._dispatcher.dispatch(cls)
+                if self._handlers is handlers:
+                    self._handlers = {**handlers, cls: handler}
+        return handler
@@ -1,12 +1,51 @@
 """Flatten JSON schema."""
 
 import dataclasses
+import typing as t
 
+from schematools.jsonschema.traverse import transform
 from schematools.jsonschema.types import BaseJSONType, ObjectType
 
 DEFAULT_MAX_DEPTH = 10
 DEFAULT_SEPARATOR = "__"
 
+Path = t.Tuple[str, ...]
+
+
+def flattened_paths(
+    jsonschema: ObjectType, max_depth: int
+) -> t.List[t.Tuple[Path, BaseJSONType]]:
+    """Return the key path and type of each property of a flattened object.
+
+    This is the single source of the depth rules used by `flatten` and
+    `RecordFlattener`, so flattened schemas and records always agree.
+    """
+
+    def children(node: t.Tuple[ObjectType, int, Path]) -> list | None:
+        # nested objects are flattened into the parent up to the depth limit
+        jsontype, depth, prefix = node
+        if depth <= 0:
+            return None
+        return [
+            (key, (value, depth - 2, (*prefix, key)))
+            for key, value in jsontype.properties.items()
+            if isinstance(value, ObjectType) and value.has_properties()
+        ]
+
+    def build(
+        node: t.Tuple[ObjectType, int, Path], nested: t.Mapping[str, list]
+    ) -> t.List[t.Tuple[Path, BaseJSONType]]:
+        jsontype, _, prefix = node
+        paths = []
+        for key, value in jsontype.properties.items():
+            if key in nested:
+                paths.extend(nested[key])
+            else:
+                paths.append(((*prefix, key), value))
+        return paths
+
+    return transform((jsonschema, max_depth, ()), children, build)
+
 
 def flatten(
     jsonschema: BaseJSONType, max_depth: int | None = None, separator: str | None = None
@@ -19,21 +58,76 @@ def flatten(
         return jsonschema
 
     if isinstance(jsonschema, ObjectType) and jsonschema.has_properties():
-        flattened_properties = {}
-        max_depth -= 1  # first level of flattening is here
-        for key, value in jsonschema.properties.items():
-            if isinstance(value, ObjectType) and value.has_properties():
-                flattened_properties.update(
-                    {
-                        f"{key}{separator}{k}": v
-                        for k, v in flatten(
-                            value, max_depth - 1, separator
-                        ).properties.items()
-                    }
-                )
-            else:
-                flattened_properties[key] = value
-
+        flattened_properties = {
+            separator.join(path): value
+            for path, value in flattened_paths(jsonschema, max_depth)
+        }
         return dataclasses.replace(jsonschema, properties=flattened_properties)
 
     return jsonschema
+
+
+# Stand-in for nested values that are missing or not objects.
+_EMPTY: dict = {}
+
+
+class RecordFlattener:
+    """Flatten records to match a schema flattened with `flatten`.
+
+    The key paths are resolved once from the schema and compiled into a single
+    function that builds each flattened record in one dict literal. Every key
+    of the flattened schema is present in the output; missing values are
+    `None`, and keys not described by the schema are dropped.
+    """
+
+    def __init__(
+        self,
+        jsonschema: BaseJSONType,
+        max_depth: int | None = None,
+        separator: str | None = None,
+    ) -> None:
+        max_depth = max_depth if max_depth is not None else DEFAULT_MAX_DEPTH
+        separator = separator if separator is not None else DEFAULT_SEPARATOR
+        if (
+            max_depth <= 0
+            or not isinstance(jsonschema, ObjectType)
+            or not jsonschema.has_properties()
+        ):
+            # flatten() leaves these schemas as they are
+            self.paths: t.List[t.Tuple[str, Path]] = []
+            self._flatten = lambda record: record
+            return
+        self.paths = [
+            (separator.join(path), path)
+            for path, _ in flattened_paths(jsonschema, max_depth)
+        ]
+        self._flatten = _compile(self.paths)
+
+    def __call__(self, record: dict) -> dict:
+        """Flatten a single record."""
+        return self._flatten(record)
+
+    def flatten_records(self, records: t.Iterable[dict]) -> t.Iterator[dict]:
+        """Flatten a stream of records."""
+        return map(self._flatten, records)
+
+
+def _compile(paths: t.List[t.Tuple[str, Path]]) -> t.Callable[[dict], dict]:
+    """Generate a function that reads each path of a record into a flat dict."""
+    lines = ["def flatten_record(record):"]
+    names: t.Dict[Path, str] = {(): "record"}
+
+    def parent(path: Path) -> str:
+        # bind each nested object to a local once, however many paths share it
+        if path not in names:
+            name = f"v{len(names)}"
+            lines.append(f"    {name} = {parent(path[:-1])}.get({path[-1]!r})")
+            lines.append(f"    if not isinstance({name}, dict): {name} = _EMPTY")
+            names[path] = name
+        return names[path]
+
+    items = [f"{key!r}: {parent(path[:-1])}.get({path[-1]!r})" for key, path in paths]
+    lines.append(f"    return {{{', '.join(items)}}}")
+    namespace = {"_EMPTY": _EMPTY}
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["flatten_record"]
@@ -0,0 +1,404 @@
+"""Infer JSON types from streams of sample records."""
+
+from __future__ import annotations
+
+import ipaddress
+import random
+import re
+import typing as t
+from datetime import date
+
+from .traverse import ITEMS, transform
+from .types import (
+    ArrayType,
+    BaseJSONType,
+    BooleanType,
+    IntegerType,
+    NullType,
+    NumberType,
+    ObjectType,
+    StringType,
+    string_format_map,
+)
+
+DEFAULT_MAX_PROPERTIES = 1000
+
+# JSON kinds of Python values, as decoded by `json`.
+_kinds: t.Dict[type, str] = {
+    dict: "object",
+    list: "array",
+    str: "string",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    type(None): "null",
+}
+
+# Order of the kinds in the type lists of mixed values.
+_kind_order = ("object", "array", "string", "number", "integer", "boolean", "null")
+
+_type_classes: t.Dict[str, t.Type[BaseJSONType]] = {
+    "object": ObjectType,
+    "array": ArrayType,
+    "string": StringType,
+    "number": NumberType,
+    "integer": IntegerType,
+    "boolean": BooleanType,
+}
+
+_date = re.compile(r"\d{4}-\d\d-\d\d\Z")
+_date_time = re.compile(
+    r"(\d{4}-\d\d-\d\d)[Tt]\d\d:\d\d:\d\d(\.\d+)?([Zz]|[+-]\d\d:\d\d)\Z"
+)
+_time = re.compile(r"\d\d:\d\d:\d\d(\.\d+)?([Zz]|[+-]\d\d:\d\d)\Z")
+_duration = re.compile(
+    r"P(?!\Z)(\d+Y)?(\d+M)?(\d+W)?(\d+D)?(T(?=\d)(\d+H)?(\d+M)?(\d+S)?)?\Z"
+)
+_uuid = re.compile(r"[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}\Z")
+_octet = r"(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
+_ipv4 = re.compile(rf"{_octet}(\.{_octet}){{3}}\Z")
+_email = re.compile(r"[^@\s]+@[^@\s.]+(\.[^@\s.]+)+\Z")
+_uri = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:\S+\Z")
+
+
+_Format = t.Tuple[str, t.Callable[[str], bool]]
+
+
+def _is_date(value: str) -> bool:
+    if len(value) != 10 or value[4] != "-" or not _date.match(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_date_time(value: str) -> bool:
+    if len(value) < 20 or value[10] not in "Tt":
+        return False
+    match = _date_time.match(value)
+    return match is not None and _is_date(match.group(1))
+
+
+def _is_time(value: str) -> bool:
+    return len(value) >= 9 and value[2] == ":" and _time.match(value) is not None
+
+
+def _is_duration(value: str) -> bool:
+    return value[:1] == "P" and _duration.match(value) is not None
+
+
+def _is_uuid(value: str) -> bool:
+    return len(value) == 36 and value[8] == "-" and _uuid.match(value) is not None
+
+
+def _is_ipv4(value: str) -> bool:
+    return (
+        7 <= len(value) <= 15 and value[:1].isdigit() and _ipv4.match(value) is not None
+    )
+
+
+def _is_ipv6(value: str) -> bool:
+    if not 2 <= len(value) <= 45 or ":" not in value:
+        return False
+    try:
+        ipaddress.IPv6Address(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_email(value: str) -> bool:
+    return "@" in value and _email.match(value) is not None
+
+
+def _is_uri(value: str) -> bool:
+    return ":" in value and _uri.match(value) is not None
+
+
+# Formats that can be inferred, most specific first, each checked by a cheap
+# test of length or separators before the full one. Formats that most plain
+# strings have, such as hostnames, are never inferred.
+_formats: t.Tuple[_Format, ...] = (
+    ("date-time", _is_date_time),
+    ("date", _is_date),
+    ("time", _is_time),
+    ("duration", _is_duration),
+    ("uuid", _is_uuid),
+    ("ipv4", _is_ipv4),
+    ("ipv6", _is_ipv6),
+    ("email", _is_email),
+    ("uri", _is_uri),
+)
+
+
+class _Node:
+    """What is known of the values at one place in the records."""
+
+    __slots__ = ("kinds", "properties", "items", "formats", "open")
+
+    def __init__(self) -> None:
+        # number of values of each JSON kind
+        self.kinds: t.Dict[str, int] = {}
+        self.properties: t.Dict[str, _Node] | None = None
+        self.items: _Node | None = None
+        # formats of every string so far, or None before the first string
+        self.formats: t.Tuple[_Format, ...] | None = None
+        # whether objects had more properties than are kept
+        self.open = False
+
+    def count(self) -> int:
+        return sum(self.kinds.values())
+
+
+class SchemaInference:
+    """Infer the JSON type of a stream of records.
+
+    Records are folded one at a time into counts of the kinds of values at
+    each property and array item, so memory use depends on the number of
+    distinct properties, not of records; objects keep at most
+    `max_properties` properties, and are left open to more. Strings are
+    checked only for the formats every earlier string at the same place had,
+    so strings without a format cost a few cheap tests once.
+
+    With `sample_size`, a uniform sample of that many records is kept by
+    reservoir sampling, seeded by `seed`, and only the sample is inferred.
+
+    Inferences of separate parts of a stream can be combined with `merge`,
+    so they can be made in parallel.
+    """
+
+    def __init__(
+        self,
+        sample_size: int | None = None,
+        seed: int | None = None,
+        max_properties: int | None = None,
+    ) -> None:
+        self.count = 0
+        self.sample_size = sample_size
+        self.max_properties = max_properties or DEFAULT_MAX_PROPERTIES
+        self._root = _Node()
+        self._sample: t.List[t.Any] | None = [] if sample_size else None
+        self._random = random.Random(seed)
+
+    def add(self, record: t.Any) -> None:
+        """Add a record to the inference."""
+        self.count += 1
+        sample = self._sample
+        if sample is None:
+            self._fold(record, self._root)
+        elif len(sample) < t.cast(int, self.sample_size):
+            sample.append(record)
+        else:
+            index = self._random.randrange(self.count)
+            if index < len(sample):
+                sample[index] = record
+
+    def update(self, records: t.Iterable[t.Any]) -> None:
+        """Add records to the inference."""
+        for record in records:
+            self.add(record)
+
+    def merge(self, other: SchemaInference) -> SchemaInference:
+        """Add what another inference has seen to this one, and return it.
+
+        Merging is associative, so inferences of the shards of a stream can
+        be merged in any grouping. Sampled inferences can only be merged with
+        sampled inferences of the same sample size.
+        """
+        if self.sample_size != other.sample_size:
+            raise ValueError(
+                f"Cannot merge inferences of sample sizes {self.sample_size} "
+                f"and {other.sample_size}."
+            )
+        if self._sample is not None and other._sample is not None:
+            self._sample = _merge_samples(
+                self._sample,
+                self.count,
+                other._sample,
+                other.count,
+                t.cast(int, self.sample_size),
+                self._random,
+            )
+        else:
+            self._merge(self._root, other._root)
+        self.count += other.count
+        return self
+
+    def to_type(self) -> BaseJSONType:
+        """Return the JSON type of the records added so far.
+
+        Values of a single kind give that type, such as `StringType` or a
+        type of `string_format_map` if every string had its format, and
+        integers mixed with other numbers give `NumberType`. Types of values
+        that were sometimes null are nullable, like `["string", "null"]`.
+        Properties are required if every object had them. Values of other
+        mixed kinds give a `BaseJSONType` of their list of types.
+        """
+        root = self._root
+        if self._sample is not None:
+            root = _Node()
+            for record in self._sample:
+                self._fold(record, root)
+        return transform(root, _children, _build)
+
+    def _fold(self, record: t.Any, root: _Node) -> None:
+        max_properties = self.max_properties
+        stack = [(root, record)]
+        while stack:
+            node, value = stack.pop()
+            kind = _kinds.get(type(value)) or _kind(value)
+            kinds = node.kinds
+            kinds[kind] = kinds.get(kind, 0) + 1
+            if kind == "string":
+                formats = node.formats
+                if formats is None:
+                    formats = _formats
+                if len(formats) == 1:
+                    # the common case, checked without building a new tuple
+                    if not formats[0][1](value):
+                        node.formats = ()
+                elif formats:
+                    node.formats = tuple(f for f in formats if f[1](value))
+            elif kind == "object":
+                properties = node.properties
+                if properties is None:
+                    properties = node.properties = {}
+                for name, item in value.items():
+                    child = properties.get(name)
+                    if child is None:
+                        if len(properties) >= max_properties:
+                            node.open = True
+                            continue
+                        child = properties[name] = _Node()
+                    stack.append((child, item))
+            elif kind == "array":
+                items = node.items
+                if items is None:
+                    items = node.items = _Node()
+                stack.extend((items, item) for item in value)
+
+    def _merge(self, root: _Node, other_root: _Node) -> None:
+        max_properties = self.max_properties
+        stack = [(root, other_root)]
+        while stack:
+            node, other = stack.pop()
+            kinds = node.kinds
+            for kind, count in other.kinds.items():
+                kinds[kind] = kinds.get(kind, 0) + count
+            if other.formats is not None:
+                if node.formats is None:
+                    node.formats = other.formats
+                else:
+                    node.formats = tuple(f for f in node.formats if f in other.formats)
+            node.open = node.open or other.open
+            if other.properties is not None:
+                properties = node.properties
+                if properties is None:
+                    properties = node.properties = {}
+                for name, other_child in other.properties.items():
+                    child = properties.get(name)
+                    if child is None:
+                        if len(properties) >= max_properties:
+                            node.open = True
+                            continue
+                        child = properties[name] = _Node()
+                    stack.append((child, other_child))
+            if other.items is not None:
+                if node.items is None:
+                    node.items = _Node()
+                stack.append((node.items, other.items))
+
+
+def _kind(value: t.Any) -> str:
+    """Return the JSON kind of an instance of a subclass of a JSON value type."""
+    for cls, kind in _kinds.items():
+        if isinstance(value, cls):
+            return kind
+    raise TypeError(f"{type(value).__name__} is not a JSON value.")
+
+
+def _merge_samples(
+    sample: t.List[t.Any],
+    count: int,
+    other: t.List[t.Any],
+    other_count: int,
+    size: int,
+    rng: random.Random,
+) -> t.List[t.Any]:
+    """Draw a sample of a stream from the samples of its two parts.
+
+    Each record of a sample stands for `count / len(sample)` records of its
+    part, so records are drawn from each part in proportion to its size.
+    """
+    sample = sample[:]
+    other = other[:]
+    rng.shuffle(sample)
+    rng.shuffle(other)
+    weight, other_weight = float(count), float(other_count)
+    merged: t.List[t.Any] = []
+    while len(merged) < size and (sample or other):
+        if sample and (not other or rng.random() * (weight + other_weight) < weight):
+            weight -= weight / len(sample)
+            merged.append(sample.pop())
+        else:
+            other_weight -= other_weight / len(other)
+            merged.append(other.pop())
+    return merged
+
+
+def _children(node: _Node) -> t.List[t.Tuple[t.Hashable, _Node]] | None:
+    pairs: t.List[t.Tuple[t.Hashable, _Node]] = []
+    if node.properties:
+        pairs.extend(node.properties.items())
+    # arrays that were all empty have no items schema
+    if node.items is not None and node.items.kinds:
+        pairs.append((ITEMS, node.items))
+    return pairs
+
+
+def _build(node: _Node, children: t.Mapping[t.Hashable, BaseJSONType]) -> BaseJSONType:
+    kinds = [kind for kind in _kind_order if kind in node.kinds]
+    if "number" in kinds and "integer" in kinds:
+        kinds.remove("integer")
+    nullable = "null" in kinds
+    if nullable:
+        kinds.remove("null")
+    if not kinds:
+        return NullType() if nullable else BaseJSONType()
+    if len(kinds) > 1:
+        return BaseJSONType(type=kinds + ["null"] if nullable else kinds)
+    kind = kinds[0]
+    json_type: str | t.List[str] = [kind, "null"] if nullable else kind
+    if kind == "object":
+        properties = node.properties or {}
+        objects = node.kinds["object"]
+        required = [
+            name for name, child in properties.items() if child.count() == objects
+        ]
+        return ObjectType(
+            type=json_type,
+            properties={name: children[name] for name in properties} or None,
+            required=required or None,
+            additionalProperties=True if node.open else None,
+        )
+    if kind == "array":
+        return ArrayType(type=json_type, items=children.get(ITEMS))
+    if kind == "string" and node.formats:
+        return string_format_map[node.formats[0][0]](type=json_type)
+    return _type_classes[kind](type=json_type)
+
+
+def infer_schema(
+    records: t.Iterable[t.Any],
+    sample_size: int | None = None,
+    seed: int | None = None,
+) -> BaseJSONType:
+    """Infer the JSON type of records, or of a sample of them.
+
+    See `SchemaInference`.
+    """
+    inference = SchemaInference(sample_size=sample_size, seed=seed)
+    inference.update(records)
+    return inference.to_type()
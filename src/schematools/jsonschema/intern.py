@@ -0,0 +1,47 @@
+"""Intern structurally identical JSON types."""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+
+from .types import BaseJSONType
+
+JSONType = t.TypeVar("JSONType", bound=BaseJSONType)
+
+
+class InternTable:
+    """Table mapping each distinct JSON type structure to one shared instance.
+
+    Nodes are interned bottom-up by the parser, so by the time a node is
+    looked up its children are already canonical and comparing it against the
+    table entry reduces to identity checks on the children.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._table: t.Dict[BaseJSONType, BaseJSONType] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, jsontype: object) -> bool:
+        return jsontype in self._table
+
+    def intern(self, jsontype: JSONType) -> JSONType:
+        """Return the canonical instance structurally equal to `jsontype`."""
+        with self._lock:
+            canonical = self._table.setdefault(jsontype, jsontype)
+            if canonical is jsontype:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return canonical
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._table.clear()
+            self.hits = self.misses = 0
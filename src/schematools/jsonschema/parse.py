@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
 import json
+import time
 import typing as t
+from collections.abc import Mapping
+from contextvars import ContextVar
 from copy import deepcopy
+from urllib.parse import unquote
 
 from class_singledispatch import class_singledispatch
 
+from schematools import instrumentation
+
+from .cache import ParseCache, jsonschema_fingerprint
+from .dispatch import DispatchTable
+from .intern import InternTable
+from .traverse import ITEMS, transform
 from .types import (
     ArrayType,
     BaseJSONType,
@@ -29,15 +41,396 @@ json_schema_root_type_map = {
 }
 
 
+# JSON Schema keywords whose dataclass field names differ from the keyword.
+_special_keys = {
+    "$id": "id",
+    "$schema": "schema",
+    "$comment": "comment",
+    "if": "if_",
+    "not": "not_",
+    "else": "else_",
+}
+
+
+# Keywords consumed by the parser rather than stored on the types.
+_resolver_keys = {"$defs", "definitions"}
+_handled_keys = frozenset(_special_keys).union(_resolver_keys)
+
+
 def _handle_special_keys(jsonschema: dict) -> dict:
-    for key in list(jsonschema.keys()):
-        if key in ["$id", "$schema", "$comment"]:
-            value = jsonschema.pop(key)
-            jsonschema[key.lstrip("$")] = value
-        if key in ["if", "not", "else"]:
-            value = jsonschema.pop(key)
-            jsonschema[key + "_"] = value
-    return jsonschema
+    """Rename special keywords to their dataclass field names.
+
+    The input is never modified. It is returned as-is when nothing needs
+    renaming, otherwise a shallow copy with the renamed keys is returned.
+    """
+    if _handled_keys.isdisjoint(jsonschema):
+        return jsonschema
+    return {
+        _special_keys.get(k, k): v
+        for k, v in jsonschema.items()
+        if k not in _resolver_keys
+    }
+
+
+class RefResolutionError(ValueError):
+    """Raised when a `$ref` cannot be resolved."""
+
+
+class RecursiveRefError(RefResolutionError):
+    """Raised when a `$ref` refers to a schema that contains itself."""
+
+
+# The resolver in use and the references it is resolving, outermost first.
+_resolving: ContextVar[t.Tuple[RefResolver | None, t.Tuple[str, ...]]] = ContextVar(
+    "resolving", default=(None, ())
+)
+
+
+class RefResolver:
+    """Resolve local `$ref`s (`#/$defs/...`, `#/definitions/...`) of a schema.
+
+    Each referenced schema is parsed once, and the resulting type instance is
+    shared by every reference to it. The references being resolved are kept
+    per thread and task, so one resolver can be used from many threads.
+
+    With `lazy=True`, the types a reference resolves to are shared before
+    their properties are parsed, so recursion cannot be seen while they are
+    parsed. Each reference is instead checked before it is first resolved, by
+    following the references nested in the raw schemas it leads to.
+    """
+
+    def __init__(self, root: dict, lazy: bool = False) -> None:
+        self.root = root
+        self.lazy = lazy
+        self._resolved: t.Dict[str, BaseJSONType] = {}
+        # references checked not to lead back to themselves or the root
+        self._acyclic: t.Set[str] = set()
+
+    def resolve(self, ref: str) -> BaseJSONType:
+        """Return the parsed schema a reference points to."""
+        resolved = self._resolved.get(ref)
+        if resolved is not None:
+            return resolved
+        resolver, resolving = _resolving.get()
+        if resolver is not self:
+            # the root is in progress for as long as the resolver is in use
+            resolving = ("#",)
+        if ref in resolving:
+            chain = " -> ".join([*resolving[resolving.index(ref) :], ref])
+            raise RecursiveRefError(f"Recursive reference: {chain}")
+        target = self._lookup(ref)
+        if self.lazy and ref not in self._acyclic:
+            self._check_recursion(ref, target, resolving)
+        token = _resolving.set((self, (*resolving, ref)))
+        try:
+            resolved = parse_subschema(target)
+        finally:
+            _resolving.reset(token)
+        self._resolved[ref] = resolved
+        return resolved
+
+    def _check_recursion(
+        self, ref: str, target: dict, resolving: t.Tuple[str, ...]
+    ) -> None:
+        """Raise if parsing `target` would resolve `ref` or one of `resolving`.
+
+        The references nested in `target` are followed depth first, with an
+        explicit stack. References that cannot be looked up are left for
+        `resolve` to report when they are read.
+        """
+        path = [*resolving, ref]
+        # (reference, the references nested in its schema not followed yet)
+        stack = [(ref, iter(_nested_refs(target)))]
+        while stack:
+            current, nested = stack[-1]
+            for nested_ref in nested:
+                if nested_ref in path:
+                    chain = " -> ".join([*path[path.index(nested_ref) :], nested_ref])
+                    raise RecursiveRefError(f"Recursive reference: {chain}")
+                if nested_ref in self._acyclic:
+                    continue
+                try:
+                    nested_target = self._lookup(nested_ref)
+                except RefResolutionError:
+                    continue
+                path.append(nested_ref)
+                stack.append((nested_ref, iter(_nested_refs(nested_target))))
+                break
+            else:
+                stack.pop()
+                path.pop()
+                self._acyclic.add(current)
+
+    def _lookup(self, ref: str) -> dict:
+        if not ref.startswith("#"):
+            raise RefResolutionError(f"Only local references are supported: {ref}")
+        target: t.Any = self.root
+        pointer = unquote(ref[1:])
+        for token in pointer.split("/")[1:] if pointer else []:
+            token = token.replace("~1", "/").replace("~0", "~")
+            try:
+                target = target[int(token) if isinstance(target, list) else token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise RefResolutionError(f"Unresolvable reference: {ref}") from None
+        if not isinstance(target, dict):
+            raise RefResolutionError(f"Reference is not a schema: {ref}")
+        return target
+
+
+def _nested_refs(jsonschema: dict) -> t.List[str]:
+    """Return the `$ref`s resolved when a raw schema and its nested properties
+    and items are parsed, without following them.
+
+    Only the nested schemas of the built-in object and array types are
+    searched, as other handlers parse their nested schemas themselves.
+    """
+    refs = []
+    stack = [jsonschema]
+    while stack:
+        schema = stack.pop()
+        ref = schema.get("$ref")
+        if ref is not None:
+            refs.append(ref)
+            continue
+        try:
+            handler = _parse_dispatch.resolve(_type_class(schema.get("type")))
+        except (KeyError, TypeError, NotImplementedError):
+            continue
+        if handler not in _tree_parsers:
+            continue
+        properties = schema.get("properties")
+        if isinstance(properties, dict):
+            stack.extend(v for v in properties.values() if isinstance(v, dict))
+        item_type = schema.get("items")
+        if isinstance(item_type, dict):
+            stack.append(item_type)
+    return refs
+
+
+@dataclasses.dataclass
+class _ParseContext:
+    """State of a `JSONSchemaParser.parse` call, shared by nested parse calls."""
+
+    resolver: RefResolver
+    intern_table: InternTable | None = None
+    lazy: bool = False
+    # copy the schema of each lazy property when it is first read
+    copy_properties: bool = False
+
+
+# Keywords kept next to a `$ref`, by their dataclass field names.
+_annotation_keys = frozenset(
+    {
+        "title",
+        "description",
+        "default",
+        "examples",
+        "readOnly",
+        "writeOnly",
+        "deprecated",
+        "comment",
+    }
+)
+
+_context: ContextVar[_ParseContext | None] = ContextVar("context", default=None)
+
+
+def _parse_ref(jsonschema: dict, context: _ParseContext | None) -> BaseJSONType:
+    if context is None:
+        raise RefResolutionError(f"No resolver for reference: {jsonschema['$ref']}")
+    resolved = context.resolver.resolve(jsonschema["$ref"])
+    if len(jsonschema) == 1:
+        return resolved
+    # annotations next to a $ref (e.g. a description) apply to this use only;
+    # other keywords, which would need parsing, are ignored
+    siblings = {
+        k: v
+        for k, v in _handle_special_keys(jsonschema).items()
+        if k in _annotation_keys
+    }
+    return dataclasses.replace(resolved, **siblings) if siblings else resolved
+
+
+def _type_class(json_type: str | t.List[str] | None) -> t.Type[BaseJSONType]:
+    if isinstance(json_type, list):
+        # nullable types such as ["string", "null"] parse as their non-null type
+        non_null = [name for name in json_type if name != "null"]
+        if len(non_null) > 1:
+            raise NotImplementedError(f"Parsing of type {json_type} is not supported.")
+        json_type = non_null[0] if non_null else "null"
+    return json_schema_root_type_map[json_type]
+
+
+# Values shared rather than copied by `_copy_schema`.
+_immutable_types = (str, int, float, bool, type(None))
+
+
+def _copy_schema(jsonschema: dict) -> dict:
+    """Deep-copy a raw schema with an explicit stack rather than by recursion."""
+
+    def children(value: t.Any) -> list | None:
+        if isinstance(value, dict):
+            return list(value.items())
+        if isinstance(value, list):
+            return list(enumerate(value))
+        return None
+
+    def build(value: t.Any, copies: t.Mapping) -> t.Any:
+        if isinstance(value, dict):
+            return {k: copies[k] for k in value}
+        if isinstance(value, list):
+            return [copies[i] for i in range(len(value))]
+        if isinstance(value, _immutable_types):
+            return value
+        return deepcopy(value)
+
+    return transform(jsonschema, children, build)
+
+
+def _copy_lazily(jsonschema: dict) -> dict:
+    """Copy a raw schema, except the schemas of its properties.
+
+    The properties are left to `LazyProperties` to copy as they are read.
+    """
+    properties = jsonschema.get("properties")
+    if not isinstance(properties, dict):
+        return _copy_schema(jsonschema)
+    copied = _copy_schema({k: v for k, v in jsonschema.items() if k != "properties"})
+    return {k: dict(properties) if k == "properties" else copied[k] for k in jsonschema}
+
+
+def _instrumented_handler(
+    handler: t.Callable, stats: instrumentation.Instrumentation
+) -> t.Callable:
+    @functools.wraps(handler)
+    def timed_handler(jsontype: t.Type[BaseJSONType], jsonschema: dict) -> t.Any:
+        start = time.perf_counter()
+        parsed = handler(jsontype, jsonschema)
+        stats.add_time("parse.handlers", time.perf_counter() - start)
+        stats.count(f"parse.nodes.{type(parsed).__name__}")
+        return parsed
+
+    return timed_handler
+
+
+def _parse_tree(jsonschema: dict, context: _ParseContext | None) -> BaseJSONType:
+    """Parse a schema, parsing its nested properties and items first.
+
+    Only the built-in object and array handlers are handed their nested
+    schemas parsed. Handlers registered with `parse_type` receive the schema
+    as it is, and parse its nested schemas themselves.
+    """
+    stats = instrumentation.active()
+    lazy = context is not None and context.lazy
+    intern_table = context.intern_table if context is not None else None
+    # type name -> (type class, parse_type handler), looked up once per tree
+    handlers: t.Dict[str | None, t.Tuple[type, t.Callable]] = {}
+
+    def lookup(json_type: str | t.List[str] | None) -> t.Tuple[type, t.Callable]:
+        try:
+            return handlers[json_type]
+        except (KeyError, TypeError):  # type lists are not hashable
+            jsontype = _type_class(json_type)
+            handler = _parse_dispatch.resolve(jsontype)
+            if stats is not None:
+                stats.count("parse.dispatch")
+                handler = _instrumented_handler(handler, stats)
+            if not isinstance(json_type, list):
+                handlers[json_type] = jsontype, handler
+            return jsontype, handler
+
+    def children(schema: dict) -> t.List[t.Tuple[t.Hashable, dict]] | None:
+        if "$ref" in schema:
+            return None
+        pairs = None
+        properties = schema.get("properties")
+        if properties and not lazy:
+            pairs = list(properties.items())
+        item_type = schema.get("items")
+        if item_type and isinstance(item_type, dict):
+            pairs = [*(pairs or ()), (ITEMS, item_type)]
+        if pairs:
+            handler = lookup(schema.get("type"))[1]
+            if getattr(handler, "__wrapped__", handler) not in _tree_parsers:
+                return None
+        return pairs
+
+    def build(
+        schema: dict, parsed_children: t.Mapping[t.Hashable, BaseJSONType]
+    ) -> BaseJSONType:
+        if "$ref" in schema:
+            parsed = _parse_ref(schema, context)
+            if stats is not None:
+                stats.count("parse.refs")
+        else:
+            if parsed_children:
+                # hand the handlers their nested schemas already parsed
+                schema = dict(schema)
+                if ITEMS in parsed_children:
+                    schema["items"] = parsed_children[ITEMS]
+                if "properties" in schema and not lazy:
+                    schema["properties"] = {
+                        k: parsed_children[k] for k in schema["properties"]
+                    }
+            jsontype, handler = lookup(schema.get("type"))
+            parsed = handler(jsontype, schema)
+        if intern_table is not None:
+            parsed = intern_table.intern(parsed)
+        return parsed
+
+    return transform(jsonschema, children, build)
+
+
+def parse_subschema(jsonschema: dict) -> BaseJSONType:
+    """Parse a schema nested in the one being parsed, resolving `$ref`s.
+
+    Nested properties and items are parsed with an explicit stack rather than
+    by recursion, so the depth of a schema is not limited by the recursion
+    limit.
+    """
+    return _parse_tree(jsonschema, _context.get())
+
+
+class LazyProperties(Mapping):
+    """Properties of an object that are parsed the first time they are read.
+
+    Reading a property parses only that property's schema, and the result is
+    kept for later reads. Iterating over the items, comparing or hashing
+    parses all of them.
+    """
+
+    def __init__(self, properties: dict, context: _ParseContext) -> None:
+        self._properties = properties
+        self._context = context
+        self._parsed: t.Dict[str, BaseJSONType] = {}
+
+    def __getitem__(self, key: str) -> BaseJSONType:
+        parsed = self._parsed.get(key)
+        if parsed is None:
+            jsonschema = self._properties[key]
+            if self._context.copy_properties:
+                jsonschema = _copy_lazily(jsonschema)
+            token = _context.set(self._context)
+            try:
+                parsed = self._parsed[key] = parse_subschema(jsonschema)
+            finally:
+                _context.reset(token)
+        return parsed
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._properties)
+
+    def __len__(self) -> int:
+        return len(self._properties)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._properties
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._properties)!r})"
+
+    def __reduce__(self) -> t.Tuple[type, t.Tuple[dict]]:
+        return dict, (dict(self.items()),)
 
 
 @class_singledispatch
@@ -45,67 +438,171 @@ def parse_type(jsontype: t.Type[BaseJSONType], jsonschema: dict | None = None) -
     raise NotImplementedError(f"Parsing of {jsontype} is not supported.")
 
 
+_parse_dispatch = DispatchTable(parse_type)
+
+
 @parse_type.register
 def parse_array(
     jsontype: t.Type[ArrayType], jsonschema: dict | None = None
 ) -> ArrayType:
-    kwargs = deepcopy(jsonschema)
-    kwargs = _handle_special_keys(kwargs)
-    item_type = kwargs.pop("items", {})
-    if item_type:
-        kwargs["items"] = parse_type(
-            json_schema_root_type_map[item_type["type"]], item_type
-        )
+    kwargs = _handle_special_keys(jsonschema)
+    item_type = kwargs.get("items")
+    if not item_type:
+        if "items" in kwargs:
+            kwargs = {k: v for k, v in kwargs.items() if k != "items"}
+    elif not isinstance(item_type, BaseJSONType):  # not parsed yet
+        kwargs = {
+            **kwargs,
+            "items": parse_subschema(item_type),
+        }
     return ArrayType(**kwargs)
 
 
 @parse_type.register
 def parse_boolean(jsontype: t.Type[BooleanType], jsonschema: dict) -> t.Any:
-    return BooleanType(**jsonschema)
+    return BooleanType(**_handle_special_keys(jsonschema))
 
 
 @parse_type.register
 def parse_integer(jsontype: t.Type[IntegerType], jsonschema: dict) -> t.Any:
-    return IntegerType(**jsonschema)
+    return IntegerType(**_handle_special_keys(jsonschema))
 
 
 @parse_type.register
 def parse_null(jsontype: t.Type[NullType], jsonschema: dict) -> t.Any:
-    return NullType(**jsonschema)
+    return NullType(**_handle_special_keys(jsonschema))
 
 
 @parse_type.register
 def parse_number(jsontype: t.Type[NumberType], jsonschema: dict) -> t.Any:
-    return NumberType(**jsonschema)
+    return NumberType(**_handle_special_keys(jsonschema))
 
 
 @parse_type.register
 def parse_object(jsontype: t.Type[ObjectType], jsonschema: dict) -> t.Any:
-    kwargs = deepcopy(jsonschema)
-    kwargs = _handle_special_keys(kwargs)
+    kwargs = _handle_special_keys(jsonschema)
     # handle properties
     properties = kwargs.get("properties")
     if properties:
-        kwargs["properties"] = {
-            k: parse_type(json_schema_root_type_map[v["type"]], v)
-            for k, v in properties.items()
-        }
+        context = _context.get()
+        if context is not None and context.lazy:
+            parsed_properties = LazyProperties(properties, context)
+        else:
+            parsed_properties = {
+                k: v if isinstance(v, BaseJSONType) else parse_subschema(v)
+                for k, v in properties.items()
+            }
+        kwargs = {**kwargs, "properties": parsed_properties}
     # TODO: handle patternProperties, additionalProperties etc.
     return ObjectType(**kwargs)
 
 
+# Built-in handlers that are given the nested schemas of a schema already
+# parsed; other handlers parse them themselves.
+_tree_parsers = frozenset({parse_array, parse_object})
+
+
 @parse_type.register
 def parse_string(jsontype: t.Type[StringType], jsonschema: dict) -> t.Any:
-    return StringType.from_jsonschema(jsonschema)
+    return StringType.from_jsonschema(_handle_special_keys(jsonschema))
 
 
 class JSONSchemaParser:
 
     @classmethod
-    def parse(cls, jsonschema: dict | str) -> BaseJSONType:
-        jsonschema = (
-            json.loads(jsonschema) if isinstance(jsonschema, str) else jsonschema
+    def parse(
+        cls,
+        jsonschema: dict | str,
+        cache: ParseCache | None = None,
+        copy: bool = True,
+        intern_table: InternTable | None = None,
+        lazy: bool = False,
+    ) -> BaseJSONType:
+        """Parse a JSON schema into a tree of JSON types.
+
+        The input is never modified. With `copy=False` no copy of it is made
+        either, so values such as `enum` and `default` are shared between the
+        input and the parsed types; the input must not be mutated afterwards.
+
+        With an `intern_table`, structurally identical nodes are parsed into
+        one shared instance, within this schema and across every schema parsed
+        with the same table.
+
+        With `lazy=True`, object properties are parsed on first access (see
+        `LazyProperties`), so only the parts of a wide schema that are used
+        are parsed. A reference is checked for recursion when it is first
+        resolved, and raises `RecursiveRefError` as it would when parsed
+        eagerly. Property schemas are copied when they are first read rather
+        than up front, so with `copy=True` the input must not be mutated until
+        the properties used are read.
+        """
+        if lazy and intern_table is not None:
+            raise ValueError("Lazy parsing cannot be combined with interning.")
+        if isinstance(jsonschema, str):
+            jsonschema = json.loads(jsonschema)
+            # a freshly decoded schema is not shared with the caller
+            copy = False
+        if cache is not None:
+            return cls._parse_cached(
+                jsonschema,
+                jsonschema_fingerprint(jsonschema),
+                cache,
+                copy=copy,
+                intern_table=intern_table,
+                lazy=lazy,
+            )
+        stats = instrumentation.active()
+        if stats is None:
+            return _parse_root(jsonschema, copy, intern_table, lazy)
+        stats.count("parse.calls")
+        with stats.timer("parse"):
+            return _parse_root(jsonschema, copy, intern_table, lazy, stats)
+
+    @classmethod
+    def _parse_cached(
+        cls,
+        jsonschema: dict,
+        schema_fingerprint: str,
+        cache: ParseCache,
+        copy: bool = True,
+        intern_table: InternTable | None = None,
+        lazy: bool = False,
+    ) -> BaseJSONType:
+        """Parse a decoded schema through a cache, given its fingerprint."""
+        # types interned in one table are not the instances of another table
+        key = ("jsonschema", schema_fingerprint, lazy, intern_table)
+        json_schema = cache.get(key)
+        if json_schema is None:
+            json_schema = cache.put(
+                key,
+                cls.parse(jsonschema, copy=copy, intern_table=intern_table, lazy=lazy),
+            )
+        return json_schema
+
+
+def _parse_root(
+    jsonschema: dict,
+    copy: bool,
+    intern_table: InternTable | None,
+    lazy: bool,
+    stats: instrumentation.Instrumentation | None = None,
+) -> BaseJSONType:
+    if copy:
+        copy_schema = _copy_lazily if lazy else _copy_schema
+        if stats is None:
+            jsonschema = copy_schema(jsonschema)
+        else:
+            with stats.timer("parse.copy"):
+                jsonschema = copy_schema(jsonschema)
+    token = _context.set(
+        _ParseContext(
+            RefResolver(jsonschema, lazy=lazy),
+            intern_table=intern_table,
+            lazy=lazy,
+            copy_properties=copy and lazy,
         )
-        jsonschema = _handle_special_keys(jsonschema)
-        simple_type_class = json_schema_root_type_map[jsonschema.get("type")]
-        return parse_type(simple_type_class, jsonschema=jsonschema)
+    )
+    try:
+        return parse_subschema(jsonschema)
+    finally:
+        _context.reset(token)
@@ -0,0 +1,53 @@
+"""Transform schema trees bottom-up without recursion."""
+
+from __future__ import annotations
+
+import typing as t
+from types import MappingProxyType
+
+Node = t.TypeVar("Node")
+Result = t.TypeVar("Result")
+
+ChildrenFunc = t.Callable[[Node], t.Optional[t.Sequence[t.Tuple[t.Hashable, Node]]]]
+BuildFunc = t.Callable[[Node, t.Mapping[t.Hashable, Result]], Result]
+
+# Key of the child schema of an array, which cannot clash with property names.
+ITEMS = object()
+
+_no_children: t.Mapping = MappingProxyType({})
+
+
+def transform(
+    root: Node,
+    children: ChildrenFunc[Node],
+    build: BuildFunc[Node, Result],
+) -> Result:
+    """Build a result for each node of a tree, children before their parents.
+
+    `children` returns the `(key, child)` pairs of a node, or nothing for a
+    leaf, and `build` receives a node with the results of its children under
+    the same keys. The tree is walked with an explicit stack, so its depth is
+    not limited by the recursion limit, and leaves are built without ever
+    being pushed onto the stack.
+    """
+    pairs = children(root)
+    if not pairs:
+        return build(root, _no_children)
+
+    # frame: node, iterator over its child pairs, child results, key in parent
+    stack: t.List[list] = [[root, iter(pairs), {}, None]]
+    while True:
+        frame = stack[-1]
+        results = frame[2]
+        for key, child in frame[1]:
+            pairs = children(child)
+            if pairs:
+                stack.append([child, iter(pairs), {}, key])
+                break
+            results[key] = build(child, _no_children)
+        else:
+            stack.pop()
+            result = build(frame[0], results)
+            if not stack:
+                return result
+            stack[-1][2][frame[3]] = result
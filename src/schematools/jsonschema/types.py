@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import sys
 import typing as t
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+
+from .traverse import transform
 
 if t.TYPE_CHECKING:
 
@@ -24,13 +30,64 @@ _JsonValue: TypeAlias = t.Union[
 T = t.TypeVar("T", bound=_JsonValue)
 
 
-@dataclass(frozen=True)
+# Values that are hashable as they are, checked before the slower Mapping check.
+_scalar_types = frozenset({str, int, float, bool, type(None)})
+
+
+def _freeze(value: t.Any) -> t.Hashable:
+    """Return a hashable stand-in for a JSON value or keyword."""
+    if value.__class__ in _scalar_types:
+        return value
+    if isinstance(value, (dict, Mapping)):
+        # equal dicts may differ in key order, so hash them in sorted order
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Getter of the values of the fields that take part in equality, per class.
+_compare_getters: t.Dict[type, t.Callable[[t.Any], t.Tuple[t.Any, ...]]] = {}
+
+
+def _get_compare_values(cls: type) -> t.Callable[[t.Any], t.Tuple[t.Any, ...]]:
+    getter = _compare_getters.get(cls)
+    if getter is None:
+        getter = _compare_getters[cls] = attrgetter(*_get_compare_names(cls))
+    return getter
+
+
+# Names of the fields that take part in equality, per class.
+_compare_names: t.Dict[type, t.Tuple[str, ...]] = {}
+
+
+def _get_compare_names(cls: type) -> t.Tuple[str, ...]:
+    names = _compare_names.get(cls)
+    if names is None:
+        names = _compare_names[cls] = tuple(f.name for f in fields(cls) if f.compare)
+    return names
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class BaseJSONType:
+    """Base JSON type.
+
+    Types hash by structure, so structurally equal types can be used as dict
+    keys and interned. The hash is computed once per instance and cached; the
+    dicts and lists held by a type must not be mutated after it is hashed.
+
+    Types also have a `fingerprint()`, a structural digest that unlike the
+    hash is the same in every process.
+
+    Types are slotted to keep the per-node overhead low in large catalogs.
+    `__eq__`, `__hash__` and `__repr__` are shared by all types rather than
+    generated per class, which keeps importing this module fast.
+    """
 
     id: str | None = None
     schema: str | None = None
     comment: str | None = None
-    type: str | None = None
+    type: str | t.List[str] | None = None
     title: str | None = None
     description: str | None = None
     default: T | None = None
@@ -40,16 +97,71 @@ class BaseJSONType:
     deprecated: bool | None = None
     enum: t.List[T] | None = None
     const: T | None = None
-
-
-@dataclass(frozen=True)
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+    _fingerprint: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        # slotted dataclasses are recreated, so zero-argument super() breaks
+        super(BaseJSONType, cls).__init_subclass__(**kwargs)
+        # @dataclass generates __eq__ and __hash__ unless the class defines them
+        cls.__eq__ = BaseJSONType.__eq__
+        cls.__hash__ = BaseJSONType.__hash__
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
+        values = _get_compare_values(self.__class__)
+        return values(self) == values(other)
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{f.name}={getattr(self, f.name)!r}" for f in fields(self) if f.repr
+        )
+        return f"{self.__class__.__qualname__}({values})"
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            values = _get_compare_values(self.__class__)(self)
+            try:
+                result = hash((self.__class__, values))
+            except TypeError:
+                # dicts and lists are frozen only when there are any
+                result = hash((self.__class__, tuple(map(_freeze, values))))
+            object.__setattr__(self, "_hash", result)
+        return self._hash
+
+    def fingerprint(self) -> str:
+        """Return a SHA-256 hex digest of the structure of this type.
+
+        The digest depends only on the type class and the fields that are set,
+        not on the order of `properties` or `required`, and is the same in
+        every process and Python version. It is computed once per type, from
+        the fingerprints of the types nested in it.
+        """
+        if self._fingerprint is None:
+            # fingerprint properties and items first, without recursion
+            transform(self, _unfingerprinted_types, _fingerprint_type)
+        return self._fingerprint
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class BooleanType(BaseJSONType):
     """Boolean type."""
 
     type: str = "boolean"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class NullType(BaseJSONType):
     """Null type."""
 
@@ -61,7 +173,7 @@ class NullType(BaseJSONType):
 ############
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class ObjectType(BaseJSONType):
     """Object type."""
 
@@ -94,7 +206,7 @@ class ObjectType(BaseJSONType):
 ############
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class ArrayType(BaseJSONType):
     """Array type."""
 
@@ -116,7 +228,7 @@ class ArrayType(BaseJSONType):
 ###############
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class _NumericType(BaseJSONType):
     """Numeric type."""
 
@@ -126,15 +238,42 @@ class _NumericType(BaseJSONType):
     exclusiveMaximum: bool | None = None
     multipleOf: int | float | None = None
 
-
-@dataclass(frozen=True)
+    def bounds(
+        self,
+    ) -> t.Tuple[
+        int | float | None, int | float | None, int | float | None, int | float | None
+    ]:
+        """Return the minimum, exclusive minimum, maximum and exclusive maximum.
+
+        Draft 4 uses booleans that make `minimum` and `maximum` exclusive,
+        later drafts use numbers; both are returned in the later form.
+        """
+        minimum, maximum = self.minimum, self.maximum
+        exclusive_minimum, exclusive_maximum = (
+            self.exclusiveMinimum,
+            self.exclusiveMaximum,
+        )
+        if isinstance(exclusive_minimum, bool):
+            if exclusive_minimum and minimum is not None:
+                exclusive_minimum, minimum = minimum, None
+            else:
+                exclusive_minimum = None
+        if isinstance(exclusive_maximum, bool):
+            if exclusive_maximum and maximum is not None:
+                exclusive_maximum, maximum = maximum, None
+            else:
+                exclusive_maximum = None
+        return minimum, exclusive_minimum, maximum, exclusive_maximum
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class NumberType(_NumericType):
     """Number type."""
 
     type: str = "number"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class IntegerType(_NumericType):
     """Integer type."""
 
@@ -146,7 +285,7 @@ class IntegerType(_NumericType):
 ##############
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class StringType(BaseJSONType):
     """String type."""
 
@@ -164,124 +303,124 @@ class StringType(BaseJSONType):
         return cls(**jsonschema)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class DateTimeType(StringType):
     """DateTime type.
 
     Example: `2018-11-13T20:20:39+00:00`
     """
 
-    format = "date-time"
+    format: str | None = "date-time"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class TimeType(StringType):
     """Time type.
 
     Example: `20:20:39+00:00`
     """
 
-    format = "time"
+    format: str | None = "time"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class DateType(StringType):
     """Date type.
 
     Example: `2018-11-13`
     """
 
-    format = "date"
+    format: str | None = "date"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class DurationType(StringType):
     """Duration type.
 
     Example: `P3D`
     """
 
-    format = "duration"
+    format: str | None = "duration"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class EmailType(StringType):
     """Email type."""
 
-    format = "email"
+    format: str | None = "email"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class HostnameType(StringType):
     """Hostname type."""
 
-    format = "hostname"
+    format: str | None = "hostname"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class IPv4Type(StringType):
     """IPv4 address type."""
 
-    format = "ipv4"
+    format: str | None = "ipv4"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class IPv6Type(StringType):
     """IPv6 type."""
 
-    format = "ipv6"
+    format: str | None = "ipv6"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class UUIDType(StringType):
     """UUID type.
 
     Example: `3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a`
     """
 
-    format = "uuid"
+    format: str | None = "uuid"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class URIType(StringType):
     """URI type."""
 
-    format = "uri"
+    format: str | None = "uri"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class URIReferenceType(StringType):
     """URIReference type."""
 
-    format = "uri-reference"
+    format: str | None = "uri-reference"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class URITemplateType(StringType):
     """URITemplate type."""
 
-    format = "uri-template"
+    format: str | None = "uri-template"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class JSONPointerType(StringType):
     """JSONPointer type."""
 
-    format = "json-pointer"
+    format: str | None = "json-pointer"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class RelativeJSONPointerType(StringType):
     """RelativeJSONPointer type."""
 
-    format = "relative-json-pointer"
+    format: str | None = "relative-json-pointer"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class RegexType(StringType):
     """Regex type."""
 
-    format = "regex"
+    format: str | None = "regex"
 
 
 string_format_map = {
@@ -301,3 +440,73 @@ string_format_map = {
     "relative-json-pointer": RelativeJSONPointerType,
     "regex": RegexType,
 }
+
+
+def _nested_types(jsontype: BaseJSONType) -> t.List[t.Tuple[int, BaseJSONType]] | None:
+    if jsontype._hash is not None:
+        return None  # hashing a type hashes everything nested in it
+    if isinstance(jsontype, ObjectType) and jsontype.properties:
+        return list(enumerate(jsontype.properties.values()))
+    if isinstance(jsontype, ArrayType) and isinstance(jsontype.items, BaseJSONType):
+        return [(0, jsontype.items)]
+    return None
+
+
+def _unfingerprinted_types(
+    jsontype: BaseJSONType,
+) -> t.List[t.Tuple[int, BaseJSONType]] | None:
+    if jsontype._fingerprint is not None:
+        return None
+    if isinstance(jsontype, ObjectType) and jsontype.properties:
+        return list(enumerate(jsontype.properties.values()))
+    if isinstance(jsontype, ArrayType) and isinstance(jsontype.items, BaseJSONType):
+        return [(0, jsontype.items)]
+    return None
+
+
+def _canonical(value: t.Any) -> t.Any:
+    """Return a JSON value to fingerprint a field value by."""
+    if isinstance(value, BaseJSONType):
+        return {"$fingerprint": value.fingerprint()}
+    if isinstance(value, (dict, Mapping)):
+        return {k: _canonical(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_canonical(v) for v in value]
+    return value
+
+
+# Encodes the canonical form of a type; sorting keys makes property order moot.
+_canonical_encoder = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False
+)
+
+
+def _fingerprint_type(jsontype: BaseJSONType, _: t.Any = None) -> str:
+    if jsontype._fingerprint is None:
+        cls = jsontype.__class__
+        # unset fields are left out, so adding a field keeps fingerprints
+        values = {
+            name: value if value.__class__ in _scalar_types else _canonical(value)
+            for name, value in zip(
+                _get_compare_names(cls), _get_compare_values(cls)(jsontype)
+            )
+            if value is not None
+        }
+        if "required" in values:
+            values["required"] = sorted(values["required"])
+        canonical = _canonical_encoder.encode([cls.__name__, values])
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        object.__setattr__(jsontype, "_fingerprint", digest)
+    return jsontype._fingerprint
+
+
+def hash_tree(jsontype: BaseJSONType) -> int:
+    """Hash a type, hashing its properties and items first.
+
+    Gives the same result as `hash`, and caches the hash of every type nested
+    in it the same way, but without recursing through nested types, so deep
+    types do not run into the recursion limit.
+    """
+    if jsontype._hash is not None:
+        return jsontype._hash
+    return transform(jsontype, _nested_types, lambda node, _: hash(node))
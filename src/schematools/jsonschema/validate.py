@@ -0,0 +1,339 @@
+"""Compile JSON types into record validators."""
+
+from __future__ import annotations
+
+import re
+import typing as t
+from functools import singledispatch
+
+from .types import (
+    ArrayType,
+    BaseJSONType,
+    BooleanType,
+    IntegerType,
+    NullType,
+    NumberType,
+    ObjectType,
+    StringType,
+    _NumericType,
+)
+
+Validator = t.Callable[[t.Any], None]
+
+_missing = object()
+
+
+class ValidationError(ValueError):
+    """Raised when a value does not match its schema."""
+
+    def __init__(self, message: str, path: list[str | int] | None = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.path = path if path is not None else []
+
+    def __str__(self) -> str:
+        path = "/".join(str(p) for p in self.path)
+        return f"{self.message} (at /{path})"
+
+
+def _freeze(value: t.Any) -> t.Hashable:
+    """Return a hashable key that compares like JSON values do.
+
+    Booleans are kept apart from the numbers they equal in Python.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return (bool, value)
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    return value
+
+
+def _all(checks: list[Validator]) -> Validator:
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value: t.Any) -> None:
+        for c in checks:
+            c(value)
+
+    return check
+
+
+def _finish(jsontype: BaseJSONType, checks: list[Validator]) -> Validator:
+    """Combine the checks of a typed node with the keywords shared by all types."""
+    check = _all([*checks, *_common_checks(jsontype)])
+    if isinstance(jsontype.type, list) and "null" in jsontype.type:
+
+        def check_nullable(value: t.Any) -> None:
+            if value is not None:
+                check(value)
+
+        return check_nullable
+    return check
+
+
+def _type_check(json_type: str, accepts: t.Callable[[t.Any], bool]) -> Validator:
+    def check(value: t.Any) -> None:
+        if not accepts(value):
+            raise ValidationError(f"{value!r} is not of type {json_type!r}")
+
+    return check
+
+
+def _common_checks(jsontype: BaseJSONType) -> list[Validator]:
+    """Compile the keywords shared by all types."""
+    checks = []
+    if jsontype.enum is not None:
+        enum = frozenset(_freeze(v) for v in jsontype.enum)
+        enum_values = jsontype.enum
+
+        def check_enum(value: t.Any) -> None:
+            if _freeze(value) not in enum:
+                raise ValidationError(f"{value!r} is not one of {enum_values!r}")
+
+        checks.append(check_enum)
+    if jsontype.const is not None:
+        const = _freeze(jsontype.const)
+        const_value = jsontype.const
+
+        def check_const(value: t.Any) -> None:
+            if _freeze(value) != const:
+                raise ValidationError(f"{const_value!r} was expected")
+
+        checks.append(check_const)
+    return checks
+
+
+@singledispatch
+def compile_type(jsontype: BaseJSONType) -> Validator:
+    """Compile a JSON type into a function that validates a single value."""
+    checks = _common_checks(jsontype)
+    if not checks:
+        return lambda value: None
+    return _all(checks)
+
+
+@compile_type.register
+def compile_null(jsontype: NullType) -> Validator:
+    return _finish(jsontype, [_type_check("null", lambda value: value is None)])
+
+
+@compile_type.register
+def compile_boolean(jsontype: BooleanType) -> Validator:
+    return _finish(
+        jsontype,
+        [_type_check("boolean", lambda value: value is True or value is False)],
+    )
+
+
+def _numeric_checks(jsontype: _NumericType) -> list[Validator]:
+    checks = []
+    minimum, exclusive_minimum, maximum, exclusive_maximum = jsontype.bounds()
+
+    if minimum is not None:
+
+        def check_minimum(value: int | float) -> None:
+            if value < minimum:
+                raise ValidationError(
+                    f"{value!r} is less than the minimum of {minimum!r}"
+                )
+
+        checks.append(check_minimum)
+    if exclusive_minimum is not None:
+
+        def check_exclusive_minimum(value: int | float) -> None:
+            if value <= exclusive_minimum:
+                raise ValidationError(
+                    f"{value!r} is less than or equal to the minimum of "
+                    f"{exclusive_minimum!r}"
+                )
+
+        checks.append(check_exclusive_minimum)
+    if maximum is not None:
+
+        def check_maximum(value: int | float) -> None:
+            if value > maximum:
+                raise ValidationError(
+                    f"{value!r} is greater than the maximum of {maximum!r}"
+                )
+
+        checks.append(check_maximum)
+    if exclusive_maximum is not None:
+
+        def check_exclusive_maximum(value: int | float) -> None:
+            if value >= exclusive_maximum:
+                raise ValidationError(
+                    f"{value!r} is greater than or equal to the maximum of "
+                    f"{exclusive_maximum!r}"
+                )
+
+        checks.append(check_exclusive_maximum)
+    multiple_of = jsontype.multipleOf
+    if multiple_of is not None:
+
+        def check_multiple_of(value: int | float) -> None:
+            if isinstance(multiple_of, float) or isinstance(value, float):
+                quotient = value / multiple_of
+                failed = int(quotient) != quotient
+            else:
+                failed = value % multiple_of
+            if failed:
+                raise ValidationError(f"{value!r} is not a multiple of {multiple_of!r}")
+
+        checks.append(check_multiple_of)
+    return checks
+
+
+@compile_type.register
+def compile_integer(jsontype: IntegerType) -> Validator:
+    def accepts(value: t.Any) -> bool:
+        value_type = type(value)
+        return value_type is int or (value_type is float and value.is_integer())
+
+    return _finish(
+        jsontype, [_type_check("integer", accepts), *_numeric_checks(jsontype)]
+    )
+
+
+@compile_type.register
+def compile_number(jsontype: NumberType) -> Validator:
+    def accepts(value: t.Any) -> bool:
+        value_type = type(value)
+        return value_type is float or value_type is int
+
+    return _finish(
+        jsontype, [_type_check("number", accepts), *_numeric_checks(jsontype)]
+    )
+
+
+@compile_type.register
+def compile_string(jsontype: StringType) -> Validator:
+    min_length, max_length = jsontype.minLength, jsontype.maxLength
+    checks = [_type_check("string", lambda value: isinstance(value, str))]
+    if min_length is not None or max_length is not None:
+        min_length = min_length if min_length is not None else 0
+        max_length = max_length if max_length is not None else float("inf")
+
+        def check_length(value: str) -> None:
+            if not min_length <= len(value) <= max_length:
+                raise ValidationError(
+                    f"{value!r} is too {'short' if len(value) < min_length else 'long'}"
+                )
+
+        checks.append(check_length)
+    if jsontype.pattern is not None:
+        search = re.compile(jsontype.pattern).search
+        pattern = jsontype.pattern
+
+        def check_pattern(value: str) -> None:
+            if search(value) is None:
+                raise ValidationError(f"{value!r} does not match {pattern!r}")
+
+        checks.append(check_pattern)
+    return _finish(jsontype, checks)
+
+
+@compile_type.register
+def compile_array(jsontype: ArrayType) -> Validator:
+    checks = [_type_check("array", lambda value: isinstance(value, list))]
+    min_items, max_items = jsontype.minItems, jsontype.maxItems
+    if min_items is not None or max_items is not None:
+        min_items = min_items if min_items is not None else 0
+        max_items = max_items if max_items is not None else float("inf")
+
+        def check_length(value: list) -> None:
+            if not min_items <= len(value) <= max_items:
+                raise ValidationError(
+                    f"{value!r} is too {'short' if len(value) < min_items else 'long'}"
+                )
+
+        checks.append(check_length)
+    if jsontype.uniqueItems:
+
+        def check_unique(value: list) -> None:
+            if len({_freeze(item) for item in value}) != len(value):
+                raise ValidationError(f"{value!r} has non-unique elements")
+
+        checks.append(check_unique)
+    if isinstance(jsontype.items, BaseJSONType):
+        check_item = compile_type(jsontype.items)
+
+        def check_items(value: list) -> None:
+            for index, item in enumerate(value):
+                try:
+                    check_item(item)
+                except ValidationError as e:
+                    e.path.insert(0, index)
+                    raise
+
+        checks.append(check_items)
+    return _finish(jsontype, checks)
+
+
+@compile_type.register
+def compile_object(jsontype: ObjectType) -> Validator:
+    checks = [_type_check("object", lambda value: isinstance(value, dict))]
+    if jsontype.required:
+        required = tuple(jsontype.required)
+
+        def check_required(value: dict) -> None:
+            for key in required:
+                if key not in value:
+                    raise ValidationError(f"{key!r} is a required property")
+
+        checks.append(check_required)
+    min_properties, max_properties = jsontype.minProperties, jsontype.maxProperties
+    if min_properties is not None or max_properties is not None:
+        min_properties = min_properties if min_properties is not None else 0
+        max_properties = max_properties if max_properties is not None else float("inf")
+
+        def check_size(value: dict) -> None:
+            if not min_properties <= len(value) <= max_properties:
+                raise ValidationError(
+                    f"{value!r} has too "
+                    f"{'few' if len(value) < min_properties else 'many'} properties"
+                )
+
+        checks.append(check_size)
+    if jsontype.properties:
+        properties = tuple(
+            (key, compile_type(value)) for key, value in jsontype.properties.items()
+        )
+
+        def check_properties(value: dict) -> None:
+            get = value.get
+            for key, check_property in properties:
+                property_value = get(key, _missing)
+                if property_value is not _missing:
+                    try:
+                        check_property(property_value)
+                    except ValidationError as e:
+                        e.path.insert(0, key)
+                        raise
+
+        checks.append(check_properties)
+    if jsontype.additionalProperties is False:
+        allowed = frozenset(jsontype.properties or ())
+
+        def check_additional_properties(value: dict) -> None:
+            extra = value.keys() - allowed
+            if extra:
+                raise ValidationError(
+                    f"Additional properties are not allowed ({sorted(extra)!r})"
+                )
+
+        checks.append(check_additional_properties)
+    return _finish(jsontype, checks)
+
+
+def compile_validator(jsontype: BaseJSONType) -> Validator:
+    """Compile a parsed JSON schema into a record validator.
+
+    The returned function raises `ValidationError` for the first violation it
+    finds and returns `None` for valid records.
+    """
+    return compile_type(jsontype)
@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+import pyarrow as pa
+import pytest
+
+from schematools.apache_arrow import AsyncRecordBatchStage, aiter_record_batches
+from schematools.jsonschema import JSONSchemaParser
+
+SCHEMA = JSONSchemaParser.parse(
+    {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+    }
+)
+RECORDS = [{"id": i, "name": f"name-{i}"} for i in range(1000)]
+
+
+async def produce(items, delay=0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+async def collect(batches):
+    return [batch async for batch in batches]
+
+
+def test_aiter_record_batches():
+    """Test records from an async source are converted to batches."""
+    batches = asyncio.run(
+        collect(aiter_record_batches(SCHEMA, produce(RECORDS), max_rows=300))
+    )
+    assert [batch.num_rows for batch in batches] == [300, 300, 300, 100]
+    assert pa.Table.from_batches(batches).to_pylist() == RECORDS
+
+
+def test_lines():
+    """Test raw JSON lines are decoded before conversion."""
+    lines = [json.dumps(record).encode() for record in RECORDS]
+    batches = asyncio.run(
+        collect(aiter_record_batches(SCHEMA, produce(lines), lines=True))
+    )
+    assert pa.Table.from_batches(batches).to_pylist() == RECORDS
+
+
+def test_backpressure_and_metrics():
+    """Test a slow consumer stops the stage from reading ahead without bound."""
+    read = []
+
+    async def source():
+        for record in RECORDS:
+            read.append(record)
+            yield record
+
+    async def consume():
+        stage = AsyncRecordBatchStage(SCHEMA, max_rows=10, chunk_size=10, queue_size=2)
+        stream = stage.stream(source())
+        first = await anext(stream)
+        # let the stage run ahead as far as the queue allows
+        await asyncio.sleep(0.1)
+        ahead = len(read)
+        rest = [batch async for batch in stream]
+        return stage.metrics, first, ahead, rest
+
+    metrics, first, ahead, rest = asyncio.run(consume())
+    assert first.num_rows == 10
+    # the queue, the chunk being converted and the chunk being read
+    assert ahead <= 10 * (2 + 3)
+    assert 1 + len(rest) == metrics.batches == 100
+    assert metrics.records == metrics.rows == 1000
+    assert metrics.max_queue_depth == 2
+    assert metrics.records_per_second > 0
+
+
+def test_source_error():
+    """Test an error in the source is raised to the consumer."""
+
+    async def source():
+        yield RECORDS[0]
+        raise ConnectionError("lost")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(collect(aiter_record_batches(SCHEMA, source())))
+
+
+def test_conversion_error():
+    """Test an error converting records is raised to the consumer."""
+    with pytest.raises(pa.ArrowInvalid):
+        asyncio.run(collect(aiter_record_batches(SCHEMA, produce([{"id": "x"}]))))
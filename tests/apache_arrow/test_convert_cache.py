@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow as pa
+
+from schematools.apache_arrow import ArrowSchema
+from schematools.apache_arrow.schema import JSONToArrowTypeMap
+from schematools.jsonschema import JSONSchemaParser
+
+ADDRESS = {
+    "type": "object",
+    "properties": {"street": {"type": "string"}, "zip": {"type": "string"}},
+}
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "home": ADDRESS,
+        "work": dict(ADDRESS),
+        "previous": {"type": "array", "items": dict(ADDRESS)},
+    },
+}
+
+
+def test_repeated_subschemas_share_arrow_type():
+    """Test structurally equal sub-schemas are converted to the same type."""
+    types = JSONToArrowTypeMap(cache_size=16).convert_properties(
+        JSONSchemaParser.parse(SCHEMA)
+    )
+    assert types["home"] is types["work"]
+    # pyarrow wraps the value type anew, so compare the wrapped C++ types
+    assert types["previous"].value_type.equals(types["home"])
+
+
+def test_cache_shared_between_schemas():
+    """Test a converter reuses types converted for an earlier schema."""
+    converter = JSONToArrowTypeMap(cache_size=16)
+    first = converter.convert_properties(JSONSchemaParser.parse(SCHEMA))
+    second = converter.convert_properties(
+        JSONSchemaParser.parse({"type": "object", "properties": {"a": ADDRESS}})
+    )
+    assert second["a"] is first["home"]
+    # "work" and the items of "previous", then "a"
+    assert converter.cache.hits == 3
+
+
+def test_cache_evicts():
+    """Test the cache keeps at most `cache_size` types."""
+    converter = JSONToArrowTypeMap(cache_size=1)
+    ArrowSchema.from_json_type(JSONSchemaParser.parse(SCHEMA), converter)
+    assert len(converter.cache) == 1
+    assert converter.cache.evictions == 1
+
+
+def test_cache_disabled():
+    """Test converters have no cache unless given a size."""
+    assert JSONToArrowTypeMap().cache is None
+    converter = JSONToArrowTypeMap(cache_size=0)
+    assert converter.cache is None
+    schema = ArrowSchema.from_json_type(JSONSchemaParser.parse(SCHEMA), converter)
+    assert schema.field("home").type is not schema.field("work").type
+    assert schema.field("home").type == schema.field("work").type
+
+
+def test_converter_shared_between_threads():
+    """Test one converter gives the same schemas from many threads."""
+    converter = JSONToArrowTypeMap(cache_size=16)
+    parsed = [JSONSchemaParser.parse(SCHEMA) for _ in range(16)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        schemas = list(
+            executor.map(lambda p: ArrowSchema.from_json_type(p, converter), parsed)
+        )
+    expected = ArrowSchema.from_json_type(parsed[0], JSONToArrowTypeMap(cache_size=0))
+    assert all(schema.equals(expected) for schema in schemas)
+    assert isinstance(schemas[0].field("home").type, pa.StructType)
@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from schematools.apache_arrow import ArrowSchema, convert_catalog
+
+USERS = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+}
+ORDERS = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "total": {"type": "number"}},
+}
+CATALOG = {"users": USERS, "admins": dict(USERS), "orders": ORDERS}
+
+
+@pytest.mark.parametrize("use_processes", [True, False])
+def test_convert_catalog(use_processes):
+    """Test every stream is converted on a pool."""
+    schemas = convert_catalog(CATALOG, max_workers=2, use_processes=use_processes)
+    assert list(schemas) == ["users", "admins", "orders"]
+    assert schemas["users"] == ArrowSchema.from_jsonschema(USERS)
+    assert schemas["orders"] == ArrowSchema.from_jsonschema(ORDERS)
+
+
+def test_convert_catalog_deduplicates():
+    """Test identical schemas are converted once and shared."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        schemas = convert_catalog(CATALOG, executor=executor)
+    assert schemas["users"] is schemas["admins"]
+
+
+def test_convert_empty_catalog():
+    """Test an empty catalog needs no pool."""
+    assert convert_catalog({}) == {}
@@ -0,0 +1,93 @@
+import pyarrow as pa
+import pytest
+
+from schematools.apache_arrow import (
+    ArrowSchema,
+    SchemaEvolutionError,
+    evolve_schema,
+    unify_schemas,
+)
+from schematools.jsonschema import JSONSchemaParser
+
+OLD = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "address": {"type": "object", "properties": {"city": {"type": "string"}}},
+        "legacy": {"type": "string"},
+    },
+}
+NEW = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "number"},
+        "address": {
+            "type": "object",
+            "properties": {"city": {"type": "string"}, "zip": {"type": "string"}},
+        },
+        "email": {"type": "string"},
+    },
+}
+
+
+def test_evolve_schema():
+    """Test buffered and incoming batches are converted to a unified schema."""
+    old_schema = ArrowSchema.from_jsonschema(OLD)
+    evolution = evolve_schema(old_schema, JSONSchemaParser.parse(NEW))
+    assert evolution.schema == pa.schema(
+        [
+            ("id", pa.float64()),
+            ("address", pa.struct([("city", pa.string()), ("zip", pa.string())])),
+            ("legacy", pa.string()),
+            ("email", pa.string()),
+        ]
+    )
+    assert not evolution.is_unchanged()
+
+    buffered = pa.RecordBatch.from_pylist(
+        [{"id": 1, "address": {"city": "Oslo"}, "legacy": "x"}], schema=old_schema
+    )
+    assert evolution.existing.apply(buffered).to_pylist() == [
+        {
+            "id": 1.0,
+            "address": {"city": "Oslo", "zip": None},
+            "legacy": "x",
+            "email": None,
+        }
+    ]
+    incoming = pa.RecordBatch.from_pylist(
+        [{"id": 2.5, "address": None, "email": "a@b.c"}],
+        schema=ArrowSchema.from_jsonschema(NEW),
+    )
+    assert evolution.incoming.apply(incoming).to_pylist() == [
+        {"id": 2.5, "address": None, "legacy": None, "email": "a@b.c"}
+    ]
+
+
+def test_cast_plan_touches_only_changed_columns():
+    """Test only changed columns are cast, and missing ones filled with nulls."""
+    old_schema = ArrowSchema.from_jsonschema(OLD)
+    evolution = evolve_schema(old_schema, JSONSchemaParser.parse(NEW))
+    assert evolution.existing.columns == ((0, True), (1, True), (2, False), None)
+
+
+def test_unchanged_schema():
+    """Test a schema that did not change needs no conversion."""
+    schema = ArrowSchema.from_jsonschema(OLD)
+    evolution = evolve_schema(schema, JSONSchemaParser.parse(OLD))
+    assert evolution.is_unchanged()
+    batch = pa.RecordBatch.from_pylist([{"id": 1}], schema=schema)
+    assert evolution.existing.apply(batch) is batch
+
+
+def test_incompatible_schemas():
+    """Test a type that cannot be widened is an error."""
+    with pytest.raises(SchemaEvolutionError):
+        unify_schemas(pa.schema([("id", pa.int64())]), pa.schema([("id", pa.string())]))
+
+
+def test_fingerprint_dropped():
+    """Test the unified schema does not claim the fingerprint of either."""
+    old = ArrowSchema.from_jsonschema(OLD, fingerprint=True)
+    new = ArrowSchema.from_jsonschema(NEW, fingerprint=True)
+    assert ArrowSchema.get_fingerprint(unify_schemas(old, new)) is None
@@ -0,0 +1,36 @@
+import pyarrow as pa
+
+from schematools.apache_arrow import ArrowSchema
+from schematools.jsonschema import JSONSchemaParser, ParseCache
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+}
+
+
+def test_from_jsonschema_with_fingerprint():
+    """Test the fingerprint of the JSON schema is embedded in the metadata."""
+    schema = ArrowSchema.from_jsonschema(SCHEMA, fingerprint=True)
+    assert ArrowSchema.get_fingerprint(schema) == (
+        JSONSchemaParser.parse(SCHEMA).fingerprint()
+    )
+    assert schema.equals(ArrowSchema.from_jsonschema(SCHEMA))
+
+
+def test_cached_with_fingerprint():
+    """Test schemas with and without a fingerprint are cached apart."""
+    cache = ParseCache()
+    plain = ArrowSchema.from_jsonschema(SCHEMA, cache=cache)
+    fingerprinted = ArrowSchema.from_jsonschema(SCHEMA, cache=cache, fingerprint=True)
+    assert ArrowSchema.get_fingerprint(plain) is None
+    assert ArrowSchema.get_fingerprint(fingerprinted) is not None
+
+
+def test_with_fingerprint_keeps_metadata():
+    """Test embedding a fingerprint keeps the other metadata."""
+    schema = pa.schema([pa.field("id", pa.int64())], metadata={"owner": "team"})
+    parsed = JSONSchemaParser.parse(SCHEMA)
+    schema = ArrowSchema.with_fingerprint(schema, parsed)
+    assert schema.metadata[b"owner"] == b"team"
+    assert ArrowSchema.get_fingerprint(schema) == parsed.fingerprint()
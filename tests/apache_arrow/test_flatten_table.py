@@ -0,0 +1,85 @@
+import pyarrow as pa
+
+from schematools.apache_arrow import ArrowSchema, flatten_table, iter_record_batches
+from schematools.jsonschema import JSONSchemaParser, RecordFlattener, flatten
+
+SCHEMA = JSONSchemaParser.parse(
+    {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "address": {
+                "type": "object",
+                "properties": {
+                    "number": {"type": "integer"},
+                    "city": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "zip": {"type": "string"},
+                        },
+                    },
+                },
+            },
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+    }
+)
+
+RECORDS = [
+    {"name": "a", "address": {"number": 1, "city": {"name": "x", "zip": "1"}}},
+    {"name": "b", "address": None, "tags": ["t"]},
+    {"name": "c", "address": {"number": 3, "city": None}},
+]
+
+
+def _table():
+    return pa.Table.from_batches(list(iter_record_batches(SCHEMA, RECORDS)))
+
+
+def test_flatten_table():
+    """Test flattened tables match the flattened schema and records."""
+    for max_depth in range(4):
+        flattened = flatten_table(_table(), SCHEMA, max_depth=max_depth)
+        assert flattened.schema == ArrowSchema.from_json_type(
+            flatten(SCHEMA, max_depth=max_depth)
+        )
+        flattener = RecordFlattener(SCHEMA, max_depth=max_depth)
+        expected = pa.Table.from_pylist(
+            list(flattener.flatten_records(RECORDS)), schema=flattened.schema
+        )
+        assert flattened.to_pylist() == expected.to_pylist()
+
+
+def test_flatten_record_batch():
+    """Test record batches are flattened too."""
+    batch = next(iter_record_batches(SCHEMA, RECORDS))
+    flattened = flatten_table(batch, SCHEMA, separator=".")
+    assert isinstance(flattened, pa.RecordBatch)
+    assert flattened.schema.names == [
+        "name",
+        "address.number",
+        "address.city.name",
+        "address.city.zip",
+        "tags",
+    ]
+
+
+def test_flatten_table_name_collision():
+    """Test a property named like a flattened path is replaced, as by flatten."""
+    schema = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "properties": {
+                "a__b": {"type": "string"},
+                "a": {"type": "object", "properties": {"b": {"type": "integer"}}},
+            },
+        }
+    )
+    records = [{"a__b": "x", "a": {"b": 1}}, {"a__b": "y", "a": None}]
+    table = pa.Table.from_batches(list(iter_record_batches(schema, records)))
+    flattened = flatten_table(table, schema)
+    assert flattened.schema == ArrowSchema.from_json_type(flatten(schema))
+    assert flattened.to_pylist() == list(
+        RecordFlattener(schema).flatten_records(records)
+    )
@@ -0,0 +1,88 @@
+import json
+
+import pyarrow as pa
+import pytest
+
+from schematools.apache_arrow import (
+    ArrowSchema,
+    json_parse_options,
+    json_read_options,
+    open_jsonl,
+    read_jsonl,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "score": {"type": "number"},
+        "address": {
+            "type": "object",
+            "properties": {"city": {"type": "string"}},
+        },
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+CLOSED_SCHEMA = {**SCHEMA, "additionalProperties": False}
+RECORDS = [
+    {"id": i, "score": 1, "address": {"city": f"city-{i}"}, "tags": ["a"] * (i % 3)}
+    for i in range(1000)
+]
+
+
+@pytest.fixture
+def jsonl(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text("".join(json.dumps(record) + "\n" for record in RECORDS))
+    return path
+
+
+def test_parse_options():
+    """Test the explicit schema and unexpected field behavior of a schema."""
+    options = json_parse_options(SCHEMA)
+    assert options.explicit_schema == ArrowSchema.from_jsonschema(SCHEMA)
+    assert options.unexpected_field_behavior == "ignore"
+    assert json_parse_options(SCHEMA, "infer").unexpected_field_behavior == "infer"
+    assert json_parse_options(CLOSED_SCHEMA).unexpected_field_behavior == "error"
+
+
+def test_parse_options_need_object_schema():
+    """Test only object schemas can be read by Arrow's JSON reader."""
+    with pytest.raises(ValueError, match="object schema"):
+        json_parse_options({"type": "string"})
+    with pytest.raises(ValueError, match="open fields"):
+        json_parse_options(SCHEMA, "error")
+
+
+def test_read_options():
+    """Test the block size and threads of the reader."""
+    options = json_read_options(block_size=4096, use_threads=False)
+    assert options.block_size == 4096
+    assert not options.use_threads
+
+
+def test_read_jsonl(jsonl):
+    """Test a file is read with the types of the schema, not inferred ones."""
+    table = read_jsonl(jsonl, SCHEMA)
+    assert table.schema == ArrowSchema.from_jsonschema(SCHEMA)
+    # integral scores would be inferred as integers
+    assert table.column("score").type == pa.float64()
+    assert table.to_pylist() == RECORDS
+
+
+def test_open_jsonl(jsonl):
+    """Test a file is streamed in batches of a block each."""
+    reader = open_jsonl(jsonl, SCHEMA, block_size=4096)
+    batches = list(reader)
+    assert len(batches) > 1
+    assert pa.Table.from_batches(batches).to_pylist() == RECORDS
+
+
+def test_unexpected_fields(tmp_path):
+    """Test fields missing from the schema by whether the schema is closed."""
+    path = tmp_path / "records.jsonl"
+    path.write_text('{"id": 1, "extra": "x"}\n')
+    assert read_jsonl(path, SCHEMA).column_names == ["id", "score", "address", "tags"]
+    assert "extra" in read_jsonl(path, SCHEMA, open_fields="infer").column_names
+    with pytest.raises(pa.ArrowInvalid):
+        read_jsonl(path, CLOSED_SCHEMA)
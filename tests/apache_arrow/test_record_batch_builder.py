@@ -0,0 +1,87 @@
+import pyarrow as pa
+
+from schematools.apache_arrow import RecordBatchBuilder, iter_record_batches
+from schematools.jsonschema import JSONSchemaParser
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "integer"},
+        "address": {
+            "type": "object",
+            "properties": {
+                "street": {"type": "string"},
+                "number": {"type": "integer"},
+            },
+        },
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+def test_iter_record_batches():
+    """Test records are converted column by column."""
+    records = [
+        {"name": "a", "age": 1, "address": {"street": "x", "number": 1}},
+        {"name": "b", "tags": ["t"], "address": None},
+        {"age": 3, "address": {"street": "z"}},
+    ]
+    batches = list(iter_record_batches(JSONSchemaParser.parse(SCHEMA), records))
+    assert len(batches) == 1
+    table = pa.Table.from_batches(batches)
+    assert (
+        table.to_pylist()
+        == pa.Table.from_pylist(records, schema=table.schema).to_pylist()
+    )
+
+
+def test_iter_record_batches_max_rows():
+    """Test batches are split by row count."""
+    records = ({"name": str(i), "age": i} for i in range(10))
+    batches = list(
+        iter_record_batches(JSONSchemaParser.parse(SCHEMA), records, max_rows=4)
+    )
+    assert [batch.num_rows for batch in batches] == [4, 4, 2]
+    assert pa.Table.from_batches(batches).column("age").to_pylist() == list(range(10))
+
+
+def test_iter_record_batches_max_bytes():
+    """Test batches are split by approximate byte size."""
+    records = ({"name": "x" * 100} for _ in range(100))
+    batches = list(
+        iter_record_batches(JSONSchemaParser.parse(SCHEMA), records, max_bytes=1000)
+    )
+    assert len(batches) > 1
+    assert sum(batch.num_rows for batch in batches) == 100
+    assert all(batch.num_rows <= 10 for batch in batches)
+
+
+def test_record_batch_builder_root():
+    """Test non-object schemas are written to a root column."""
+    builder = RecordBatchBuilder(JSONSchemaParser.parse({"type": "integer"}))
+    builder.append(1)
+    builder.append(None)
+    batch = builder.flush()
+    assert batch.schema == pa.schema([pa.field("root", pa.int64())])
+    assert batch.column(0).to_pylist() == [1, None]
+    assert builder.num_rows == 0
+
+
+def test_record_batches_bounded_as_records_grow():
+    """Test batches stay within `max_bytes` when records grow along the stream."""
+    parsed = JSONSchemaParser.parse(SCHEMA)
+    records = [{"name": "x"}] * 64 + [{"name": "x" * 100_000}] * 20
+    batches = list(iter_record_batches(parsed, records, max_bytes=300_000))
+    assert sum(batch.num_rows for batch in batches) == len(records)
+    assert len(batches) > 1
+    assert all(batch.nbytes < 400_000 for batch in batches)
+
+    builder = RecordBatchBuilder(parsed, max_bytes=300_000)
+    sizes = []
+    for record in records:
+        builder.append(record)
+        if builder.is_full():
+            sizes.append(builder.flush().nbytes)
+    assert len(sizes) > 1
+    assert max(sizes) < 400_000
@@ -0,0 +1,101 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from schematools.apache_arrow import (
+    ArrowSchema,
+    infer_jsonl,
+    iter_jsonl_shards,
+    read_jsonl_sharded,
+    split_jsonl,
+)
+from schematools.jsonschema import JSONSchemaParser, infer_schema
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+RECORDS = [
+    {"id": i, "name": "x" * (i % 50), "tags": ["a"] * (i % 3)} for i in range(2000)
+]
+
+
+@pytest.fixture
+def jsonl(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text("".join(json.dumps(record) + "\n" for record in RECORDS))
+    return path
+
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_split_jsonl(tmp_path, trailing_newline):
+    """Test a file is split into contiguous ranges of whole lines."""
+    path = tmp_path / "records.jsonl"
+    content = b"".join(json.dumps(record).encode() + b"\n" for record in RECORDS)
+    path.write_bytes(content if trailing_newline else content[:-1])
+    ranges = split_jsonl(path, 7)
+    assert len(ranges) == 7
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(path.read_bytes())
+    data = path.read_bytes()
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[end - 1 : end] == b"\n"
+
+
+def test_split_empty_file(tmp_path):
+    """Test an empty file has no ranges."""
+    path = tmp_path / "records.jsonl"
+    path.write_bytes(b"")
+    assert split_jsonl(path, 4) == []
+
+
+@pytest.mark.parametrize("engine", ["arrow", "python"])
+def test_read_jsonl_sharded(jsonl, engine):
+    """Test shards converted in worker processes are assembled in file order."""
+    table = read_jsonl_sharded(
+        jsonl, SCHEMA, max_workers=2, shard_bytes=4096, engine=engine
+    )
+    assert table.schema == ArrowSchema.from_jsonschema(SCHEMA)
+    assert table.to_pylist() == RECORDS
+
+
+def test_iter_jsonl_shards_on_executor(jsonl):
+    """Test shards can be converted on a given executor."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        tables = list(
+            iter_jsonl_shards(jsonl, SCHEMA, executor=executor, shard_bytes=4096)
+        )
+    assert len(tables) > 4
+    assert [row for table in tables for row in table.to_pylist()] == RECORDS
+
+
+def test_read_empty_file(tmp_path):
+    """Test an empty file gives an empty table of the schema."""
+    path = tmp_path / "records.jsonl"
+    path.write_bytes(b"")
+    table = read_jsonl_sharded(path, SCHEMA, max_workers=1)
+    assert table.num_rows == 0
+    assert table.schema == ArrowSchema.from_jsonschema(SCHEMA)
+
+
+def test_unknown_engine(jsonl):
+    """Test an unknown conversion engine is an error."""
+    with pytest.raises(ValueError, match="engine"):
+        read_jsonl_sharded(jsonl, SCHEMA, engine="rust")
+
+
+def test_infer_jsonl(jsonl):
+    """Test a file inferred in shards gives the type of its records."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        inferred = infer_jsonl(jsonl, executor=executor, shard_bytes=4096)
+    assert inferred == infer_schema(RECORDS)
+    assert inferred.properties["tags"] == JSONSchemaParser.parse(
+        SCHEMA["properties"]["tags"]
+    )
+    assert infer_jsonl(jsonl, max_workers=2, sample_size=100, seed=1) == inferred
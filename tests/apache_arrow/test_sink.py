@@ -0,0 +1,96 @@
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from schematools.apache_arrow import RecordBatchFileWriter, write_jsonl
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+RECORDS = [{"id": i, "name": f"name-{i}", "tags": ["a"] * (i % 3)} for i in range(1000)]
+
+
+@pytest.fixture
+def jsonl(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text("".join(json.dumps(record) + "\n" for record in RECORDS) + "\n")
+    return path
+
+
+def test_write_parquet(jsonl, tmp_path):
+    """Test records are written in row groups of the requested size."""
+    (path,) = write_jsonl(
+        jsonl,
+        tmp_path / "records.parquet",
+        SCHEMA,
+        batch_rows=64,
+        row_group_rows=300,
+        compression="zstd",
+    )
+    parquet = pq.ParquetFile(path)
+    assert parquet.read().to_pylist() == RECORDS
+    assert [
+        parquet.metadata.row_group(i).num_rows
+        for i in range(parquet.metadata.num_row_groups)
+    ] == [300, 300, 300, 100]
+    assert parquet.metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_write_ipc(jsonl, tmp_path):
+    """Test records are written to an Arrow IPC file."""
+    (path,) = write_jsonl(
+        jsonl, tmp_path / "records.arrow", SCHEMA, format="ipc", row_group_rows=256
+    )
+    with pa.OSFile(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        assert reader.num_record_batches == 4
+        assert reader.read_all().to_pylist() == RECORDS
+
+
+@pytest.mark.parametrize("format", ["parquet", "ipc"])
+def test_rollover(jsonl, tmp_path, format):
+    """Test a new file is started once a file reaches its maximum size."""
+    paths = write_jsonl(
+        jsonl,
+        tmp_path / "part-{part:03d}",
+        SCHEMA,
+        format=format,
+        compression="none",
+        row_group_rows=100,
+        max_file_bytes=1,
+    )
+    assert [path.name for path in paths] == [f"part-{i:03d}" for i in range(10)]
+    if format == "parquet":
+        tables = [pq.read_table(path) for path in paths]
+    else:
+        tables = [
+            pa.ipc.open_file(pa.memory_map(str(path))).read_all() for path in paths
+        ]
+    assert pa.concat_tables(tables).to_pylist() == RECORDS
+
+
+def test_rollover_needs_template(tmp_path):
+    """Test rolling over files without a `{part}` field is an error."""
+    with pytest.raises(ValueError, match="part"):
+        write_jsonl([], tmp_path / "records.parquet", SCHEMA, max_file_bytes=1024)
+
+
+def test_empty_input(tmp_path):
+    """Test an empty input writes a file with the schema and no rows."""
+    (path,) = write_jsonl([], tmp_path / "records.parquet", SCHEMA)
+    table = pq.read_table(path)
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "name", "tags"]
+
+
+def test_unknown_format(tmp_path):
+    """Test an unknown file format is an error."""
+    with pytest.raises(ValueError, match="csv"):
+        RecordBatchFileWriter(tmp_path / "out", pa.schema([]), format="csv")
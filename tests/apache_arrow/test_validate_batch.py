@@ -0,0 +1,93 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from schematools.apache_arrow import iter_record_batches, validate_batch
+from schematools.jsonschema import JSONSchemaParser
+
+SCHEMA = JSONSchemaParser.parse(
+    {
+        "type": "object",
+        "required": ["id"],
+        "properties": {
+            "id": {"type": "integer", "minimum": 1, "multipleOf": 2},
+            "score": {"type": "number", "exclusiveMaximum": 10},
+            "email": {"type": "string", "pattern": "@", "maxLength": 10},
+            "status": {"type": "string", "enum": ["active", "inactive"]},
+            "address": {
+                "type": "object",
+                "required": ["city"],
+                "properties": {
+                    "city": {"type": "string", "minLength": 2},
+                },
+            },
+            "tags": {
+                "type": "array",
+                "items": {"type": "string", "const": "a"},
+                "maxItems": 2,
+            },
+        },
+    }
+)
+
+RECORDS = [
+    {"id": 2, "score": 9.5, "email": "a@b", "status": "active"},
+    {"id": None},
+    {"id": 3},
+    {"id": 2, "score": 10.0},
+    {"id": 2, "email": "no-at-sign"},
+    {"id": 2, "status": "banned"},
+    {"id": 2, "address": {"city": None}},
+    {"id": 2, "address": {"city": "X"}},
+    {"id": 2, "address": None, "tags": ["a", "a"]},
+    {"id": 2, "tags": ["a", "b"]},
+    {"id": 2, "tags": ["a", "a", "a"]},
+]
+
+
+def _batch():
+    return next(iter_record_batches(SCHEMA, RECORDS))
+
+
+def test_validate_batch_mask():
+    """Test the mask flags exactly the invalid rows."""
+    result = validate_batch(_batch(), SCHEMA)
+    assert result.mask.to_pylist() == [
+        True,
+        False,
+        False,
+        False,
+        False,
+        False,
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert result.num_invalid == 9
+    assert not result.is_valid()
+
+
+def test_validate_batch_violations():
+    """Test violations are counted per column."""
+    result = validate_batch(_batch(), SCHEMA)
+    assert result.violations == {
+        "id": 2,
+        "score": 1,
+        "email": 1,
+        "status": 1,
+        "address.city": 2,
+        "tags": 1,
+        "tags[]": 1,
+    }
+
+
+def test_validate_table():
+    """Test tables are validated batch by batch."""
+    table = pa.Table.from_batches(
+        list(iter_record_batches(SCHEMA, RECORDS, max_rows=4))
+    )
+    result = validate_batch(table, SCHEMA)
+    assert isinstance(result.mask, pa.ChunkedArray)
+    assert table.filter(result.mask).num_rows == 2
+    assert table.filter(pc.invert(result.mask)).num_rows == 9
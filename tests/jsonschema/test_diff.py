@@ -0,0 +1,66 @@
+from schematools.jsonschema import JSONSchemaParser, diff_schemas
+
+OLD = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "created_at": {"type": "string", "format": "date-time"},
+        "address": {
+            "type": "object",
+            "properties": {"city": {"type": "string"}},
+        },
+        "scores": {"type": "array", "items": {"type": "integer"}},
+        "legacy": {"type": "string"},
+    },
+}
+
+
+def diff(old: dict, new: dict):
+    return diff_schemas(JSONSchemaParser.parse(old), JSONSchemaParser.parse(new))
+
+
+def test_no_changes():
+    """Test reordered properties and new annotations are not changes."""
+    new = {
+        "type": "object",
+        "description": "Users.",
+        "properties": dict(reversed(OLD["properties"].items())),
+    }
+    result = diff(OLD, new)
+    assert not result
+    assert result.is_compatible()
+
+
+def test_added_removed_widened():
+    """Test fields are reported by the kind of change, with their paths."""
+    properties = dict(OLD["properties"])
+    del properties["legacy"]
+    properties.update(
+        id={"type": "number"},
+        created_at={"type": "string"},
+        address={
+            "type": "object",
+            "properties": {"city": {"type": "string"}, "zip": {"type": "string"}},
+        },
+        scores={"type": "array", "items": {"type": "number"}},
+        email={"type": "string"},
+    )
+    result = diff(OLD, {"type": "object", "properties": properties})
+    assert [c.path for c in result.added] == ["email", "address.zip"]
+    assert [c.path for c in result.removed] == ["legacy"]
+    assert [c.path for c in result.widened] == ["id", "created_at", "scores[]"]
+    assert result.changed == []
+    assert result.is_compatible()
+    assert result.removed[0].new is None
+
+
+def test_incompatible_change():
+    """Test narrowing or replacing a type is an incompatible change."""
+    properties = {
+        **OLD["properties"],
+        "id": {"type": "string"},
+        "legacy": {"type": "string", "format": "email"},
+    }
+    result = diff(OLD, {"type": "object", "properties": properties})
+    assert [c.path for c in result.changed] == ["id", "legacy"]
+    assert not result.is_compatible()
@@ -0,0 +1,152 @@
+import inspect
+import typing as t
+from dataclasses import dataclass
+from functools import singledispatchmethod
+
+import pyarrow as pa
+import pytest
+from class_singledispatch import class_singledispatch
+
+from schematools.apache_arrow import ArrowSchema, JSONToArrowTypeMap
+from schematools.apache_arrow.schema import _dispatch_table
+from schematools.jsonschema import (
+    DateTimeType,
+    JSONSchemaParser,
+    NumberType,
+    ObjectType,
+    StringType,
+)
+from schematools.jsonschema import parse as parse_module
+from schematools.jsonschema.dispatch import DispatchTable
+from schematools.jsonschema.parse import (
+    _parse_dispatch,
+    json_schema_root_type_map,
+    parse_string,
+)
+
+
+@pytest.fixture
+def parse_type(monkeypatch):
+    """A copy of `parse_type` used by the parser for the length of a test."""
+    original = parse_module.parse_type
+    scratch = class_singledispatch(original.dispatch(object))
+    for cls, handler in original.registry.items():
+        if cls is not object:
+            scratch.register(cls, handler)
+    monkeypatch.setattr(parse_module, "parse_type", scratch)
+    monkeypatch.setattr(parse_module, "_parse_dispatch", DispatchTable(scratch))
+    return scratch
+
+
+@pytest.fixture
+def converter_class():
+    """A converter with its own copy of the `convert` handlers."""
+    original = inspect.getattr_static(JSONToArrowTypeMap, "convert")
+    convert = singledispatchmethod(original.func)
+    for cls, handler in original.dispatcher.registry.items():
+        if cls is not object:
+            convert.register(cls, handler)
+    return type("Converter", (JSONToArrowTypeMap,), {"convert": convert})
+
+
+@dataclass(frozen=True, slots=True)
+class MoneyType(NumberType):
+    """Number of cents, an extension type defined after the tables are built."""
+
+    type: str = "money"
+
+
+def test_table_includes_format_subclasses():
+    """Test string format subclasses resolve to the string handlers."""
+    handlers = _parse_dispatch.handlers()
+    assert handlers[StringType] is parse_string
+    assert handlers[DateTimeType] is parse_string
+    converters = _dispatch_table(JSONToArrowTypeMap).handlers()
+    assert converters[DateTimeType] is converters[StringType]
+
+
+def test_extension_registered_after_tables_are_built(
+    monkeypatch, parse_type, converter_class
+):
+    """Test handlers registered later are picked up by the tables."""
+    JSONSchemaParser.parse({"type": "number"})
+    ArrowSchema.from_json_type(NumberType(), converter=converter_class())
+
+    @parse_type.register
+    def parse_money(jsontype: t.Type[MoneyType], jsonschema: dict) -> MoneyType:
+        return MoneyType(**jsonschema)
+
+    @converter_class.convert.register
+    def convert_money(self, jsontype: MoneyType) -> pa.DataType:
+        return pa.decimal128(18, 2)
+
+    monkeypatch.setitem(json_schema_root_type_map, "money", MoneyType)
+    jsonschema = {"type": "object", "properties": {"price": {"type": "money"}}}
+    parsed = JSONSchemaParser.parse(jsonschema)
+    assert parsed.properties["price"] == MoneyType()
+    arrow_schema = ArrowSchema.from_json_type(parsed, converter=converter_class())
+    assert arrow_schema.field("price").type == pa.decimal128(18, 2)
+
+
+@dataclass(frozen=True, slots=True)
+class RowType(ObjectType):
+    """Object converted to a list of its values, an extension container type."""
+
+    type: str = "row"
+
+
+def test_extension_container_handlers(monkeypatch, parse_type, converter_class):
+    """Test handlers of container types get their nested types unconverted."""
+
+    @parse_type.register
+    def parse_row(jsontype: t.Type[RowType], jsonschema: dict) -> RowType:
+        properties = {
+            name: parse_type(json_schema_root_type_map[value["type"]], value)
+            for name, value in jsonschema["properties"].items()
+        }
+        return RowType(properties=properties)
+
+    @converter_class.convert.register
+    def convert_row(self, jsontype: RowType) -> pa.DataType:
+        (value_type,) = {self.convert(v) for v in jsontype.properties.values()}
+        return pa.list_(value_type, len(jsontype.properties))
+
+    monkeypatch.setitem(json_schema_root_type_map, "row", RowType)
+    point = {
+        "type": "row",
+        "properties": {"x": {"type": "number"}, "y": {"type": "number"}},
+    }
+    jsonschema = {"type": "object", "properties": {"point": point}}
+    parsed = JSONSchemaParser.parse(jsonschema)
+    assert parsed.properties["point"] == RowType(
+        properties={"x": NumberType(), "y": NumberType()}
+    )
+    arrow_schema = ArrowSchema.from_json_type(parsed, converter=converter_class())
+    assert arrow_schema.field("point").type == pa.list_(pa.float64(), 2)
+    assert arrow_schema == ArrowSchema.from_json_type(
+        parsed, converter=converter_class(cache_size=16)
+    )
+
+
+def test_resolve_class_defined_after_table_is_built():
+    """Test classes missing from a table are added to a copy of it."""
+    table = DispatchTable(parse_module.parse_type)
+    handlers = table.handlers()
+
+    @dataclass(frozen=True, slots=True)
+    class LateType(NumberType):
+        pass
+
+    assert table.resolve(LateType) is parse_module.parse_number
+    assert LateType not in handlers
+    assert table.handlers()[LateType] is parse_module.parse_number
+    assert table.resolve(LateType) is parse_module.parse_number
+
+
+def test_extensions_are_not_registered_globally():
+    """Test the handlers registered by the tests above do not outlive them."""
+    assert parse_module.parse_type.dispatch(MoneyType) is parse_module.parse_number
+    assert parse_module.parse_type.dispatch(RowType) is parse_module.parse_object
+    converters = _dispatch_table(JSONToArrowTypeMap).handlers()
+    assert converters[MoneyType] is converters[NumberType]
+    assert converters[RowType] is converters[ObjectType]
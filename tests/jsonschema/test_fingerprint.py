@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+
+from schematools.jsonschema import JSONSchemaParser
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+    "required": ["id"],
+}
+# The fingerprint of SCHEMA, which must not change between releases.
+SCHEMA_FINGERPRINT = "668a84e9ceb495a4f98a5f37b0d6f01292ac332b02d72bd9eae365407f19ad0c"
+
+
+def test_fingerprint_is_stable():
+    """Test a fingerprint does not depend on the release or the process."""
+    assert JSONSchemaParser.parse(SCHEMA).fingerprint() == SCHEMA_FINGERPRINT
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from schematools.jsonschema import JSONSchemaParser\n"
+            f"print(JSONSchemaParser.parse({SCHEMA!r}).fingerprint())",
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONHASHSEED": "1"},
+        text=True,
+    )
+    assert result.stdout.strip() == SCHEMA_FINGERPRINT
+
+
+def test_fingerprint_ignores_order():
+    """Test the order of properties and required does not matter."""
+    reordered = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "id": {"type": "integer"}},
+        "required": ["id"],
+    }
+    assert JSONSchemaParser.parse(reordered).fingerprint() == SCHEMA_FINGERPRINT
+    both = JSONSchemaParser.parse({**SCHEMA, "required": ["id", "name"]})
+    both_reordered = JSONSchemaParser.parse({**SCHEMA, "required": ["name", "id"]})
+    assert both.fingerprint() == both_reordered.fingerprint()
+
+
+def test_fingerprint_differs():
+    """Test any change of structure or annotations changes the fingerprint."""
+    changed = [
+        {**SCHEMA, "required": []},
+        {**SCHEMA, "description": "A user."},
+        {
+            **SCHEMA,
+            "properties": {
+                "id": {"type": "number"},
+                "name": SCHEMA["properties"]["name"],
+            },
+        },
+        {
+            **SCHEMA,
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string", "format": "email"},
+            },
+        },
+    ]
+    fingerprints = {JSONSchemaParser.parse(schema).fingerprint() for schema in changed}
+    assert len(fingerprints) == len(changed)
+    assert SCHEMA_FINGERPRINT not in fingerprints
+
+
+def test_fingerprint_cached():
+    """Test nested types are fingerprinted once, along with their parent."""
+    parsed = JSONSchemaParser.parse(SCHEMA)
+    parsed.fingerprint()
+    assert all(p._fingerprint is not None for p in parsed.properties.values())
+    assert parsed.fingerprint() is parsed.fingerprint()
+
+
+def test_fingerprint_deep():
+    """Test types nested deeper than the recursion limit are fingerprinted."""
+    schema = {"type": "string"}
+    for _ in range(sys.getrecursionlimit() * 2):
+        schema = {"type": "array", "items": schema}
+    parsed = JSONSchemaParser.parse(schema, copy=False)
+    assert len(parsed.fingerprint()) == 64
@@ -1,5 +1,5 @@
 from schematools.jsonschema import JSONSchemaParser
-from schematools.jsonschema.flatten import flatten
+from schematools.jsonschema.flatten import RecordFlattener, flatten
 
 
 def test_flatten():
@@ -118,3 +118,75 @@ def test_flatten_max_depth():
         }
     )
     assert flattened == expected
+
+
+def test_record_flattener():
+    """Test records are flattened like their schema."""
+    schema = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "address": {
+                    "type": "object",
+                    "properties": {
+                        "number": {"type": "integer"},
+                        "city": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "zip": {"type": "string"},
+                            },
+                        },
+                    },
+                },
+            },
+        }
+    )
+    flattener = RecordFlattener(schema)
+    assert flattener(
+        {"name": "a", "address": {"number": 1, "city": {"zip": "123"}}, "extra": 1}
+    ) == {
+        "name": "a",
+        "address__number": 1,
+        "address__city__name": None,
+        "address__city__zip": "123",
+    }
+    assert list(flattener.flatten_records([{"address": None}])) == [
+        {
+            "name": None,
+            "address__number": None,
+            "address__city__name": None,
+            "address__city__zip": None,
+        }
+    ]
+
+
+def test_record_flattener_matches_schema():
+    """Test flattened record keys match the flattened schema."""
+    schema = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "properties": {
+                "a": {
+                    "type": "object",
+                    "properties": {
+                        "b": {
+                            "type": "object",
+                            "properties": {
+                                "c": {
+                                    "type": "object",
+                                    "properties": {"d": {"type": "string"}},
+                                }
+                            },
+                        },
+                    },
+                },
+            },
+        }
+    )
+    for max_depth in range(5):
+        flattener = RecordFlattener(schema, max_depth=max_depth, separator=".")
+        record = flattener({"a": {"b": {"c": {"d": "x"}}}})
+        flattened = flatten(schema, max_depth=max_depth, separator=".")
+        assert list(record) == list(flattened.properties)
@@ -0,0 +1,152 @@
+import pytest
+
+from schematools.jsonschema import (
+    ArrayType,
+    BaseJSONType,
+    DateTimeType,
+    DateType,
+    IntegerType,
+    IPv4Type,
+    JSONSchemaParser,
+    NumberType,
+    ObjectType,
+    SchemaInference,
+    StringType,
+    UUIDType,
+    infer_schema,
+)
+
+RECORDS = [
+    {
+        "id": i,
+        "score": i / 2 if i % 2 else i,
+        "created_at": f"2018-11-{i % 28 + 1:02d}T20:20:39+00:00",
+        "ip": f"10.0.{i % 7}.{i % 255}",
+        "user": {"name": f"user {i}", "birthday": "1990-01-31"},
+        "tags": ["a"] * (i % 3),
+        "note": None if i % 4 else "x",
+        **({"email": f"u{i}@example.com"} if i % 5 else {}),
+    }
+    for i in range(100)
+]
+
+
+def test_infer_schema():
+    """Test types, formats, nullable and required properties are inferred."""
+    expected = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "score": {"type": "number"},
+                "created_at": {"type": "string", "format": "date-time"},
+                "ip": {"type": "string", "format": "ipv4"},
+                "user": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "birthday": {"type": "string", "format": "date"},
+                    },
+                    "required": ["name", "birthday"],
+                },
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "note": {"type": ["string", "null"]},
+                "email": {"type": "string", "format": "email"},
+            },
+            "required": ["id", "score", "created_at", "ip", "user", "tags", "note"],
+        }
+    )
+    inferred = infer_schema(RECORDS)
+    assert inferred == expected
+    assert isinstance(inferred.properties["created_at"], DateTimeType)
+    assert isinstance(inferred.properties["user"].properties["birthday"], DateType)
+    assert isinstance(inferred.properties["ip"], IPv4Type)
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([1, 2], IntegerType()),
+        ([1, 2.5], NumberType()),
+        (["123e4567-e89b-12d3-a456-426614174000"], UUIDType()),
+        (["2018-11-13", "not a date"], StringType()),
+        (["2018-02-30"], StringType()),
+        (["256.0.0.1"], StringType()),
+        ([[1], []], ArrayType(items=IntegerType())),
+        ([[]], ArrayType()),
+        ([1, "a"], BaseJSONType(type=["string", "integer"])),
+        ([None, 1, "a"], BaseJSONType(type=["string", "integer", "null"])),
+        ([], BaseJSONType()),
+    ],
+)
+def test_infer_values(values, expected):
+    """Test the types inferred from a few values."""
+    assert infer_schema(values) == expected
+
+
+def test_merge():
+    """Test merged inferences of parts of a stream equal that of the stream."""
+    parts = []
+    for start in range(0, len(RECORDS), 30):
+        inference = SchemaInference()
+        inference.update(RECORDS[start : start + 30])
+        parts.append(inference)
+    merged = SchemaInference()
+    for part in reversed(parts):
+        merged.merge(part)
+    assert merged.count == len(RECORDS)
+    assert merged.to_type() == infer_schema(RECORDS)
+
+
+def test_merge_formats():
+    """Test a format is kept by a merge only if both parts had it."""
+    dates, texts = SchemaInference(), SchemaInference()
+    dates.update(["2018-11-13"])
+    texts.update(["text"])
+    assert SchemaInference().merge(dates).to_type() == DateType()
+    assert dates.merge(texts).to_type() == StringType()
+
+
+def test_max_properties():
+    """Test objects with too many distinct properties are left open."""
+    inference = SchemaInference(max_properties=10)
+    inference.update({f"key{i}": i} for i in range(100))
+    inferred = inference.to_type()
+    assert isinstance(inferred, ObjectType)
+    assert len(inferred.properties) == 10
+    assert inferred.additionalProperties is True
+    assert inferred.required is None
+
+
+def test_sample():
+    """Test a sampled inference keeps a bounded, reproducible sample."""
+    records = [{"id": i} for i in range(10_000)]
+    inference = SchemaInference(sample_size=100, seed=1)
+    inference.update(records)
+    assert inference.count == len(records)
+    assert len(inference._sample) == 100
+    # a uniform sample of the stream, not its first records
+    assert max(r["id"] for r in inference._sample) > 5_000
+    again = SchemaInference(sample_size=100, seed=1)
+    again.update(records)
+    assert again._sample == inference._sample
+    assert inference.to_type() == infer_schema(records)
+
+
+def test_merge_samples():
+    """Test merged samples draw from each part in proportion to its size."""
+    small, large = SchemaInference(100, seed=1), SchemaInference(100, seed=2)
+    small.update({"part": "small"} for _ in range(1_000))
+    large.update({"part": "large"} for _ in range(9_000))
+    small.merge(large)
+    assert small.count == 10_000
+    assert len(small._sample) == 100
+    assert 70 < sum(r["part"] == "large" for r in small._sample) < 100
+    with pytest.raises(ValueError, match="sample sizes"):
+        small.merge(SchemaInference())
+
+
+def test_not_json():
+    """Test values that JSON cannot hold are an error."""
+    with pytest.raises(TypeError, match="set"):
+        infer_schema([{"tags": {1, 2}}])
@@ -0,0 +1,71 @@
+import pytest
+
+from schematools.jsonschema import (
+    DateTimeType,
+    InternTable,
+    JSONSchemaParser,
+    ObjectType,
+    StringType,
+    compile_validator,
+)
+
+TIMESTAMP = {"type": ["string", "null"], "format": "date-time"}
+ADDRESS = {
+    "type": "object",
+    "properties": {"street": {"type": "string"}, "city": {"type": "string"}},
+}
+
+
+def test_structural_hash():
+    """Test structurally equal types hash equally."""
+    first = JSONSchemaParser.parse(ADDRESS)
+    second = JSONSchemaParser.parse(
+        {"type": "object", "properties": dict(reversed(ADDRESS["properties"].items()))}
+    )
+    assert first is not second
+    assert first == second
+    assert hash(first) == hash(second)
+    assert StringType(enum=["a"]) != StringType(enum=["b"])
+    assert StringType() != DateTimeType()
+    assert len({first, second, JSONSchemaParser.parse({"type": "object"})}) == 2
+
+
+def test_nullable_type():
+    """Test nullable type lists parse as their non-null type."""
+    timestamp = JSONSchemaParser.parse(TIMESTAMP)
+    assert isinstance(timestamp, DateTimeType)
+    assert timestamp.type == ["string", "null"]
+    validate = compile_validator(timestamp)
+    validate(None)
+    validate("2024-01-01T00:00:00Z")
+    with pytest.raises(NotImplementedError):
+        JSONSchemaParser.parse({"type": ["string", "integer"]})
+
+
+def test_intern_table():
+    """Test identical sub-schemas are parsed into one instance."""
+    table = InternTable()
+    schema = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "properties": {
+                "created_at": TIMESTAMP,
+                "updated_at": TIMESTAMP,
+                "home": ADDRESS,
+                "work": ADDRESS,
+            },
+        },
+        intern_table=table,
+    )
+    properties = schema.properties
+    assert properties["created_at"] is properties["updated_at"]
+    assert properties["home"] is properties["work"]
+    assert (
+        properties["home"].properties["street"] is properties["home"].properties["city"]
+    )
+    other = JSONSchemaParser.parse(
+        {"type": "object", "properties": {"address": ADDRESS}}, intern_table=table
+    )
+    assert other.properties["address"] is properties["home"]
+    assert isinstance(other, ObjectType)
+    assert table.hits > 0
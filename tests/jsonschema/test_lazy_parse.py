@@ -0,0 +1,126 @@
+import pickle
+
+import pytest
+
+from schematools.apache_arrow import ArrowSchema
+from schematools.jsonschema import (
+    IntegerType,
+    JSONSchemaParser,
+    LazyProperties,
+    RecursiveRefError,
+    StringType,
+    flatten,
+)
+
+SCHEMA = {
+    "type": "object",
+    "$defs": {"id": {"type": "integer"}},
+    "properties": {
+        "id": {"$ref": "#/$defs/id"},
+        "address": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string"},
+                "zip": {"type": "string"},
+            },
+        },
+        # parsing this property fails, so it must only be parsed on access
+        "broken": {"type": ["string", "integer"]},
+    },
+}
+
+
+def test_lazy_properties_parse_on_access():
+    """Test properties are parsed only when read."""
+    schema = JSONSchemaParser.parse(SCHEMA, lazy=True)
+    assert isinstance(schema.properties, LazyProperties)
+    assert list(schema.properties) == ["id", "address", "broken"]
+    assert schema.properties["id"] == IntegerType()
+    assert schema.properties["id"] is schema.properties["id"]
+    assert schema.properties["address"].properties["city"].type == "string"
+    with pytest.raises(NotImplementedError):
+        schema.properties["broken"]
+
+
+def test_lazy_parse_is_compatible():
+    """Test lazily parsed schemas work like eagerly parsed ones."""
+    jsonschema = {**SCHEMA, "properties": dict(SCHEMA["properties"])}
+    del jsonschema["properties"]["broken"]
+    lazy = JSONSchemaParser.parse(jsonschema, lazy=True)
+    eager = JSONSchemaParser.parse(jsonschema)
+    assert lazy == eager
+    assert hash(lazy) == hash(eager)
+    assert flatten(lazy) == flatten(eager)
+    assert ArrowSchema.from_json_type(lazy) == ArrowSchema.from_json_type(eager)
+    assert pickle.loads(pickle.dumps(lazy)) == eager
+
+
+class Default:
+    """A default value that counts how many times it is copied."""
+
+    copies = 0
+
+    def __deepcopy__(self, memo: dict) -> "Default":
+        Default.copies += 1
+        return Default()
+
+
+def test_lazy_parse_copies_properties_on_read(monkeypatch):
+    """Test only the properties that are read are copied from the input."""
+    monkeypatch.setattr(Default, "copies", 0)
+    jsonschema = {
+        "type": "object",
+        "properties": {
+            f"p{i}": {"type": "object", "default": Default()} for i in range(100)
+        },
+    }
+    schema = JSONSchemaParser.parse(jsonschema, lazy=True)
+    assert Default.copies == 0
+    read = schema.properties["p1"]
+    assert Default.copies == 1
+    assert read.default is not jsonschema["properties"]["p1"]["default"]
+    # properties read are not affected by later changes to the input
+    jsonschema["properties"]["p1"]["description"] = "changed"
+    assert schema.properties["p1"].description is None
+
+
+def test_lazy_recursive_ref():
+    """Test recursive references raise when read, as they do when parsed eagerly."""
+    schema = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "$defs": {
+                "node": {
+                    "type": "object",
+                    "properties": {"next": {"$ref": "#/$defs/node"}},
+                },
+                "a": {"type": "object", "properties": {"b": {"$ref": "#/$defs/b"}}},
+                "b": {
+                    "type": "object",
+                    "properties": {
+                        "a": {"$ref": "#/$defs/a"},
+                        "name": {"$ref": "#/$defs/name"},
+                    },
+                },
+                "name": {"type": "string"},
+            },
+            "properties": {
+                "head": {"$ref": "#/$defs/node"},
+                "a": {"$ref": "#/$defs/a"},
+                "b": {"$ref": "#/$defs/b"},
+                "self": {"$ref": "#"},
+                "name": {"$ref": "#/$defs/name"},
+            },
+        },
+        lazy=True,
+    )
+    with pytest.raises(RecursiveRefError, match="node -> #/\\$defs/node"):
+        schema.properties["head"]
+    # a cycle is found whichever of its references is read first
+    with pytest.raises(RecursiveRefError):
+        schema.properties["b"]
+    with pytest.raises(RecursiveRefError):
+        schema.properties["a"]
+    with pytest.raises(RecursiveRefError):
+        schema.properties["self"]
+    assert schema.properties["name"] == StringType()
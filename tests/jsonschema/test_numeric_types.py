@@ -13,3 +13,18 @@ def test_integer_type():
     integer_type = JSONSchemaParser.parse({"type": "integer"})
     assert isinstance(integer_type, IntegerType)
     assert integer_type == IntegerType()
+
+
+def test_bounds():
+    """Test draft 4 exclusive bounds are returned in the later numeric form."""
+    assert NumberType(minimum=0, maximum=10).bounds() == (0, None, 10, None)
+    assert NumberType(
+        minimum=0, maximum=10, exclusiveMinimum=True, exclusiveMaximum=False
+    ).bounds() == (None, 0, 10, None)
+    assert IntegerType(exclusiveMinimum=1, exclusiveMaximum=5).bounds() == (
+        None,
+        1,
+        None,
+        5,
+    )
+    assert NumberType(exclusiveMaximum=True).bounds() == (None, None, None, None)
@@ -0,0 +1,100 @@
+import json
+
+from schematools.apache_arrow import ArrowSchema
+from schematools.jsonschema import (
+    InternTable,
+    JSONSchemaParser,
+    ParseCache,
+    jsonschema_fingerprint,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "integer"},
+    },
+}
+
+
+def test_fingerprint_is_canonical():
+    """Test fingerprints ignore key order and input form."""
+    reordered = {"properties": dict(reversed(SCHEMA["properties"].items()))}
+    reordered["type"] = "object"
+    assert jsonschema_fingerprint(SCHEMA) == jsonschema_fingerprint(reordered)
+    assert jsonschema_fingerprint(SCHEMA) == jsonschema_fingerprint(
+        json.dumps(SCHEMA, indent=2)
+    )
+    assert jsonschema_fingerprint(SCHEMA) != jsonschema_fingerprint({"type": "object"})
+
+
+def test_parse_cache_hits():
+    """Test repeated parses return the cached instance."""
+    cache = ParseCache()
+    first = JSONSchemaParser.parse(SCHEMA, cache=cache)
+    second = JSONSchemaParser.parse(json.dumps(SCHEMA), cache=cache)
+    assert first is second
+    assert first == JSONSchemaParser.parse(SCHEMA)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_parse_cache_eviction():
+    """Test least recently used entries are evicted."""
+    cache = ParseCache(maxsize=2)
+    string_type = JSONSchemaParser.parse({"type": "string"}, cache=cache)
+    JSONSchemaParser.parse({"type": "integer"}, cache=cache)
+    JSONSchemaParser.parse({"type": "string"}, cache=cache)
+    JSONSchemaParser.parse({"type": "number"}, cache=cache)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert JSONSchemaParser.parse({"type": "string"}, cache=cache) is string_type
+    assert cache.info() == {
+        "hits": 2,
+        "misses": 3,
+        "evictions": 1,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+
+def test_arrow_schema_cache():
+    """Test Arrow schema conversion goes through the cache."""
+    cache = ParseCache()
+    first = ArrowSchema.from_jsonschema(SCHEMA, cache=cache)
+    second = ArrowSchema.from_jsonschema(SCHEMA, cache=cache)
+    assert first is second
+    assert first == ArrowSchema.from_jsonschema(SCHEMA)
+
+
+def test_parse_cache_keeps_intern_tables_apart():
+    """Test schemas parsed with an intern table are cached for that table only."""
+    cache, table = ParseCache(), InternTable()
+    plain = JSONSchemaParser.parse(SCHEMA, cache=cache)
+    interned = JSONSchemaParser.parse(SCHEMA, cache=cache, intern_table=table)
+    assert interned is not plain
+    assert interned.properties["name"] is table.intern(plain.properties["name"])
+    assert JSONSchemaParser.parse(SCHEMA, cache=cache, intern_table=table) is interned
+    assert (
+        JSONSchemaParser.parse(SCHEMA, cache=cache, intern_table=InternTable())
+        is not interned
+    )
+
+
+def test_arrow_schema_cache_decodes_once(monkeypatch):
+    """Test a JSON string is decoded and fingerprinted once per conversion."""
+    calls = {"loads": 0, "dumps": 0}
+    loads, dumps = json.loads, json.dumps
+
+    def counted(name, function):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(json, "loads", counted("loads", loads))
+    monkeypatch.setattr(json, "dumps", counted("dumps", dumps))
+    cache = ParseCache()
+    ArrowSchema.from_jsonschema(dumps(SCHEMA), cache=cache)
+    assert calls == {"loads": 1, "dumps": 1}
+    assert len(cache) == 2
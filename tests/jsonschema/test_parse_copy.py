@@ -0,0 +1,39 @@
+import copy
+
+import pytest
+
+from schematools.jsonschema import JSONSchemaParser
+
+SCHEMA = {
+    "$id": "https://example.com/person.schema.json",
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "$comment": "Full name"},
+        "status": {"type": "string", "enum": ["active", "inactive"]},
+        "tags": {"type": "array", "items": {"type": "string", "$id": "tag"}},
+    },
+}
+
+
+@pytest.mark.parametrize("copy_input", [True, False])
+def test_parse_does_not_mutate_input(copy_input):
+    """Test parsing leaves the input schema untouched."""
+    jsonschema = copy.deepcopy(SCHEMA)
+    parsed = JSONSchemaParser.parse(jsonschema, copy=copy_input)
+    assert jsonschema == SCHEMA
+    assert parsed.id == SCHEMA["$id"]
+    assert parsed.properties["name"].comment == "Full name"
+    assert parsed.properties["tags"].items.id == "tag"
+
+
+def test_parse_copy_modes_are_equal():
+    """Test copy-free parsing gives the same result."""
+    assert JSONSchemaParser.parse(SCHEMA, copy=False) == JSONSchemaParser.parse(SCHEMA)
+
+
+def test_parse_copy_free_shares_values():
+    """Test copy-free parsing shares values with the input."""
+    enum = SCHEMA["properties"]["status"]["enum"]
+    assert JSONSchemaParser.parse(SCHEMA, copy=False).properties["status"].enum is enum
+    assert JSONSchemaParser.parse(SCHEMA).properties["status"].enum is not enum
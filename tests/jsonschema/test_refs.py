@@ -0,0 +1,172 @@
+import threading
+
+import pytest
+
+from schematools.jsonschema import (
+    ArrayType,
+    JSONSchemaParser,
+    ObjectType,
+    RecursiveRefError,
+    RefResolutionError,
+    RefResolver,
+    StringType,
+    compile_validator,
+)
+
+ADDRESS = {
+    "type": "object",
+    "properties": {"street": {"type": "string"}, "city": {"type": "string"}},
+}
+
+
+def test_defs_ref():
+    """Test $defs references are parsed once and shared."""
+    schema = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "$defs": {"address": ADDRESS},
+            "properties": {
+                "home": {"$ref": "#/$defs/address"},
+                "work": {"$ref": "#/$defs/address"},
+                "previous": {
+                    "type": "array",
+                    "items": {"$ref": "#/$defs/address"},
+                },
+            },
+        }
+    )
+    home = schema.properties["home"]
+    assert home == JSONSchemaParser.parse(ADDRESS)
+    assert schema.properties["work"] is home
+    assert schema.properties["previous"].items is home
+
+
+def test_definitions_ref():
+    """Test draft 7 definitions and nested references."""
+    schema = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "definitions": {
+                "name": {"type": "string"},
+                "person": {
+                    "type": "object",
+                    "properties": {"name": {"$ref": "#/definitions/name"}},
+                },
+            },
+            "properties": {"owner": {"$ref": "#/definitions/person"}},
+        }
+    )
+    assert isinstance(schema.properties["owner"], ObjectType)
+    assert schema.properties["owner"].properties["name"] == StringType()
+
+
+def test_ref_with_annotations():
+    """Test annotations next to a $ref apply to that use only."""
+    schema = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "$defs": {"name": {"type": "string"}},
+            "properties": {
+                "first": {"$ref": "#/$defs/name", "description": "First name"},
+                "last": {"$ref": "#/$defs/name"},
+            },
+        }
+    )
+    assert schema.properties["first"] == StringType(description="First name")
+    assert schema.properties["last"] == StringType()
+
+
+def test_ref_with_structural_keywords():
+    """Test keywords next to a $ref other than annotations are ignored."""
+    schema = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "$defs": {"address": ADDRESS},
+            "properties": {
+                "home": {
+                    "$ref": "#/$defs/address",
+                    "title": "Home",
+                    "properties": {"zip": {"type": "string"}},
+                    "required": ["zip"],
+                },
+            },
+        }
+    )
+    home = schema.properties["home"]
+    assert home == JSONSchemaParser.parse({**ADDRESS, "title": "Home"})
+    assert all(isinstance(v, StringType) for v in home.properties.values())
+    compile_validator(schema)({"home": {"street": "x"}})
+    assert schema.fingerprint()
+
+
+def test_recursive_ref():
+    """Test recursive references are detected."""
+    with pytest.raises(RecursiveRefError):
+        JSONSchemaParser.parse(
+            {
+                "type": "object",
+                "$defs": {
+                    "node": {
+                        "type": "object",
+                        "properties": {"next": {"$ref": "#/$defs/node"}},
+                    }
+                },
+                "properties": {"head": {"$ref": "#/$defs/node"}},
+            }
+        )
+    with pytest.raises(RecursiveRefError):
+        JSONSchemaParser.parse(
+            {"type": "object", "properties": {"self": {"$ref": "#"}}}
+        )
+
+
+def test_ref_resolved_in_two_threads(monkeypatch):
+    """Test a reference being resolved in one thread is not recursive in another."""
+    schema = JSONSchemaParser.parse(
+        {
+            "type": "object",
+            "$defs": {
+                "tags": {"type": "array", "items": {"$ref": "#/$defs/tag"}},
+                "tag": {"type": "string"},
+            },
+            "properties": {
+                "a": {"$ref": "#/$defs/tags"},
+                "b": {"$ref": "#/$defs/tags"},
+            },
+        },
+        lazy=True,
+    )
+    lookup = RefResolver._lookup
+    blocked, resume = threading.Event(), threading.Event()
+
+    def block_once(self, ref):
+        # hold the first thread while it is resolving #/$defs/tags
+        if ref == "#/$defs/tag" and not blocked.is_set():
+            blocked.set()
+            resume.wait(5)
+        return lookup(self, ref)
+
+    monkeypatch.setattr(RefResolver, "_lookup", block_once)
+    thread = threading.Thread(target=lambda: schema.properties["a"])
+    thread.start()
+    try:
+        assert blocked.wait(5)
+        assert schema.properties["b"] == ArrayType(items=StringType())
+    finally:
+        resume.set()
+        thread.join()
+
+
+def test_unresolvable_ref():
+    """Test missing and remote references raise."""
+    with pytest.raises(RefResolutionError):
+        JSONSchemaParser.parse(
+            {"type": "object", "properties": {"a": {"$ref": "#/$defs/missing"}}}
+        )
+    with pytest.raises(RefResolutionError):
+        JSONSchemaParser.parse(
+            {
+                "type": "object",
+                "properties": {"a": {"$ref": "https://example.com/a.json"}},
+            }
+        )
@@ -0,0 +1,50 @@
+import pickle
+
+import pytest
+
+from schematools.jsonschema import (
+    ArrayType,
+    BaseJSONType,
+    BooleanType,
+    DateTimeType,
+    IntegerType,
+    JSONSchemaParser,
+    NullType,
+    NumberType,
+    ObjectType,
+    StringType,
+    UUIDType,
+)
+
+
+@pytest.mark.parametrize(
+    "jsontype",
+    [
+        BaseJSONType,
+        ArrayType,
+        BooleanType,
+        IntegerType,
+        NullType,
+        NumberType,
+        ObjectType,
+        StringType,
+        DateTimeType,
+    ],
+)
+def test_types_have_no_instance_dict(jsontype):
+    """Test types store their fields in slots."""
+    assert not hasattr(jsontype(), "__dict__")
+
+
+def test_format_types_default_format():
+    """Test format types default to their own format."""
+    assert DateTimeType().format == "date-time"
+    assert UUIDType() == JSONSchemaParser.parse({"type": "string", "format": "uuid"})
+
+
+def test_slotted_types_pickle():
+    """Test slotted types survive pickling."""
+    schema = JSONSchemaParser.parse(
+        {"type": "object", "properties": {"at": {"type": "string", "format": "date"}}}
+    )
+    assert pickle.loads(pickle.dumps(schema)) == schema
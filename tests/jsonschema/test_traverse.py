@@ -0,0 +1,86 @@
+import sys
+
+import pyarrow as pa
+
+from schematools.apache_arrow import ArrowSchema, JSONToArrowTypeMap
+from schematools.jsonschema import (
+    ArrayType,
+    InternTable,
+    JSONSchemaParser,
+    ObjectType,
+    flatten,
+)
+from schematools.jsonschema.traverse import transform
+
+# deeper than the recursion limit allows for any recursive implementation
+DEPTH = sys.getrecursionlimit() * 2
+
+
+def deep_schema(depth: int = DEPTH) -> dict:
+    """Schema of objects nested `depth` levels deep, every other one in an array."""
+    schema = {"type": "string"}
+    for i in range(depth):
+        child = {"type": "array", "items": schema} if i % 2 else schema
+        schema = {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}, "child": child},
+        }
+    return schema
+
+
+def test_transform_builds_children_first():
+    """Test nodes are built after their children, with results keyed per child."""
+    tree = ("a", [("b", []), ("c", [("d", [])])])
+    built = []
+
+    def build(node, children):
+        built.append(node[0])
+        return node[0] + "".join(children[i] for i in sorted(children))
+
+    result = transform(tree, lambda node: list(enumerate(node[1])), build)
+    assert result == "abcd"
+    assert built == ["b", "d", "c", "a"]
+
+
+def test_parse_deep_schema():
+    """Test parsing a schema nested deeper than the recursion limit."""
+    schema = JSONSchemaParser.parse(deep_schema(), copy=False)
+    depth = 0
+    while isinstance(schema, ObjectType):
+        schema = schema.properties["child"]
+        if isinstance(schema, ArrayType):
+            schema = schema.items
+        depth += 1
+    assert depth == DEPTH
+    assert schema.type == "string"
+
+
+def test_parse_deep_schema_interned():
+    """Test interning a deep schema hashes each node without recursion."""
+    intern_table = InternTable()
+    JSONSchemaParser.parse(deep_schema(), copy=False, intern_table=intern_table)
+    assert len(intern_table) == DEPTH * 1.5 + 2
+
+
+def test_flatten_deep_schema():
+    """Test flattening a schema nested deeper than the recursion limit."""
+    depth = DEPTH // 2
+    schema = {"type": "string"}
+    for _ in range(depth):
+        schema = {"type": "object", "properties": {"child": schema}}
+    flattened = flatten(JSONSchemaParser.parse(schema), max_depth=DEPTH)
+    assert list(flattened.properties) == ["__".join(["child"] * depth)]
+
+
+def test_convert_tree_matches_convert():
+    """Test the stack-based conversion gives the same type as `convert`."""
+    jsontype = JSONSchemaParser.parse(deep_schema(20))
+    converter = JSONToArrowTypeMap()
+    assert converter.convert_tree(jsontype) == converter.convert(jsontype)
+
+
+def test_arrow_schema_deep():
+    """Test converting a schema nested deeper than the recursion limit."""
+    arrow_schema = ArrowSchema.from_json_type(JSONSchemaParser.parse(deep_schema()))
+    assert arrow_schema.names == ["id", "child"]
+    assert pa.types.is_list(arrow_schema.field("child").type)
@@ -0,0 +1,104 @@
+import pytest
+
+from schematools.jsonschema import (
+    BaseJSONType,
+    JSONSchemaParser,
+    ValidationError,
+    compile_validator,
+)
+
+SCHEMA = {
+    "type": "object",
+    "required": ["id"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "score": {"type": "number", "maximum": 10, "exclusiveMaximum": True},
+        "ratio": {"type": "number", "multipleOf": 0.5},
+        "email": {"type": "string", "pattern": "@", "maxLength": 10},
+        "status": {"type": "string", "enum": ["active", "inactive"]},
+        "kind": {"type": "string", "const": "user"},
+        "flag": {"type": "boolean"},
+        "tags": {
+            "type": "array",
+            "items": {"type": "string", "minLength": 1},
+            "maxItems": 2,
+            "uniqueItems": True,
+        },
+    },
+}
+
+
+@pytest.fixture
+def validate():
+    return compile_validator(JSONSchemaParser.parse(SCHEMA))
+
+
+def test_valid_record(validate):
+    """Test valid records pass."""
+    validate({"id": 1})
+    validate(
+        {
+            "id": 2.0,
+            "score": 9.9,
+            "ratio": 1.5,
+            "email": "a@b.c",
+            "status": "active",
+            "kind": "user",
+            "flag": False,
+            "tags": ["a", "b"],
+            "extra": None,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "record,path",
+    [
+        ({}, []),
+        ([], []),
+        ({"id": 0}, ["id"]),
+        ({"id": True}, ["id"]),
+        ({"id": 1.5}, ["id"]),
+        ({"id": 1, "score": 10}, ["score"]),
+        ({"id": 1, "ratio": 1.2}, ["ratio"]),
+        ({"id": 1, "email": "nope"}, ["email"]),
+        ({"id": 1, "email": "a@very.long"}, ["email"]),
+        ({"id": 1, "status": "banned"}, ["status"]),
+        ({"id": 1, "kind": "admin"}, ["kind"]),
+        ({"id": 1, "flag": 1}, ["flag"]),
+        ({"id": 1, "tags": ["a", "a"]}, ["tags"]),
+        ({"id": 1, "tags": ["a", "b", "c"]}, ["tags"]),
+        ({"id": 1, "tags": ["a", ""]}, ["tags", 1]),
+    ],
+)
+def test_invalid_record(validate, record, path):
+    """Test invalid records raise with the path of the violation."""
+    with pytest.raises(ValidationError) as excinfo:
+        validate(record)
+    assert excinfo.value.path == path
+
+
+def test_additional_properties():
+    """Test additionalProperties false rejects unknown keys."""
+    validate = compile_validator(
+        JSONSchemaParser.parse(
+            {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}},
+                "additionalProperties": False,
+            }
+        )
+    )
+    validate({"id": 1})
+    with pytest.raises(ValidationError):
+        validate({"id": 1, "name": "x"})
+
+
+def test_enum_distinguishes_booleans():
+    """Test enum membership does not treat True as 1."""
+    validate = compile_validator(
+        JSONSchemaParser.parse({"type": "integer", "enum": [1]})
+    )
+    validate(1)
+    with pytest.raises(ValidationError):
+        compile_validator(BaseJSONType(enum=[1]))(True)
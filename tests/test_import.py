@@ -0,0 +1,89 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Generous budget for importing the parser; pyarrow alone takes longer.
+IMPORT_BUDGET_US = 200_000
+
+HEAVY_MODULES = ("pyarrow", "jsonschema", "numpy", "pandas")
+
+
+def run_import(code: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter, with import times on stderr."""
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+def loaded_modules(code: str) -> set:
+    """Return the top-level modules loaded after running code."""
+    result = run_import(
+        f"{code}\nimport json, sys\n"
+        "print(json.dumps(sorted({m.split('.')[0] for m in sys.modules})))"
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def import_time_us(module: str) -> int:
+    """Return the cumulative time of importing a module, in microseconds."""
+    for line in run_import(f"import {module}").stderr.splitlines():
+        # "import time: <self> | <cumulative> | <indented module name>"
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} was not imported")
+
+
+def test_parser_imports_nothing_heavy():
+    """Test the parser and types import no heavy dependency."""
+    modules = loaded_modules(
+        "import schematools.jsonschema\n"
+        "schematools.jsonschema.JSONSchemaParser.parse({'type': 'string'})"
+    )
+    assert not modules.intersection(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize(
+    "module", ["schematools.jsonschema", "schematools.apache_arrow"]
+)
+def test_import_time(module):
+    """Test importing the parser or the Arrow package stays within budget."""
+    assert import_time_us(module) < IMPORT_BUDGET_US
+
+
+def test_arrow_loaded_on_first_use():
+    """Test pyarrow is only imported when an Arrow tool is first used."""
+    assert "pyarrow" not in loaded_modules("import schematools.apache_arrow")
+    assert "pyarrow" in loaded_modules(
+        "from schematools.apache_arrow import ArrowSchema"
+    )
+
+
+def test_arrow_without_pyarrow():
+    """Test using an Arrow tool without pyarrow says how to install it."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "sys.modules['pyarrow'] = None\n"
+            "from schematools.apache_arrow import ArrowSchema",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert "pip install py-schematools[arrow]" in result.stderr
+
+
+def test_unknown_arrow_attribute():
+    """Test a missing attribute of the lazy package raises AttributeError."""
+    import schematools.apache_arrow
+
+    with pytest.raises(AttributeError):
+        schematools.apache_arrow.missing
@@ -0,0 +1,75 @@
+from schematools import instrumentation
+from schematools.apache_arrow import ArrowSchema, JSONToArrowTypeMap
+from schematools.jsonschema import JSONSchemaParser, ParseCache
+
+SCHEMA = {
+    "type": "object",
+    "$defs": {"id": {"type": "integer"}},
+    "properties": {
+        "id": {"$ref": "#/$defs/id"},
+        "name": {"type": "string"},
+        "created_at": {"type": "string", "format": "date-time"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+def test_disabled_by_default():
+    """Test nothing is recorded unless instrumentation is turned on."""
+    assert instrumentation.active() is None
+    JSONSchemaParser.parse(SCHEMA)
+    with instrumentation.instrument() as stats:
+        pass
+    assert instrumentation.active() is None
+    assert stats.snapshot() == {"counters": {}, "timings": {}, "field_timings": {}}
+
+
+def test_parse_and_convert_counters():
+    """Test counters and timings of a cached parse and conversion."""
+    cache = ParseCache()
+    converter = JSONToArrowTypeMap(cache_size=16)
+    with instrumentation.instrument() as stats:
+        ArrowSchema.from_jsonschema(SCHEMA, cache=cache, converter=converter)
+        ArrowSchema.from_jsonschema(SCHEMA, cache=cache, converter=converter)
+    snapshot = stats.snapshot()
+    counters = snapshot["counters"]
+    assert counters["parse.calls"] == 1
+    assert counters["parse.refs"] == 1
+    assert counters["parse.nodes.StringType"] == 2
+    assert counters["parse.nodes.DateTimeType"] == 1
+    assert counters["parse.nodes.IntegerType"] == 1
+    assert counters["convert.calls"] == 1
+    assert counters["convert.nodes.StringType"] == 2
+    assert counters["convert.nodes.ArrayType"] == 1
+    # only objects and arrays are looked up in the conversion cache
+    assert counters["convert.cache.misses"] == 1
+    # arrow miss, jsonschema miss, then an arrow hit
+    assert counters["cache.misses"] == 2
+    assert counters["cache.hits"] == 1
+    assert set(snapshot["timings"]) == {
+        "parse",
+        "parse.copy",
+        "parse.handlers",
+        "convert",
+        "convert.fields",
+    }
+    assert list(snapshot["field_timings"]) == ["id", "name", "created_at", "tags"]
+
+
+def test_callback_and_enable():
+    """Test the callback receives each event while enabled."""
+    events = []
+    stats = instrumentation.enable(lambda *event: events.append(event))
+    try:
+        assert instrumentation.active() is stats
+        JSONSchemaParser.parse({"type": "integer"})
+    finally:
+        instrumentation.disable()
+    assert instrumentation.active() is None
+    assert ("count", "parse.calls", 1) in events
+    assert ("count", "parse.nodes.IntegerType", 1) in events
+    assert {name for kind, name, _ in events if kind == "time"} == {
+        "parse",
+        "parse.copy",
+        "parse.handlers",
+    }